@@ -1,12 +1,18 @@
 import argparse
+from pathlib import Path
+from typing import Optional
 
-from ludo.bots.greedy_bot import GreedyBot
+from apps.diagnostics import add_profiling_arguments, profiling_session
+from ludo.bots.base import Strategy
 from ludo.bots.human_bot import HumanBot
-from ludo.bots.random_bot import RandomBot
+from ludo.bots.registry import create_strategy
 from ludo.dice import Dice
+from ludo.events import ConsoleSink, MultiSink
 from ludo.game import Game
+from ludo.journal import GameJournal
 from ludo.persistence import load_game
 from ludo.player import Player
+from ludo.simulation import strategy_rng
 from ludo.utils.constants import PlayerColor
 
 
@@ -16,24 +22,70 @@ def main():
     p.add_argument("--players", nargs="+", default=["human", "random"])
     p.add_argument("--seed", type=int, default=None)
     p.add_argument("--load-game", type=str, default=None, help="Path to a saved game file to load.")
+    p.add_argument(
+        "--journal",
+        type=str,
+        default=None,
+        help="Journal every turn to this file; if it exists, recover the game from it first.",
+    )
+    add_profiling_arguments(p)
     args = p.parse_args()
 
-    if args.load_game:
-        print(f"Loading game from {args.load_game}...")
-        state = load_game(args.load_game)
+    with profiling_session(args.profile, args.trace_memory, args.profile_top):
+        run(args)
+
+
+def create_player_strategy(
+    role: str,
+    seed: Optional[int],
+    seat: int,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+) -> Strategy:
+    """
+    Creates the strategy for a player's role: a human at the console, or a
+    registered bot under the game's rules.
+
+    Raises:
+        ValueError: If the role is neither "human" nor a registered strategy.
+    """
+    if role == "human":
+        return HumanBot()
+    return create_strategy(role, strategy_rng(seed, seat), three_six_forfeit, use_blocking_rule)
+
+
+def run(args: argparse.Namespace):
+    """Sets up the game the arguments describe and plays it."""
+    journal: Optional[GameJournal] = None
+    if args.journal and Path(args.journal).exists():
+        print(f"Recovering game from journal {args.journal}...")
+        journal = GameJournal.resume(args.journal)
+    if args.load_game or journal is not None:
+        if journal is not None:
+            state = journal.state
+        else:
+            print(f"Loading game from {args.load_game}...")
+            state = load_game(args.load_game)
         dice = Dice(seed=state.dice_seed)
         players = state.players
-        strategies = []
-        for player in players:
-            if player.role == "human":
-                strategies.append(HumanBot())
-            elif player.role == "random":
-                strategies.append(RandomBot())
-            elif player.role == "greedy":
-                strategies.append(GreedyBot())
-            else:
-                raise ValueError(f"Unknown player role in saved game: {player.role}")
-        game = Game(players=players, strategies=strategies, dice=dice, state=state)
+        # A recovered game keeps the rules it was journaled under
+        three_six_forfeit = journal.three_six_forfeit if journal is not None else True
+        use_blocking_rule = journal.use_blocking_rule if journal is not None else True
+        strategies = [
+            create_player_strategy(
+                player.role, state.dice_seed, seat, three_six_forfeit, use_blocking_rule
+            )
+            for seat, player in enumerate(players)
+        ]
+        game = Game(
+            players=players,
+            strategies=strategies,
+            dice=dice,
+            state=state,
+            three_six_forfeit=three_six_forfeit,
+            use_blocking_rule=use_blocking_rule,
+            events=ConsoleSink(),
+        )
         print("Game loaded successfully.")
     else:
         dice = Dice(seed=args.seed)
@@ -49,18 +101,17 @@ def main():
             color = colors[i]
             player = Player(color=color, role=role)
             players.append(player)
+            strategies.append(create_player_strategy(role, args.seed, i))
+        game = Game(players=players, strategies=strategies, dice=dice, events=ConsoleSink())
 
-            if role == "human":
-                strategies.append(HumanBot())
-            elif role == "random":
-                strategies.append(RandomBot())
-            elif role == "greedy":
-                strategies.append(GreedyBot())
-            else:
-                raise ValueError(f"Unknown player role: {role}")
-        game = Game(players=players, strategies=strategies, dice=dice)
-
-    game.loop_cli()
+    if args.journal and journal is None:
+        journal = GameJournal(args.journal, game.state)
+    if journal is None:
+        game.loop_cli()
+        return
+    game.events = MultiSink(game.events, journal)
+    with journal:
+        game.loop_cli()
 
 
 if __name__ == "__main__":
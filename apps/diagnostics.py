@@ -0,0 +1,132 @@
+"""
+Command-line profiling shared by the entry points.
+
+`add_profiling_arguments` gives a parser the ``--profile``,
+``--trace-memory`` and ``--profile-top`` options. `profiling_session` wraps
+a run in `cProfile` and/or `tracemalloc` as those options ask. When the run
+ends, even through an exception or Ctrl-C, it writes the raw data to the
+given files and prints a short report to stderr:
+
+- ``--profile FILE``: cProfile stats, readable with `pstats` or snakeviz,
+  and the top functions by cumulative time
+- ``--trace-memory FILE``: a `tracemalloc` snapshot, readable with
+  `tracemalloc.Snapshot.load`, and the top allocation sites by size
+"""
+
+import argparse
+import cProfile
+import io
+import pstats
+import sys
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, TextIO
+
+DEFAULT_TOP = 20
+# Frames kept per allocation so sites are attributed to the calling code
+TRACE_FRAMES = 10
+# Noise left out of the allocation report
+_IGNORED_ALLOCATIONS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def add_profiling_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the --profile, --trace-memory and --profile-top options to a parser."""
+    group = parser.add_argument_group("profiling")
+    group.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="Run under cProfile and write the stats to FILE.",
+    )
+    group.add_argument(
+        "--trace-memory",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="Trace allocations with tracemalloc and write the snapshot to FILE.",
+    )
+    group.add_argument(
+        "--profile-top",
+        type=int,
+        default=DEFAULT_TOP,
+        metavar="N",
+        help=f"Functions and allocation sites to report (default {DEFAULT_TOP}).",
+    )
+
+
+def format_profile(profile: cProfile.Profile, top: int = DEFAULT_TOP) -> str:
+    """Formats the `top` functions of a profile by cumulative time."""
+    out = io.StringIO()
+    pstats.Stats(profile, stream=out).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return out.getvalue().strip("\n")
+
+
+def format_allocations(snapshot: tracemalloc.Snapshot, top: int = DEFAULT_TOP) -> str:
+    """Formats the `top` allocation sites of a snapshot by the memory they still hold."""
+    stats = snapshot.filter_traces(_IGNORED_ALLOCATIONS).statistics("lineno")
+    total = sum(stat.size for stat in stats)
+    lines = [f"Top {min(top, len(stats))} allocation sites, {total / 1024:.1f} KiB live in total:"]
+    for stat in stats[:top]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"  {stat.size / 1024:>10.1f} KiB {stat.count:>8} blocks  "
+            f"{frame.filename}:{frame.lineno}"
+        )
+    return "\n".join(lines)
+
+
+@contextmanager
+def profiling_session(
+    profile_path: Optional[Path] = None,
+    memory_path: Optional[Path] = None,
+    top: int = DEFAULT_TOP,
+    stream: Optional[TextIO] = None,
+) -> Iterator[None]:
+    """
+    Profiles the enclosed block with cProfile and/or tracemalloc.
+
+    Does nothing if both paths are None.
+
+    Args:
+        profile_path: Where to write the cProfile stats, if given.
+        memory_path: Where to write the tracemalloc snapshot, if given.
+        top: The number of functions and allocation sites to report.
+        stream: Where to print the reports. Defaults to stderr.
+    """
+    profile = cProfile.Profile() if profile_path is not None else None
+    tracing = memory_path is not None and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start(TRACE_FRAMES)
+    peak = 0
+    if profile is not None:
+        profile.enable()
+    try:
+        yield
+    finally:
+        if profile is not None:
+            profile.disable()
+        snapshot = None
+        if memory_path is not None:
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            if tracing:
+                tracemalloc.stop()
+
+        out = stream if stream is not None else sys.stderr
+        if profile is not None and profile_path is not None:
+            profile.dump_stats(profile_path)
+            print(f"\nCPU profile written to {profile_path}", file=out)
+            print(format_profile(profile, top), file=out)
+        if snapshot is not None and memory_path is not None:
+            snapshot.dump(str(memory_path))
+            print(f"\nMemory snapshot written to {memory_path}", file=out)
+            print(f"Peak traced memory: {peak / 1024:.1f} KiB", file=out)
+            print(format_allocations(snapshot, top), file=out)
@@ -0,0 +1,89 @@
+import argparse
+import random
+
+from apps.diagnostics import add_profiling_arguments, profiling_session
+from ludo.bots.registry import STRATEGIES
+from ludo.simulation import DEFAULT_MAX_TURNS
+from ludo.tournament import TournamentResult, run_tournament
+
+
+def format_report(result: TournamentResult, seed: int, rotate_seats: bool = False) -> str:
+    """Formats a tournament result as a human-readable report."""
+    lines = [
+        f"Games played:    {result.games}",
+        f"Base seed:       {seed}",
+        f"Workers:         {result.workers}",
+        f"Elapsed:         {result.elapsed:.2f}s ({result.games_per_second:.1f} games/s)",
+        f"Average turns:   {result.average_turns:.1f}",
+        f"Unfinished:      {result.unfinished}",
+        "Win rates by seat (95% CI):",
+    ]
+    for seat, wins in enumerate(result.seat_wins):
+        label = f"Seat {seat}" if rotate_seats else f"Seat {seat} ({result.lineup[seat]})"
+        low, high = result.seat_confidence_interval(seat)
+        lines.append(
+            f"  {label}: {wins} wins ({result.seat_win_rate(seat):.1%}, " f"{low:.1%}-{high:.1%})"
+        )
+    lines.append("Win rates by strategy (95% CI):")
+    for name in sorted(result.strategy_games):
+        low, high = result.strategy_confidence_interval(name)
+        lines.append(
+            f"  {name}: {result.strategy_wins[name]}/{result.strategy_games[name]} "
+            f"({result.strategy_win_rate(name):.1%}, {low:.1%}-{high:.1%})"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """The main entry point for the headless simulator."""
+    p = argparse.ArgumentParser(description="Play bot-vs-bot Ludo games without a UI.")
+    p.add_argument("--players", nargs="+", default=["random", "greedy"], choices=sorted(STRATEGIES))
+    p.add_argument("--games", type=int, default=1000, help="Number of games to play.")
+    p.add_argument("--seed", type=int, default=None, help="Base seed; game i uses seed + i.")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes; 0 uses every CPU.",
+    )
+    p.add_argument("--chunk-size", type=int, default=None, help="Games per work unit.")
+    p.add_argument(
+        "--rotate-seats",
+        action="store_true",
+        help="Rotate the players through every seat from game to game.",
+    )
+    p.add_argument(
+        "--max-turns",
+        type=int,
+        default=DEFAULT_MAX_TURNS,
+        help="Abandon a game after this many rolls.",
+    )
+    p.add_argument("--no-blocking", action="store_true", help="Disable the blocking rule.")
+    p.add_argument(
+        "--no-three-six-forfeit",
+        action="store_true",
+        help="Disable the three consecutive sixes forfeit rule.",
+    )
+    add_profiling_arguments(p)
+    args = p.parse_args()
+    if (args.profile or args.trace_memory) and args.workers != 1:
+        p.error("--profile and --trace-memory only see this process; use --workers 1.")
+
+    seed = args.seed if args.seed is not None else random.randrange(2**31)
+    with profiling_session(args.profile, args.trace_memory, args.profile_top):
+        result = run_tournament(
+            args.players,
+            args.games,
+            seed=seed,
+            workers=args.workers or None,
+            chunk_size=args.chunk_size,
+            rotate_seats=args.rotate_seats,
+            max_turns=args.max_turns,
+            three_six_forfeit=not args.no_three_six_forfeit,
+            use_blocking_rule=not args.no_blocking,
+        )
+    print(format_report(result, seed, args.rotate_seats))
+
+
+if __name__ == "__main__":
+    main()
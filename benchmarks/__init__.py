@@ -0,0 +1,5 @@
+"""
+Micro and throughput benchmarks for the engine.
+
+Run the whole suite with ``python -m benchmarks``; see `benchmarks.runner`.
+"""
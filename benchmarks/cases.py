@@ -0,0 +1,180 @@
+"""
+The benchmark cases.
+
+Every case builds its inputs once, from fixed seeds, and returns the function
+to time together with the number of operations (calls, moves, games) one call
+of it performs, so that results are reported per operation.
+"""
+
+import copy
+import random
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from ludo.bots.greedy_bot import GreedyBot
+from ludo.compact import CompactState
+from ludo.move import AnyGameState, move_piece, undo_move
+from ludo.persistence import load_game, save_game
+from ludo.player import Player
+from ludo.rules import Rules
+from ludo.simulation import play_game
+from ludo.state import GameState
+from ludo.turn import next_player
+from ludo.utils.constants import PlayerColor
+
+POSITIONS_SEED = 2024
+NUM_POSITIONS = 500
+GAMES_PER_CALL = 20
+
+
+# The function to time and the units of work each call of it performs
+Timed = Tuple[Callable[[], object], int]
+
+
+@dataclass(frozen=True)
+class Case:
+    """A named benchmark whose `setup` builds the inputs and returns what to time."""
+
+    name: str
+    setup: Callable[[], Timed]
+
+
+def sample_positions(
+    seed: int = POSITIONS_SEED, count: int = NUM_POSITIONS
+) -> List[Tuple[GameState, int]]:
+    """
+    Plays seeded four-player games with random moves and snapshots `count`
+    (state, roll) pairs along the way, so that cases run on realistic
+    positions from every stage of a game.
+    """
+    rng = random.Random(seed)
+    positions: List[Tuple[GameState, int]] = []
+    while len(positions) < count:
+        state = GameState(players=[Player(color=color, role="random") for color in PlayerColor])
+        while not state.is_game_over and len(positions) < count:
+            roll = rng.randint(1, 6)
+            snapshot = copy.deepcopy(state)
+            snapshot.dice_roll = roll
+            positions.append((snapshot, roll))
+            legal_moves = Rules.get_legal_moves(state, roll)
+            if legal_moves:
+                move_piece(state, rng.choice(legal_moves)[0], roll)
+            if roll != 6 and not state.is_game_over:
+                next_player(state)
+    return positions
+
+
+def _legal_moves() -> Timed:
+    positions = sample_positions()
+
+    def run() -> None:
+        for state, roll in positions:
+            Rules.get_legal_moves(state, roll)
+
+    return run, len(positions)
+
+
+def _move_and_undo() -> Timed:
+    moves = []
+    for state, roll in sample_positions():
+        for piece, _ in Rules.get_legal_moves(state, roll):
+            moves.append((state, piece, roll))
+
+    def run() -> None:
+        for state, piece, roll in moves:
+            undo_move(state, move_piece(state, piece, roll))
+
+    return run, len(moves)
+
+
+def _greedy_choice() -> Timed:
+    bot = GreedyBot()
+    decisions = []
+    for state, roll in sample_positions():
+        legal_moves = Rules.get_legal_moves(state, roll)
+        if len(legal_moves) > 1:
+            decisions.append((legal_moves, state))
+
+    def run() -> None:
+        for legal_moves, state in decisions:
+            bot.choose_move(legal_moves, state)
+
+    return run, len(decisions)
+
+
+def _save_and_load(filename: str) -> Callable[[], Timed]:
+    def setup() -> Timed:
+        states = [state for state, _ in sample_positions()[::25]]
+        # Removed when the timed function, which holds it, is discarded
+        directory = tempfile.TemporaryDirectory(prefix="ludo-bench-")
+        path = Path(directory.name) / filename
+
+        def run() -> None:
+            assert directory
+            for state in states:
+                save_game(state, path)
+                load_game(path)
+
+        return run, len(states)
+
+    return setup
+
+
+def _random_turns(state: AnyGameState, rng: random.Random) -> int:
+    """Plays a game with random moves straight through the engine; returns its turns."""
+    turns = 0
+    while not state.is_game_over:
+        roll = rng.randint(1, 6)
+        legal_moves = Rules.get_legal_moves(state, roll)
+        if legal_moves:
+            move_piece(state, legal_moves[rng.randrange(len(legal_moves))][0], roll)
+        if roll != 6 and not state.is_game_over:
+            next_player(state)
+        turns += 1
+    return turns
+
+
+def _engine_turns(compact: bool) -> Callable[[], Timed]:
+    def setup() -> Timed:
+        def new_state() -> AnyGameState:
+            state = GameState(players=[Player(color=color, role="random") for color in PlayerColor])
+            return CompactState.from_game_state(state) if compact else state
+
+        def run() -> int:
+            return sum(
+                _random_turns(new_state(), random.Random(seed)) for seed in range(GAMES_PER_CALL)
+            )
+
+        return run, run()
+
+    return setup
+
+
+def _games(lineup: List[str]) -> Callable[[], Timed]:
+    def setup() -> Timed:
+        def run() -> None:
+            for seed in range(GAMES_PER_CALL):
+                play_game(lineup, seed=seed)
+
+        return run, GAMES_PER_CALL
+
+    return setup
+
+
+CASES: Dict[str, Case] = {
+    case.name: case
+    for case in [
+        Case("rules.get_legal_moves", _legal_moves),
+        Case("move.move_piece+undo_move", _move_and_undo),
+        Case("greedy.choose_move", _greedy_choice),
+        Case("persistence.save+load", _save_and_load("game.json")),
+        Case("persistence.binary_save+load", _save_and_load("game.ludo")),
+        Case("engine.random_x4_turns", _engine_turns(compact=False)),
+        Case("engine.random_x4_turns_compact", _engine_turns(compact=True)),
+        Case("game.random_vs_greedy", _games(["random", "greedy"])),
+        Case("game.greedy_vs_greedy", _games(["greedy", "greedy"])),
+        Case("game.random_x4", _games(["random"] * 4)),
+    ]
+}
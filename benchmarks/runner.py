@@ -0,0 +1,205 @@
+"""
+Runs the benchmark cases and compares them against a baseline.
+
+Usage::
+
+    python -m benchmarks                       # run, compare with baseline.json
+    python -m benchmarks --save-baseline       # run and record a new baseline
+    python -m benchmarks -k game --repeats 10  # only the full-game cases
+
+Each case is warmed up, then sampled `repeats` times, every sample lasting at
+least 0.1 s. The report gives the minimum, median, mean and standard deviation
+of the time per operation. When
+a baseline file exists, a case whose median is slower than the baseline's by
+more than the threshold is flagged as a regression and the run exits with
+status 1. Baselines are machine specific: record one on the machine that runs
+the comparisons.
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from benchmarks.cases import CASES, Case
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_REPEATS = 7
+DEFAULT_WARMUP = 2
+DEFAULT_THRESHOLD = 0.15
+# The shortest timing sample, in seconds
+MIN_SAMPLE_TIME = 0.1
+
+
+@dataclass
+class CaseResult:
+    """Timing statistics of one case, in seconds per operation."""
+
+    name: str
+    operations: int  # Operations per timing sample
+    repeats: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+
+    @property
+    def ops_per_second(self) -> float:
+        """Throughput at the median time."""
+        return 1.0 / self.median if self.median > 0 else 0.0
+
+
+@dataclass
+class Regression:
+    """A case that got slower than its baseline by more than the threshold."""
+
+    name: str
+    baseline: float  # Baseline median, seconds per operation
+    current: float  # Current median, seconds per operation
+
+    @property
+    def slowdown(self) -> float:
+        """The relative increase of the median time."""
+        return self.current / self.baseline - 1.0
+
+
+def measure(
+    case: Case,
+    repeats: int = DEFAULT_REPEATS,
+    warmup: int = DEFAULT_WARMUP,
+    min_sample_time: float = MIN_SAMPLE_TIME,
+) -> CaseResult:
+    """
+    Warms a case up, then takes `repeats` timing samples of it.
+
+    Each sample calls the timed function as many times as needed to take at
+    least `min_sample_time` seconds, so that short cases are not dominated by
+    timer resolution and scheduling noise.
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1.")
+    run, operations = case.setup()
+    loops = 1
+    for _ in range(max(warmup, 1)):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        loops = max(loops, math.ceil(min_sample_time / elapsed) if elapsed > 0 else 1)
+
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        samples.append((time.perf_counter() - start) / (loops * operations))
+    return CaseResult(
+        name=case.name,
+        operations=loops * operations,
+        repeats=repeats,
+        min=min(samples),
+        median=statistics.median(samples),
+        mean=statistics.fmean(samples),
+        stdev=statistics.stdev(samples) if repeats > 1 else 0.0,
+    )
+
+
+def compare(
+    results: Sequence[CaseResult], baseline: Dict[str, dict], threshold: float
+) -> List[Regression]:
+    """
+    Returns the cases whose median time exceeds the baseline's by more than
+    `threshold` (0.15 is 15% slower). Cases missing from the baseline are skipped.
+    """
+    regressions = []
+    for result in results:
+        recorded = baseline.get(result.name)
+        if recorded is None:
+            continue
+        if result.median > recorded["median"] * (1.0 + threshold):
+            regressions.append(Regression(result.name, recorded["median"], result.median))
+    return regressions
+
+
+def load_baseline(path: Path) -> Dict[str, dict]:
+    """Reads the per-case results of a baseline file, keyed by case name."""
+    with open(path) as f:
+        return {case["name"]: case for case in json.load(f)["cases"]}
+
+
+def write_results(results: Sequence[CaseResult], path: Path) -> None:
+    """Writes results, with the machine they were taken on, as JSON."""
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": [asdict(result) for result in results],
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+        f.write("\n")
+
+
+def format_result(result: CaseResult, baseline: Optional[dict] = None) -> str:
+    """Formats one result as a report line, with its change against the baseline."""
+    line = (
+        f"{result.name:<30} {result.median * 1e6:>12.2f} us/op "
+        f"(min {result.min * 1e6:.2f}, mean {result.mean * 1e6:.2f} "
+        f"± {result.stdev * 1e6:.2f})  {result.ops_per_second:>12,.0f} ops/s"
+    )
+    if baseline is not None:
+        line += f"  {result.median / baseline['median'] - 1.0:+.1%} vs baseline"
+    return line
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the suite; returns 1 if any case regressed against the baseline."""
+    p = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n")[1])
+    p.add_argument("-k", "--filter", default="", help="Only run cases whose name contains this.")
+    p.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="Timed runs per case.")
+    p.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="Untimed runs per case.")
+    p.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file.")
+    p.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown of the median that counts as a regression.",
+    )
+    p.add_argument(
+        "--save-baseline", action="store_true", help="Write the results as the new baseline."
+    )
+    p.add_argument("--output", type=Path, default=None, help="Also write the results here.")
+    args = p.parse_args(argv)
+
+    cases = [case for name, case in CASES.items() if args.filter in name]
+    if not cases:
+        p.error(f"No benchmark matches {args.filter!r}. Cases: {', '.join(CASES)}")
+    baseline: Dict[str, dict] = {}
+    if not args.save_baseline and args.baseline.exists():
+        baseline = load_baseline(args.baseline)
+
+    results = []
+    for case in cases:
+        result = measure(case, args.repeats, args.warmup)
+        results.append(result)
+        print(format_result(result, baseline.get(case.name)), flush=True)
+
+    if args.output is not None:
+        write_results(results, args.output)
+    if args.save_baseline:
+        write_results(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.current * 1e6:.2f} us/op, "
+            f"{regression.slowdown:+.1%} against {regression.baseline * 1e6:.2f} us/op",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
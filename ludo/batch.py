@@ -0,0 +1,458 @@
+"""
+Vectorized engine that advances many games in lockstep.
+
+The state of every game is held in NumPy arrays, so legal-move generation,
+move application, captures, blocking and win detection run as array
+operations over the whole batch instead of once per game. The rules are the
+same as those of `Rules.get_legal_moves`, `move_piece` and `Game.play_turn`.
+
+Pieces are stored by *progress* rather than board square: -1 is the yard,
+0-50 the steps taken along the main track from the player's start square,
+51-55 the home column and 56 HOME. Seat ``i`` plays ``list(PlayerColor)[i]``,
+as in `ludo.simulation.create_game`.
+
+NumPy is an optional dependency; importing this module without it raises an
+ImportError.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - exercised only without NumPy
+    raise ImportError(
+        "The batch engine requires NumPy. Install it with `pip install ludo-game[batch]`."
+    ) from exc
+
+from ludo.board import (
+    HOME_COLUMN_LENGTH,
+    HOME_POSITION,
+    SAFE_SQUARES,
+    START_SQUARES,
+    STEPS_TO_HOME_ENTRY,
+    TRACK_LENGTH,
+)
+from ludo.piece import Piece
+from ludo.player import Player
+from ludo.simulation import DEFAULT_MAX_TURNS, SimulationResult
+from ludo.state import GameState
+from ludo.utils.constants import PieceState, PlayerColor
+
+PIECES_PER_PLAYER = 4
+YARD = -1
+LAST_TRACK_PROGRESS = STEPS_TO_HOME_ENTRY - 1  # 50
+HOME_PROGRESS = STEPS_TO_HOME_ENTRY + HOME_COLUMN_LENGTH - 1  # 56
+
+_COLORS = list(PlayerColor)
+_START = np.array([START_SQUARES[color] for color in _COLORS], dtype=np.int16)
+_SAFE = np.zeros(TRACK_LENGTH, dtype=bool)
+_SAFE[list(SAFE_SQUARES)] = True
+_TRACK_MASK = np.uint64((1 << TRACK_LENGTH) - 1)
+# One bit per track square; the trailing 0 is what square -1 (off the track) indexes
+_SQUARE_BITS = np.array([1 << square for square in range(TRACK_LENGTH)] + [0], dtype=np.uint64)
+_PIECE_PAIRS = [(a, b) for a in range(PIECES_PER_PLAYER) for b in range(a + 1, PIECES_PER_PLAYER)]
+
+# Greedy scores, matching GreedyBot: (primary, secondary) packed as primary * 64 + secondary
+_SCORE_BASE = 64
+
+
+@dataclass
+class BatchMoves:
+    """
+    The legal moves of the current player in each of `n` games.
+
+    Attributes:
+        legal: (n, 4) True where the piece with that index may move.
+        yard_move: (n,) True if the roll allows the first yard piece to enter.
+        yard_piece: (n,) Index of the piece entering from the yard, where
+            `yard_move` is True.
+        progress: (n, 4) The current player's piece progress before the move.
+        destination: (n, 4) Progress after the move, for legal moves.
+        captures: (n, 4) True where the move would capture an opponent.
+        start: (n,) The current player's start square.
+    """
+
+    legal: np.ndarray
+    yard_move: np.ndarray
+    yard_piece: np.ndarray
+    progress: np.ndarray
+    destination: np.ndarray
+    captures: np.ndarray
+    start: np.ndarray
+
+
+# A policy picks a piece index for every game that has at least one legal move
+Policy = Callable[[BatchMoves, np.random.Generator], np.ndarray]
+
+
+def first_policy(moves: BatchMoves, rng: np.random.Generator) -> np.ndarray:
+    """Picks the first move in `Rules.get_legal_moves` order: the yard move, then by index."""
+    return np.where(moves.yard_move, moves.yard_piece, np.argmax(moves.legal, axis=1))
+
+
+def random_policy(moves: BatchMoves, rng: np.random.Generator) -> np.ndarray:
+    """Picks a legal move uniformly at random, like RandomBot."""
+    weights = rng.random(moves.legal.shape)
+    return np.asarray(np.where(moves.legal, weights, -1.0).argmax(axis=1))
+
+
+def greedy_policy(moves: BatchMoves, rng: np.random.Generator) -> np.ndarray:
+    """
+    Picks the move GreedyBot would pick.
+
+    Moves are scored 4 for reaching HOME, 3 for a capture, 2 for entering
+    from the yard, 1 for any other move from the main track and 0 otherwise,
+    with the destination square as tie-breaker. Remaining ties go to the
+    lowest piece index, as they do in GreedyBot's stable sort.
+    """
+    progress = moves.progress
+    destination = moves.destination
+    square = _absolute_positions(destination, moves.start[:, None])
+    key = np.where(
+        destination == HOME_PROGRESS,
+        4 * _SCORE_BASE,
+        np.where(
+            moves.captures,
+            3 * _SCORE_BASE + square,
+            np.where(
+                progress == YARD,
+                2 * _SCORE_BASE + square,
+                np.where(progress <= LAST_TRACK_PROGRESS, _SCORE_BASE + square, 0),
+            ),
+        ),
+    )
+    return np.asarray(np.where(moves.legal, key, -1).argmax(axis=1))
+
+
+POLICIES: Dict[str, Policy] = {
+    "first": first_policy,
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
+
+
+def _absolute_positions(progress: np.ndarray, start: np.ndarray) -> np.ndarray:
+    """Converts progress to the board positions used by GameState (-1 to 57)."""
+    return np.where(
+        progress < 0,
+        YARD,
+        np.where(progress <= LAST_TRACK_PROGRESS, (start + progress) % TRACK_LENGTH, progress + 1),
+    )
+
+
+class BatchGames:
+    """
+    The states of many games stored as NumPy arrays.
+
+    Attributes:
+        progress (np.ndarray): (games, players, 4) int8 progress of every piece;
+            ``progress.reshape(games, -1)`` is the flat per-piece view.
+        current (np.ndarray): (games,) Seat index of the player to move.
+        sixes (np.ndarray): (games,) Consecutive sixes rolled by that player.
+        over (np.ndarray): (games,) True once the game has a winner.
+        turns (np.ndarray): (games,) Dice rolls played.
+        last_roll (np.ndarray): (games,) The most recent roll, 0 before the first.
+    """
+
+    def __init__(
+        self,
+        num_games: int,
+        num_players: int = 4,
+        three_six_forfeit: bool = True,
+        use_blocking_rule: bool = True,
+    ):
+        if not 1 <= num_players <= len(_COLORS):
+            raise ValueError(f"A game needs between 1 and {len(_COLORS)} players.")
+        self.num_games = num_games
+        self.num_players = num_players
+        self.three_six_forfeit = three_six_forfeit
+        self.use_blocking_rule = use_blocking_rule
+        self.progress = np.full((num_games, num_players, PIECES_PER_PLAYER), YARD, dtype=np.int8)
+        self.current = np.zeros(num_games, dtype=np.int8)
+        self.sixes = np.zeros(num_games, dtype=np.int8)
+        self.over = np.zeros(num_games, dtype=bool)
+        self.turns = np.zeros(num_games, dtype=np.int32)
+        self.last_roll = np.zeros(num_games, dtype=np.int8)
+
+    def legal_moves(self, games: np.ndarray, rolls: np.ndarray) -> BatchMoves:
+        """
+        Computes the current player's legal moves in the given games.
+
+        Args:
+            games: Indices of the games to inspect.
+            rolls: The roll in each of those games.
+        """
+        rows = np.arange(len(games))
+        progress = self.progress[games].astype(np.int16)
+        current = self.current[games].astype(np.int16)
+        rolls = rolls.astype(np.int16)
+        own = progress[rows, current]
+        start = _START[current]
+
+        # Only the first yard piece may enter, and only on a 6
+        in_yard = own == YARD
+        yard_piece = np.argmax(in_yard, axis=1)
+        yard_move = in_yard.any(axis=1) & (rolls == 6)
+
+        destination = own + rolls[:, None]
+        movable = (own != YARD) & (destination <= HOME_PROGRESS)
+        on_track = (own != YARD) & (own <= LAST_TRACK_PROGRESS)
+
+        # Board squares of every piece on the main track, -1 elsewhere
+        seat_start = _START[: self.num_players][None, :, None]
+        squares = np.where(
+            (progress != YARD) & (progress <= LAST_TRACK_PROGRESS),
+            (seat_start + progress) % TRACK_LENGTH,
+            -1,
+        )
+        opponent = np.arange(self.num_players)[None, :] != current[:, None]
+        opponent_squares = np.where(opponent[:, :, None], squares, -1)
+
+        if self.use_blocking_rule:
+            # Squares where one opponent has two or more pieces, as a bitmask
+            blocks = np.zeros(len(games), dtype=np.uint64)
+            for a, b in _PIECE_PAIRS:
+                pair = opponent_squares[:, :, a]
+                same = np.where(pair == opponent_squares[:, :, b], pair, -1)
+                blocks |= np.bitwise_or.reduce(_SQUARE_BITS[same], axis=1)
+            # The intermediate squares (square + 1 .. square + roll - 1) as a wrapped bitmask
+            own_square = (start[:, None] + own) % TRACK_LENGTH
+            width = np.left_shift(np.uint64(1), (rolls - 1).astype(np.uint64)) - np.uint64(1)
+            window = np.left_shift(width[:, None], (own_square + 1).astype(np.uint64))
+            window = (window & _TRACK_MASK) | np.right_shift(window, np.uint64(TRACK_LENGTH))
+            blocked = (window & blocks[:, None]) != 0
+            movable &= ~(on_track & blocked)
+
+        legal = movable.copy()
+        legal[rows, yard_piece] |= yard_move
+        destination = np.where(in_yard, 0, destination)
+
+        # A move captures if it lands on a non-safe track square holding an opponent
+        occupied = np.bitwise_or.reduce(_SQUARE_BITS[opponent_squares.reshape(len(games), -1)], 1)
+        landing = (start[:, None] + destination) % TRACK_LENGTH
+        captures = (
+            legal
+            & (destination <= LAST_TRACK_PROGRESS)
+            & ~_SAFE[landing]
+            & ((occupied[:, None] & _SQUARE_BITS[landing]) != 0)
+        )
+        return BatchMoves(legal, yard_move, yard_piece, own, destination, captures, start)
+
+    def play_turn(
+        self,
+        games: np.ndarray,
+        rolls: np.ndarray,
+        choose: Callable[[np.ndarray, BatchMoves], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Plays one turn in each of the given games, like `Game.play_turn`.
+
+        Args:
+            games: Indices of the games to advance; none of them may be over.
+            rolls: The roll in each of those games.
+            choose: Called with the indices of the games that have a legal
+                move and their BatchMoves; returns the piece index to move in
+                each of them.
+
+        Returns:
+            (len(games),) The index of the piece moved in each game, or -1
+            if the turn was forfeited or there was no legal move.
+        """
+        n = len(games)
+        current = self.current[games].astype(np.int16)
+        rolls = np.asarray(rolls, dtype=np.int64)
+        six = rolls == 6
+        self.turns[games] += 1
+        self.last_roll[games] = rolls
+
+        sixes = np.where(six, self.sixes[games] + 1, 0)
+        forfeit = (sixes == 3) if self.three_six_forfeit else np.zeros(n, dtype=bool)
+        self.sixes[games] = sixes
+
+        moved = np.full(n, -1, dtype=np.int64)
+        candidates = np.flatnonzero(~forfeit)
+        if len(candidates):
+            moves = self.legal_moves(games[candidates], rolls[candidates])
+            has_move = np.asarray(moves.legal.any(axis=1))
+            movers = candidates[has_move]
+            if len(movers):
+                subset = _subset(moves, has_move)
+                chosen = np.asarray(choose(games[movers], subset), dtype=np.int64)
+                moved[movers] = chosen
+                self._apply(games[movers], current[movers], chosen, subset)
+
+        # The turn passes unless the player rolled a 6 (and did not forfeit) or just won
+        won = self.over[games]
+        advance = forfeit | (~six & ~won)
+        advancing = games[advance]
+        self.current[advancing] = (current[advance] + 1) % self.num_players
+        self.sixes[advancing] = 0
+        return moved
+
+    def _apply(
+        self, games: np.ndarray, current: np.ndarray, chosen: np.ndarray, moves: BatchMoves
+    ) -> None:
+        """Moves the chosen pieces, resolving captures and wins."""
+        rows = np.arange(len(games))
+        destination = moves.destination[rows, chosen]
+        self.progress[games, current, chosen] = destination
+
+        captured = moves.captures[rows, chosen]
+        if captured.any():
+            hit = games[captured]
+            square = (moves.start[captured] + destination[captured]) % TRACK_LENGTH
+            progress = self.progress[hit].astype(np.int16)
+            seat_start = _START[: self.num_players][None, :, None]
+            on_square = (
+                (progress != YARD)
+                & (progress <= LAST_TRACK_PROGRESS)
+                & ((seat_start + progress) % TRACK_LENGTH == square[:, None, None])
+            )
+            on_square[np.arange(len(hit)), current[captured]] = False
+            self.progress[hit] = np.where(on_square, YARD, progress)
+
+        finished = (self.progress[games, current] == HOME_PROGRESS).all(axis=1)
+        self.over[games[finished]] = True
+
+    def play(
+        self,
+        policies: Sequence[Policy],
+        rng: np.random.Generator,
+        max_turns: int = DEFAULT_MAX_TURNS,
+    ) -> None:
+        """
+        Plays every game until it is won or has run for `max_turns` rolls.
+
+        Args:
+            policies: The policy of each seat.
+            rng: The generator for dice rolls and random policies.
+            max_turns: The number of rolls after which a game is abandoned.
+        """
+        if len(policies) != self.num_players:
+            raise ValueError(f"Expected {self.num_players} policies, got {len(policies)}.")
+        distinct = {id(policy): policy for policy in policies}
+
+        def choose(games: np.ndarray, moves: BatchMoves) -> np.ndarray:
+            if len(distinct) == 1:
+                return policies[0](moves, rng)
+            seats = self.current[games]
+            chosen = np.empty(len(games), dtype=np.int64)
+            for seat, policy in enumerate(policies):
+                mask = seats == seat
+                if mask.any():
+                    chosen[mask] = policy(_subset(moves, mask), rng)
+            return chosen
+
+        while True:
+            active = np.flatnonzero(~self.over & (self.turns < max_turns))
+            if not len(active):
+                break
+            self.play_turn(active, rng.integers(1, 7, size=len(active)), choose)
+
+    @property
+    def winners(self) -> np.ndarray:
+        """(games,) The winning seat of each game, or -1 if it has not finished."""
+        return np.where(self.over, self.current, -1)
+
+    def to_game_state(self, game: int, roles: Optional[Sequence[str]] = None) -> GameState:
+        """
+        Returns game number `game` as a GameState.
+
+        Args:
+            game: The index of the game.
+            roles: The role of each seat; defaults to "random".
+        """
+        if roles is None:
+            roles = ["random"] * self.num_players
+        positions = _absolute_positions(
+            self.progress[game].astype(np.int16), _START[: self.num_players][:, None]
+        )
+        players = []
+        for seat, role in enumerate(roles):
+            color = _COLORS[seat]
+            pieces = []
+            for index, position in enumerate(positions[seat].tolist()):
+                pieces.append(
+                    Piece(id=index, color=color, state=_piece_state(position), position=position)
+                )
+            players.append(Player(color=color, role=role, pieces=pieces))
+        return GameState(
+            players=players,
+            current_player_index=int(self.current[game]),
+            dice_roll=int(self.last_roll[game]) or None,
+            is_game_over=bool(self.over[game]),
+            consecutive_sixes=int(self.sixes[game]),
+        )
+
+
+def _piece_state(position: int) -> PieceState:
+    """Returns the PieceState implied by a board position."""
+    if position < 0:
+        return PieceState.YARD
+    if position < TRACK_LENGTH:
+        return PieceState.TRACK
+    if position < HOME_POSITION:
+        return PieceState.HOME_COLUMN
+    return PieceState.HOME
+
+
+def _subset(moves: BatchMoves, mask: np.ndarray) -> BatchMoves:
+    """Returns the moves of the games selected by a boolean mask."""
+    return BatchMoves(
+        moves.legal[mask],
+        moves.yard_move[mask],
+        moves.yard_piece[mask],
+        moves.progress[mask],
+        moves.destination[mask],
+        moves.captures[mask],
+        moves.start[mask],
+    )
+
+
+def run_batch(
+    policy_names: Sequence[str],
+    num_games: int,
+    seed: Optional[int] = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+) -> SimulationResult:
+    """
+    Plays `num_games` games between the named policies in one vectorized batch.
+
+    Args:
+        policy_names: The policy name (see POLICIES) for each seat.
+        num_games: The number of games to play.
+        seed: Seeds the NumPy generator, for a reproducible batch.
+        max_turns: The number of rolls after which a game is abandoned.
+        three_six_forfeit: Enables the "three consecutive sixes" rule.
+        use_blocking_rule: Enables the blocking rule.
+
+    Returns:
+        The aggregated SimulationResult.
+
+    Raises:
+        ValueError: If a policy name is unknown or the seat count is invalid.
+    """
+    try:
+        policies = [POLICIES[name] for name in policy_names]
+    except KeyError as exc:
+        raise ValueError(
+            f"Unknown policy: {exc.args[0]}. Available: {', '.join(sorted(POLICIES))}"
+        ) from None
+    batch = BatchGames(num_games, len(policies), three_six_forfeit, use_blocking_rule)
+    start = time.perf_counter()
+    batch.play(policies, np.random.default_rng(seed), max_turns)
+
+    result = SimulationResult(strategies=list(policy_names))
+    result.elapsed = time.perf_counter() - start
+    result.games = num_games
+    winners = batch.winners
+    result.unfinished = int((winners < 0).sum())
+    result.wins = np.bincount(winners[winners >= 0], minlength=len(policies)).tolist()
+    result.total_turns = int(batch.turns.sum())
+    return result
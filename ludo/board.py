@@ -2,7 +2,9 @@
 Board layout, piece movement calculations.
 """
 
-from ludo.utils.constants import PlayerColor
+from typing import Dict, Optional, Tuple
+
+from ludo.utils.constants import PieceState, PlayerColor
 
 # The main track has 52 squares (0-51)
 TRACK_LENGTH = 52
@@ -33,3 +35,68 @@ SAFE_SQUARES = {
     START_SQUARES[PlayerColor.YELLOW] + 8,
     START_SQUARES[PlayerColor.BLUE] + 8,
 } | set(START_SQUARES.values())
+
+# Number of steps from the start square to the home entry square
+STEPS_TO_HOME_ENTRY = TRACK_LENGTH - 1
+
+# The first position index of the home column; the final HOME square is its last index
+HOME_COLUMN_START = TRACK_LENGTH
+HOME_POSITION = HOME_COLUMN_START + HOME_COLUMN_LENGTH - 1
+
+# The largest die roll covered by the precomputed move table
+MAX_ROLL = 6
+
+# The outcome of a move: the destination square and the resulting piece state
+MoveOutcome = Tuple[int, PieceState]
+
+
+def compute_move(color: PlayerColor, position: int, roll: int) -> Optional[MoveOutcome]:
+    """
+    Computes where a piece of the given color lands when moved by `roll`.
+
+    The piece's state is implied by its position: -1 is the yard, 0-51 the main
+    track, 52-56 the home column and 57 the final HOME square.
+
+    Args:
+        color: The color of the piece being moved.
+        position: The piece's current position.
+        roll: The integer result of the dice roll.
+
+    Returns:
+        A `(destination, state)` tuple, or None if the move is illegal (a yard
+        piece without a 6, a piece already HOME, or an overshoot of HOME).
+    """
+    if position < 0:
+        if roll == 6:
+            return START_SQUARES[color], PieceState.TRACK
+        return None
+
+    if position < TRACK_LENGTH:
+        progress = (position - START_SQUARES[color] + TRACK_LENGTH) % TRACK_LENGTH
+        new_progress = progress + roll
+        if new_progress < STEPS_TO_HOME_ENTRY:
+            return (position + roll) % TRACK_LENGTH, PieceState.TRACK
+        destination = HOME_COLUMN_START + new_progress - STEPS_TO_HOME_ENTRY
+    else:
+        destination = position + roll
+
+    if position >= HOME_POSITION or destination > HOME_POSITION:
+        return None
+    if destination == HOME_POSITION:
+        return destination, PieceState.HOME
+    return destination, PieceState.HOME_COLUMN
+
+
+def _build_move_table() -> Dict[PlayerColor, Tuple[Tuple[Optional[MoveOutcome], ...], ...]]:
+    """Precomputes compute_move for every color, position and roll."""
+    return {
+        color: tuple(
+            tuple(compute_move(color, position, roll) if roll else None for roll in range(7))
+            for position in range(-1, HOME_POSITION + 1)
+        )
+        for color in PlayerColor
+    }
+
+
+# MOVE_TABLE[color][position + 1][roll] -> (destination, state), or None if illegal
+MOVE_TABLE = _build_move_table()
@@ -0,0 +1,37 @@
+"""
+Static evaluation of positions for search-based bots.
+"""
+
+from typing import List
+
+from ludo.board import HOME_POSITION, START_SQUARES, TRACK_LENGTH
+from ludo.compact import PIECES_PER_PLAYER
+from ludo.move import AnyGameState
+from ludo.utils.constants import PieceState
+
+# What leaving the yard is worth, in squares. A yard piece waits for a 6, so
+# getting one out is worth far more than the single square it covers.
+YARD_EXIT_BONUS = 15
+
+
+def progress(game_state: AnyGameState) -> List[float]:
+    """
+    Returns how far each seat's pieces have come, from 0 (all in the yard) to
+    1 (all HOME).
+
+    A piece out of the yard scores `YARD_EXIT_BONUS` plus its distance: the
+    squares covered on the main track, counting its start square, or its
+    position in the home column or HOME.
+    """
+    totals = []
+    for player in game_state.players:
+        start = START_SQUARES[player.color]
+        total = 0
+        for piece in player.pieces:
+            piece_state = piece.state
+            if piece_state is PieceState.TRACK:
+                total += (piece.position - start) % TRACK_LENGTH + 1 + YARD_EXIT_BONUS
+            elif piece_state is not PieceState.YARD:
+                total += piece.position + YARD_EXIT_BONUS
+        totals.append(total / (PIECES_PER_PLAYER * (HOME_POSITION + YARD_EXIT_BONUS)))
+    return totals
@@ -0,0 +1,183 @@
+"""
+Bot that chooses moves with a depth-limited expectiminimax search.
+"""
+
+import math
+import time
+from typing import List, Optional, Tuple
+
+from ludo.bots.base import Strategy
+from ludo.bots.evaluation import progress
+from ludo.compact import CompactState
+from ludo.move import AnyGameState, AnyPiece, Move, undo_move
+from ludo.turn import begin_turn, finish_turn
+from ludo.utils.lru import LRUCache
+from ludo.zobrist import position_key
+
+# Terminal values lie outside the range of the static evaluation
+_WIN = 1.0
+_LOSS = -1.0
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+class ExpectiminimaxBot(Strategy):
+    """
+    A bot that looks ahead a few turns with expectiminimax.
+
+    Dice rolls are chance nodes averaged over the six faces. The bot's own
+    decisions maximize and every opponent's decisions minimize its value (the
+    paranoid assumption for more than two players). Leaves are scored by the
+    bot's progress relative to the best opponent.
+
+    The search deepens one turn at a time until `max_depth` or the time limit
+    is reached, and plays the best move of the deepest completed search.
+    Values of chance nodes are kept in a bounded transposition table keyed by
+    the Zobrist hash of the position, which `move_piece` and `undo_move`
+    maintain incrementally; the least recently used entries are evicted when
+    the table is full.
+
+    Attributes:
+        table (LRUCache): The transposition table, mapping a position key to
+            the searched depth and value. It persists across moves.
+        depth_reached (int): The depth of the last completed search.
+    """
+
+    def __init__(
+        self,
+        max_depth: int = 3,
+        time_limit: Optional[float] = 0.5,
+        table_size: int = 200_000,
+        three_six_forfeit: bool = True,
+        use_blocking_rule: bool = True,
+    ):
+        """
+        Initializes the bot.
+
+        Args:
+            max_depth: The deepest search, in turns.
+            time_limit: The wall-clock seconds per move after which deepening
+                stops. A one-turn search is always completed. None searches
+                to `max_depth` regardless of time.
+            table_size: The maximum number of transposition table entries.
+            three_six_forfeit: Whether the game uses the "three consecutive
+                sixes" rule.
+            use_blocking_rule: Whether the game uses the blocking rule.
+        """
+        if max_depth < 1:
+            raise ValueError("max_depth must be at least 1.")
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.three_six_forfeit = three_six_forfeit
+        self.use_blocking_rule = use_blocking_rule
+        self.table: LRUCache[int, Tuple[int, float]] = LRUCache(table_size)
+        self.depth_reached = 0
+        self._seat = 0
+        self._deadline: Optional[float] = None
+
+    def choose_move(self, legal_moves: List[Move], game_state: AnyGameState) -> Move:
+        """
+        Selects the move with the best expected value.
+
+        Args:
+            legal_moves: A list of (Piece, destination) tuples.
+            game_state: The current state of the game.
+
+        Returns:
+            The chosen (Piece, destination) tuple.
+        """
+        if not legal_moves:
+            raise ValueError("No legal moves available to choose from.")
+        if len(legal_moves) == 1:
+            return legal_moves[0]
+        roll = game_state.dice_roll
+        if roll is None:
+            raise ValueError("Cannot search without a dice roll in the game state.")
+
+        if isinstance(game_state, CompactState):
+            state = game_state.copy()
+        else:
+            state = CompactState.from_game_state(game_state)
+        seat = state.current_player_index
+        if seat != self._seat:
+            # Stored values are from the searching seat's point of view
+            self.table.clear()
+            self._seat = seat
+        pieces = [state.players[seat].pieces[piece.id] for piece, _ in legal_moves]
+
+        best = 0
+        self._deadline = None  # The one-turn search always completes
+        start = time.perf_counter()
+        for depth in range(1, self.max_depth + 1):
+            try:
+                values = [self._after_move(state, piece, roll, depth) for piece in pieces]
+            except _SearchTimeout:
+                break
+            best = max(range(len(values)), key=values.__getitem__)
+            self.depth_reached = depth
+            if self.time_limit is not None:
+                self._deadline = start + self.time_limit
+        return legal_moves[best]
+
+    def _after_move(self, state: CompactState, piece: AnyPiece, roll: int, depth: int) -> float:
+        """Returns the value of moving `piece`, searching `depth - 1` further turns."""
+        seat = state.current_player_index
+        sixes = state.consecutive_sixes
+        record = finish_turn(state, piece, roll)
+        try:
+            return self._chance(state, depth - 1)
+        finally:
+            undo_move(state, record)
+            state.current_player_index = seat
+            state.consecutive_sixes = sixes
+
+    def _chance(self, state: CompactState, depth: int) -> float:
+        """Returns the expected value of the position over the next roll."""
+        if state.is_game_over:
+            return _WIN if state.current_player_index == self._seat else _LOSS
+        if depth == 0:
+            return self._evaluate(state)
+
+        key = position_key(state)
+        entry = self.table.get(key)
+        if entry is not None and entry[0] >= depth:
+            return entry[1]
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _SearchTimeout
+
+        seat = state.current_player_index
+        sixes = state.consecutive_sixes
+        dice_roll = state.dice_roll
+        total = 0.0
+        for roll in range(1, 7):
+            legal_moves = begin_turn(state, roll, self.three_six_forfeit, self.use_blocking_rule)
+            if not legal_moves:
+                total += self._chance(state, depth - 1)
+            elif seat == self._seat:
+                best = -math.inf
+                for piece, _ in legal_moves:
+                    best = max(best, self._after_move(state, piece, roll, depth))
+                total += best
+            else:
+                best = math.inf
+                for piece, _ in legal_moves:
+                    best = min(best, self._after_move(state, piece, roll, depth))
+                total += best
+            state.current_player_index = seat
+            state.consecutive_sixes = sixes
+            state.dice_roll = dice_roll
+
+        value = total / 6
+        self.table.put(key, (depth, value))
+        return value
+
+    def _evaluate(self, state: CompactState) -> float:
+        """Scores an unfinished position for the searching seat, within (-0.5, 0.5)."""
+        seat_progress = progress(state)
+        own = seat_progress[self._seat]
+        opponents = [value for i, value in enumerate(seat_progress) if i != self._seat]
+        if not opponents:
+            return 0.5 * own
+        return 0.5 * (own - max(opponents))
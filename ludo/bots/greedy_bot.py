@@ -2,19 +2,17 @@
 Bot that chooses moves based on a simple greedy scoring function.
 """
 
-import copy
 from typing import List
 
 from ludo.bots.base import Strategy
-from ludo.move import Move, move_piece
+from ludo.move import AnyGameState, Move, predict_move
 from ludo.piece import PieceState
-from ludo.state import GameState
 
 
 class GreedyBot(Strategy):
     """A bot that uses a greedy algorithm to choose the best move."""
 
-    def _get_move_score(self, move: Move, game_state: GameState) -> tuple[int, int]:
+    def _get_move_score(self, move: Move, game_state: AnyGameState) -> tuple[int, int]:
         """
         Assigns a score to a potential move based on a set of greedy priorities.
 
@@ -35,61 +33,39 @@ class GreedyBot(Strategy):
             A tuple containing the primary and secondary score.
         """
         piece_to_move, destination = move
-        original_piece = [
-            p
-            for p in game_state.players[game_state.current_player_index].pieces
-            if p.id == piece_to_move.id
-        ][0]
-
-        # Create a deep copy of the game state to simulate the move
-        sim_state = copy.deepcopy(game_state)
-        piece_in_sim = [
-            p
-            for p in sim_state.players[sim_state.current_player_index].pieces
-            if p.id == piece_to_move.id
-        ][0]
-
-        # Simulate the move
-        if sim_state.dice_roll is None:
+        if game_state.dice_roll is None:
             raise ValueError("Cannot simulate a move without a dice roll in the game state.")
-        move_piece(sim_state, piece_in_sim, sim_state.dice_roll)
+        original_state = piece_to_move.state
+        prediction = predict_move(game_state, piece_to_move, game_state.dice_roll)
+        new_state = prediction.state
 
         # 1. Prioritize moving a piece into the HOME position
-        if piece_in_sim.state == PieceState.HOME:
+        if prediction.finishes:
             return 4, 0
 
         # 2. Prioritize capturing an opponent's piece
-        # A capture happens if an opponent piece that was on the track is now in the yard
-        for i, player in enumerate(game_state.players):
-            if i == game_state.current_player_index:
-                continue
-            for j, original_opponent_piece in enumerate(player.pieces):
-                sim_opponent_piece = sim_state.players[i].pieces[j]
-                if (
-                    original_opponent_piece.state == PieceState.TRACK
-                    and sim_opponent_piece.state == PieceState.YARD
-                ):
-                    return 3, destination
+        if prediction.captured:
+            return 3, destination
 
         # 3. Prioritize moving a piece out of the YARD
-        if original_piece.state == PieceState.YARD and piece_in_sim.state == PieceState.TRACK:
+        if original_state == PieceState.YARD and new_state == PieceState.TRACK:
             return 2, destination
 
         # 4. Prioritize moving the piece that is furthest along the track
-        if original_piece.state == PieceState.TRACK:
+        if original_state == PieceState.TRACK:
             # The "further" the piece is, the higher its position value
             return 1, destination
 
         # Default score
         return 0, 0
 
-    def choose_move(self, legal_moves: List[Move], game_state: GameState) -> Move:
+    def choose_move(self, legal_moves: List[Move], game_state: AnyGameState) -> Move:
         """
         Selects a move based on a greedy evaluation.
 
         Args:
             legal_moves: A list of (Piece, destination) tuples.
-            game_state: The current `GameState` of the game.
+            game_state: The current state of the game.
 
         Returns:
             The chosen (Piece, destination) tuple.
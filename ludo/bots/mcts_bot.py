@@ -0,0 +1,322 @@
+"""
+Bot that chooses moves with Monte Carlo Tree Search.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from ludo.bots.base import Strategy
+from ludo.bots.evaluation import progress
+from ludo.bots.greedy_bot import GreedyBot
+from ludo.compact import CompactState
+from ludo.move import AnyGameState, Move
+from ludo.turn import begin_turn, finish_turn, play_turn
+
+# Identifies the decision reached after a chance outcome: the player to move,
+# the roll and the ids of the pieces that may move
+_DecisionKey = Tuple[int, int, Tuple[int, ...]]
+
+
+class _Node:
+    """
+    A decision in the search tree: the player in `seat` picks one of the
+    pieces in `piece_ids` to move with the roll that led here.
+
+    The dice make the tree open-loop: the outcomes of each move map the next
+    decision reached (after any turns without a choice) to its node.
+    """
+
+    __slots__ = ("seat", "piece_ids", "visits", "rewards", "outcomes", "total_visits")
+
+    def __init__(self, seat: int, piece_ids: List[int]):
+        self.seat = seat
+        self.piece_ids = piece_ids
+        self.visits = [0] * len(piece_ids)
+        self.rewards = [0.0] * len(piece_ids)
+        self.outcomes: List[Dict[_DecisionKey, _Node]] = [{} for _ in piece_ids]
+        self.total_visits = 0
+
+    def select(self, exploration: float) -> int:
+        """Returns the index of the move to explore next (UCB1)."""
+        best_index = 0
+        best_value = -math.inf
+        log_total = math.log(self.total_visits) if self.total_visits else 0.0
+        for index, visits in enumerate(self.visits):
+            if visits == 0:
+                return index
+            value = self.rewards[index] / visits + exploration * math.sqrt(log_total / visits)
+            if value > best_value:
+                best_index = index
+                best_value = value
+        return best_index
+
+
+@dataclass(frozen=True)
+class _SearchTask:
+    """Everything a worker process needs to grow one independent tree."""
+
+    iterations: Optional[int]
+    time_limit: Optional[float]
+    exploration: float
+    rollout_turns: int
+    three_six_forfeit: bool
+    use_blocking_rule: bool
+    seed: int
+    root_state: CompactState
+    piece_ids: Tuple[int, ...]
+    roll: int
+
+
+def _grow_tree(task: _SearchTask) -> List[int]:
+    """Grows one tree from the snapshot and returns its root visit counts."""
+    bot = MCTSBot(
+        iterations=task.iterations,
+        time_limit=task.time_limit,
+        exploration=task.exploration,
+        rollout_turns=task.rollout_turns,
+        rng=random.Random(task.seed),
+        three_six_forfeit=task.three_six_forfeit,
+        use_blocking_rule=task.use_blocking_rule,
+    )
+    return bot._search(task.root_state, list(task.piece_ids), task.roll).visits
+
+
+class MCTSBot(Strategy):
+    """
+    A bot that searches ahead with Monte Carlo Tree Search.
+
+    Every iteration plays one sampled future from the current position: moves
+    inside the tree are picked with UCB1, dice rolls are drawn at random (the
+    chance nodes) and, once the search leaves the tree, a short rollout is
+    played with greedy moves. Rollouts run on a CompactState copy of the game.
+    A rollout that ends before the game does is scored by each player's
+    progress.
+
+    With more than one worker the search is root-parallel: every worker
+    process grows its own tree from the same snapshot under the full budget,
+    and the root visit counts of all trees are summed to pick the move. The
+    worker pool is started on first use and kept until `close` is called.
+    """
+
+    def __init__(
+        self,
+        iterations: Optional[int] = 400,
+        time_limit: Optional[float] = None,
+        exploration: float = 0.7,
+        rollout_turns: int = 10,
+        rng: Optional[random.Random] = None,
+        three_six_forfeit: bool = True,
+        use_blocking_rule: bool = True,
+        workers: int = 1,
+    ):
+        """
+        Initializes the bot.
+
+        Args:
+            iterations: The maximum number of iterations per move.
+            time_limit: The maximum wall-clock seconds per move. The search
+                stops at whichever budget runs out first.
+            exploration: The UCB1 exploration constant.
+            rollout_turns: The number of turns a rollout plays before the
+                position is scored.
+            rng: The random number generator for dice rolls. If None, the bot
+                creates its own unseeded generator.
+            three_six_forfeit: Whether the game uses the "three consecutive
+                sixes" rule.
+            use_blocking_rule: Whether the game uses the blocking rule.
+            workers: The number of processes searching in parallel, each
+                with the full budget. 1 searches in this process; 0 uses one
+                worker per CPU.
+
+        Raises:
+            ValueError: If neither budget is set.
+        """
+        if iterations is None and time_limit is None:
+            raise ValueError("MCTSBot needs an iteration or time budget.")
+        if workers < 0:
+            raise ValueError("workers must be non-negative.")
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+        self.rng = rng if rng is not None else random.Random()
+        self.three_six_forfeit = three_six_forfeit
+        self.use_blocking_rule = use_blocking_rule
+        self.workers = workers or os.cpu_count() or 1
+        self._rollout_policy = GreedyBot()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def choose_move(self, legal_moves: List[Move], game_state: AnyGameState) -> Move:
+        """
+        Selects the move that was explored most often by the search.
+
+        Args:
+            legal_moves: A list of (Piece, destination) tuples.
+            game_state: The current state of the game.
+
+        Returns:
+            The chosen (Piece, destination) tuple.
+        """
+        if not legal_moves:
+            raise ValueError("No legal moves available to choose from.")
+        if len(legal_moves) == 1:
+            return legal_moves[0]
+        roll = game_state.dice_roll
+        if roll is None:
+            raise ValueError("Cannot search without a dice roll in the game state.")
+
+        if isinstance(game_state, CompactState):
+            root_state = game_state.copy()
+        else:
+            root_state = CompactState.from_game_state(game_state)
+        piece_ids = [piece.id for piece, _ in legal_moves]
+
+        if self.workers == 1:
+            visits = self._search(root_state, piece_ids, roll).visits
+        else:
+            visits = self._search_in_parallel(root_state, piece_ids, roll)
+        best = max(range(len(legal_moves)), key=lambda index: visits[index])
+        return legal_moves[best]
+
+    def close(self) -> None:
+        """Shuts down the worker processes, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _search(self, root_state: CompactState, piece_ids: List[int], roll: int) -> _Node:
+        """Grows a tree from the root position until the budget runs out."""
+        root = _Node(root_state.current_player_index, piece_ids)
+        dice_seed = self.rng.getrandbits(64)
+        deadline = None if self.time_limit is None else time.perf_counter() + self.time_limit
+        iteration = 0
+        while self.iterations is None or iteration < self.iterations:
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._iterate(root, root_state, roll, dice_seed)
+            iteration += 1
+        return root
+
+    def _search_in_parallel(
+        self, root_state: CompactState, piece_ids: List[int], roll: int
+    ) -> List[int]:
+        """Grows one tree per worker and sums their root visit counts."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        tasks = [
+            _SearchTask(
+                iterations=self.iterations,
+                time_limit=self.time_limit,
+                exploration=self.exploration,
+                rollout_turns=self.rollout_turns,
+                three_six_forfeit=self.three_six_forfeit,
+                use_blocking_rule=self.use_blocking_rule,
+                seed=self.rng.getrandbits(64),
+                root_state=root_state,
+                piece_ids=tuple(piece_ids),
+                roll=roll,
+            )
+            for _ in range(self.workers)
+        ]
+        visits = [0] * len(piece_ids)
+        for tree_visits in self._executor.map(_grow_tree, tasks):
+            for index, count in enumerate(tree_visits):
+                visits[index] += count
+        return visits
+
+    def _iterate(self, root: _Node, root_state: CompactState, roll: int, dice_seed: int) -> None:
+        """Plays one sampled future from the root and backs up its rewards."""
+        state = root_state.copy()
+        node = root
+        path: List[Tuple[_Node, int]] = []
+        # The n-th sample of every root move sees the same dice, so that the
+        # moves are compared on equal luck (common random numbers)
+        index = root.select(self.exploration)
+        dice = random.Random(dice_seed + root.visits[index])
+        while True:
+            if path:
+                index = node.select(self.exploration)
+            path.append((node, index))
+            piece = state.players[node.seat].pieces[node.piece_ids[index]]
+            finish_turn(state, piece, roll)
+            if state.is_game_over:
+                break
+
+            legal_moves, roll = self._next_decision(state, dice)
+            if not legal_moves:
+                break
+            key = (state.current_player_index, roll, tuple(p.id for p, _ in legal_moves))
+            child = node.outcomes[index].get(key)
+            if child is None:
+                # Expand the new decision and leave the tree with a rollout
+                node.outcomes[index][key] = _Node(key[0], list(key[2]))
+                self._rollout(state, legal_moves, roll, dice)
+                break
+            node = child
+
+        rewards = self._evaluate(state)
+        for node, index in path:
+            node.total_visits += 1
+            node.visits[index] += 1
+            node.rewards[index] += rewards[node.seat]
+
+    def _next_decision(self, state: CompactState, dice: random.Random) -> Tuple[List[Move], int]:
+        """
+        Rolls the dice, playing out turns without a choice, until a player has
+        two or more legal moves. Returns those moves and the roll, or no moves
+        if the game ended first.
+        """
+        while not state.is_game_over:
+            roll = dice.randint(1, 6)
+            legal_moves = begin_turn(state, roll, self.three_six_forfeit, self.use_blocking_rule)
+            if len(legal_moves) > 1:
+                return legal_moves, roll
+            if legal_moves:
+                finish_turn(state, legal_moves[0][0], roll)
+        return [], 0
+
+    def _rollout(
+        self, state: CompactState, legal_moves: List[Move], roll: int, dice: random.Random
+    ) -> None:
+        """Plays greedy moves from a pending decision for a limited number of turns."""
+        choose = self._rollout_policy.choose_move
+        piece, _ = choose(legal_moves, state)
+        finish_turn(state, piece, roll)
+        for _ in range(self.rollout_turns):
+            if state.is_game_over:
+                break
+            play_turn(
+                state, dice.randint(1, 6), choose, self.three_six_forfeit, self.use_blocking_rule
+            )
+
+    @staticmethod
+    def _evaluate(state: CompactState) -> List[float]:
+        """
+        Scores a position for every seat in [0, 1].
+
+        A finished game scores 1 for the winner and 0 for everyone else.
+        Otherwise a seat scores between 0.25 and 0.75 by how far its total
+        progress is ahead of (or behind) the best opponent's, so that no
+        unfinished position looks as good as a win.
+        """
+        num_players = len(state.players)
+        if state.is_game_over:
+            rewards = [0.0] * num_players
+            rewards[state.current_player_index] = 1.0
+            return rewards
+
+        seat_progress = progress(state)
+        if num_players == 1:
+            return seat_progress
+        rewards = []
+        for seat, value in enumerate(seat_progress):
+            best_opponent = max(other for i, other in enumerate(seat_progress) if i != seat)
+            rewards.append(0.5 + 0.25 * (value - best_opponent))
+        return rewards
@@ -3,7 +3,7 @@ Simple bot that chooses a random legal move.
 """
 
 import random
-from typing import List
+from typing import List, Optional
 
 from ludo.bots.base import Strategy
 from ludo.move import Move
@@ -13,6 +13,16 @@ from ludo.state import GameState
 class RandomBot(Strategy):
     """A bot that chooses a random move from the list of legal moves."""
 
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        Initializes the bot.
+
+        Args:
+            rng: The random number generator to draw moves from. If None, the
+                bot creates its own unseeded generator.
+        """
+        self.rng = rng if rng is not None else random.Random()
+
     def choose_move(self, legal_moves: List[Move], game_state: GameState) -> Move:
         """
         Selects a random move from the list of legal moves.
@@ -24,4 +34,4 @@ class RandomBot(Strategy):
         Returns:
             The chosen (Piece, destination) tuple.
         """
-        return random.choice(legal_moves)
+        return self.rng.choice(legal_moves)
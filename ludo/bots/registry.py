@@ -0,0 +1,58 @@
+"""
+Lookup of bot strategies by name.
+"""
+
+import random
+from typing import Callable, Dict, Optional
+
+from ludo.bots.base import Strategy
+from ludo.bots.expectiminimax_bot import ExpectiminimaxBot
+from ludo.bots.greedy_bot import GreedyBot
+from ludo.bots.mcts_bot import MCTSBot
+from ludo.bots.random_bot import RandomBot
+
+# Automated strategies that can play without any human input. Each factory
+# receives the random number generator the strategy should draw from and the
+# game's rule flags (three_six_forfeit, use_blocking_rule), so that searching
+# bots look ahead under the rules of the game they play.
+STRATEGIES: Dict[str, Callable[[random.Random, bool, bool], Strategy]] = {
+    "random": lambda rng, three_six_forfeit, use_blocking_rule: RandomBot(rng=rng),
+    "greedy": lambda rng, three_six_forfeit, use_blocking_rule: GreedyBot(),
+    "mcts": lambda rng, three_six_forfeit, use_blocking_rule: MCTSBot(
+        rng=rng, three_six_forfeit=three_six_forfeit, use_blocking_rule=use_blocking_rule
+    ),
+    "expectiminimax": lambda rng, three_six_forfeit, use_blocking_rule: ExpectiminimaxBot(
+        three_six_forfeit=three_six_forfeit, use_blocking_rule=use_blocking_rule
+    ),
+}
+
+
+def create_strategy(
+    name: str,
+    rng: Optional[random.Random] = None,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+) -> Strategy:
+    """
+    Creates a new instance of the automated strategy registered under `name`.
+
+    Args:
+        name: The registered strategy name.
+        rng: The strategy's own random number generator. If None, an unseeded
+            generator is created.
+        three_six_forfeit: Whether the game uses the "three consecutive sixes
+            forfeit turn" rule.
+        use_blocking_rule: Whether the game uses the blocking rule.
+
+    Raises:
+        ValueError: If no strategy is registered under `name`.
+    """
+    try:
+        factory = STRATEGIES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown strategy: {name}. Available strategies: {', '.join(sorted(STRATEGIES))}"
+        ) from None
+    return factory(
+        rng if rng is not None else random.Random(), three_six_forfeit, use_blocking_rule
+    )
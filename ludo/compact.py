@@ -0,0 +1,300 @@
+"""
+Compact, array-backed game state for high-volume simulation.
+
+A :class:`CompactState` stores the position and state of every piece in two flat
+arrays (one signed byte and one state code per piece) instead of a graph of
+``Player``/``Piece`` dataclasses. Lightweight ``__slots__`` views expose the
+same ``players[i].pieces[j].state/position`` shape as :class:`GameState`, so
+``Rules.get_legal_moves`` and ``move_piece`` operate on it directly.
+
+``Rules.get_legal_moves`` and ``move_piece`` have CompactState paths that read
+and write the arrays directly, so a turn played on a CompactState is faster
+than on a GameState (see the ``engine.*`` benchmark cases), and ``copy``
+duplicates two small arrays instead of the object graph. Code that goes
+through the views pays a property call per access instead.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import List, Optional, Tuple
+
+from ludo.occupancy import Occupancy
+from ludo.piece import Piece
+from ludo.player import Player
+from ludo.state import GameState
+from ludo.utils.constants import PieceState, PlayerColor
+from ludo.zobrist import hash_pieces
+
+PIECES_PER_PLAYER = 4
+
+# A piece's compact state code is its PieceState value. The values run from 1
+# in definition order, so code - 1 indexes the states without any hashing.
+_STATE_BY_CODE: Tuple[PieceState, ...] = tuple(PieceState)
+
+
+class CompactPiece:
+    """
+    A view of a single piece stored inside a CompactState.
+
+    Attributes:
+        slot (int): The piece's index in the state's ``positions`` and
+            ``states`` arrays.
+    """
+
+    __slots__ = ("_positions", "_states", "slot", "id", "color")
+
+    def __init__(self, state: CompactState, slot: int, piece_id: int, color: PlayerColor):
+        self._positions = state.positions
+        self._states = state.states
+        self.slot = slot
+        self.id = piece_id
+        self.color = color
+
+    @property
+    def state(self) -> PieceState:
+        return _STATE_BY_CODE[self._states[self.slot] - 1]
+
+    @state.setter
+    def state(self, value: PieceState) -> None:
+        self._states[self.slot] = value.value
+
+    @property
+    def position(self) -> int:
+        return self._positions[self.slot]
+
+    @position.setter
+    def position(self, value: int) -> None:
+        self._positions[self.slot] = value
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactPiece(id={self.id}, color={self.color}, state={self.state}, "
+            f"position={self.position})"
+        )
+
+
+class CompactPlayer:
+    """A view of a single player stored inside a CompactState."""
+
+    __slots__ = ("color", "role", "pieces")
+
+    def __init__(self, color: PlayerColor, role: str, pieces: Tuple[CompactPiece, ...]):
+        self.color = color
+        self.role = role
+        self.pieces = pieces
+
+    def __repr__(self) -> str:
+        return f"CompactPlayer(color={self.color}, role={self.role!r})"
+
+
+class CompactState:
+    """
+    An array-backed representation of a GameState.
+
+    Piece ``j`` of player ``i`` lives at slot ``i * 4 + j`` of ``positions``
+    and ``states``. Only the standard piece layout is supported: each player
+    owns exactly four pieces with ids ``0..3`` in order.
+
+    Attributes:
+        positions (array): Signed byte position of every piece.
+        states (bytearray): PieceState code of every piece.
+        colors (Tuple[PlayerColor, ...]): The color of each player, in seat order.
+        roles (Tuple[str, ...]): The role of each player, in seat order.
+    """
+
+    __slots__ = (
+        "positions",
+        "states",
+        "colors",
+        "roles",
+        "current_player_index",
+        "dice_roll",
+        "is_game_over",
+        "consecutive_sixes",
+        "dice_seed",
+        "_players",
+        "_occupancy",
+        "_zobrist",
+    )
+
+    def __init__(
+        self,
+        colors: Tuple[PlayerColor, ...],
+        roles: Tuple[str, ...],
+        positions: Optional[array] = None,
+        states: Optional[bytearray] = None,
+        current_player_index: int = 0,
+        dice_roll: Optional[int] = None,
+        is_game_over: bool = False,
+        consecutive_sixes: int = 0,
+        dice_seed: Optional[int] = None,
+    ):
+        num_slots = len(colors) * PIECES_PER_PLAYER
+        if len(roles) != len(colors):
+            raise ValueError("Each player needs exactly one color and one role.")
+        self.colors = colors
+        self.roles = roles
+        self.positions = positions if positions is not None else array("b", [-1] * num_slots)
+        self.states = (
+            states if states is not None else bytearray([PieceState.YARD.value]) * num_slots
+        )
+        if len(self.positions) != num_slots or len(self.states) != num_slots:
+            raise ValueError(f"Expected {num_slots} piece slots for {len(colors)} players.")
+        self.current_player_index = current_player_index
+        self.dice_roll = dice_roll
+        self.is_game_over = is_game_over
+        self.consecutive_sixes = consecutive_sixes
+        self.dice_seed = dice_seed
+        self._players: Optional[Tuple[CompactPlayer, ...]] = None
+        self._occupancy: Optional[Occupancy] = None
+        self._zobrist: Optional[int] = None
+
+    @property
+    def players(self) -> Tuple[CompactPlayer, ...]:
+        """Player views over the piece arrays, built on first access."""
+        if self._players is None:
+            players = []
+            for i, (color, role) in enumerate(zip(self.colors, self.roles, strict=True)):
+                base = i * PIECES_PER_PLAYER
+                pieces = tuple(
+                    CompactPiece(self, base + j, j, color) for j in range(PIECES_PER_PLAYER)
+                )
+                players.append(CompactPlayer(color, role, pieces))
+            self._players = tuple(players)
+        return self._players
+
+    @property
+    def occupancy(self) -> Occupancy:
+        """The square occupancy index; see `GameState.occupancy`."""
+        if self._occupancy is None:
+            self._occupancy = Occupancy.from_players(self.players)
+        return self._occupancy
+
+    def invalidate_occupancy(self) -> None:
+        """Discards the occupancy index so it is rebuilt on next access."""
+        self._occupancy = None
+
+    @property
+    def zobrist(self) -> int:
+        """The Zobrist hash of all pieces; see `GameState.zobrist`."""
+        if self._zobrist is None:
+            self._zobrist = hash_pieces(self.players)
+        return self._zobrist
+
+    def invalidate_zobrist(self) -> None:
+        """Discards the piece hash so it is recomputed on next access."""
+        self._zobrist = None
+
+    @property
+    def has_zobrist(self) -> bool:
+        """Whether the piece hash has been computed; see `GameState.has_zobrist`."""
+        return self._zobrist is not None
+
+    def toggle_zobrist(self, key: int) -> None:
+        """XORs `key` into the piece hash; see `GameState.toggle_zobrist`."""
+        if self._zobrist is not None:
+            self._zobrist ^= key
+
+    def copy(self) -> CompactState:
+        """Returns an independent copy of this state."""
+        clone = CompactState(
+            colors=self.colors,
+            roles=self.roles,
+            positions=array("b", self.positions),
+            states=bytearray(self.states),
+            current_player_index=self.current_player_index,
+            dice_roll=self.dice_roll,
+            is_game_over=self.is_game_over,
+            consecutive_sixes=self.consecutive_sixes,
+            dice_seed=self.dice_seed,
+        )
+        if self._occupancy is not None:
+            clone._occupancy = self._occupancy.copy()
+        clone._zobrist = self._zobrist
+        return clone
+
+    @classmethod
+    def from_game_state(cls, game_state: GameState) -> CompactState:
+        """
+        Packs a GameState into a CompactState.
+
+        Raises:
+            ValueError: If a player does not own exactly four pieces with ids
+                ``0..3`` of the player's own color.
+        """
+        positions: List[int] = []
+        states = bytearray()
+        for player in game_state.players:
+            if len(player.pieces) != PIECES_PER_PLAYER:
+                raise ValueError(
+                    f"Player {player.color.name} has {len(player.pieces)} pieces; "
+                    f"compact states require {PIECES_PER_PLAYER}."
+                )
+            for j, piece in enumerate(player.pieces):
+                if piece.id != j or piece.color != player.color:
+                    raise ValueError(
+                        f"Piece {piece.id} ({piece.color.name}) is not in its standard slot "
+                        f"for player {player.color.name}."
+                    )
+                positions.append(piece.position)
+                states.append(piece.state.value)
+        return cls(
+            colors=tuple(p.color for p in game_state.players),
+            roles=tuple(p.role for p in game_state.players),
+            positions=array("b", positions),
+            states=states,
+            current_player_index=game_state.current_player_index,
+            dice_roll=game_state.dice_roll,
+            is_game_over=game_state.is_game_over,
+            consecutive_sixes=game_state.consecutive_sixes,
+            dice_seed=game_state.dice_seed,
+        )
+
+    def to_game_state(self) -> GameState:
+        """Unpacks this CompactState into an equivalent GameState."""
+        players = []
+        for i, (color, role) in enumerate(zip(self.colors, self.roles, strict=True)):
+            base = i * PIECES_PER_PLAYER
+            pieces = [
+                Piece(
+                    id=j,
+                    color=color,
+                    state=_STATE_BY_CODE[self.states[base + j] - 1],
+                    position=self.positions[base + j],
+                )
+                for j in range(PIECES_PER_PLAYER)
+            ]
+            players.append(Player(color=color, role=role, pieces=pieces))
+        return GameState(
+            players=players,
+            current_player_index=self.current_player_index,
+            dice_roll=self.dice_roll,
+            is_game_over=self.is_game_over,
+            consecutive_sixes=self.consecutive_sixes,
+            dice_seed=self.dice_seed,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactState):
+            return NotImplemented
+        return (
+            self.colors == other.colors
+            and self.roles == other.roles
+            and self.positions == other.positions
+            and self.states == other.states
+            and self.current_player_index == other.current_player_index
+            and self.dice_roll == other.dice_roll
+            and self.is_game_over == other.is_game_over
+            and self.consecutive_sixes == other.consecutive_sixes
+            and self.dice_seed == other.dice_seed
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactState(colors={self.colors}, positions={self.positions.tolist()}, "
+            f"current_player_index={self.current_player_index}, "
+            f"is_game_over={self.is_game_over})"
+        )
@@ -0,0 +1,137 @@
+"""
+Game event sinks (observers for turns, moves and outcomes).
+"""
+
+from ludo.move import AnyPiece, AnyPlayer, MoveRecord
+
+
+class EventSink:
+    """
+    Receives the events of a game as `Game.play_turn` processes them.
+
+    Every hook does nothing by default, so this class doubles as the null sink
+    used when nobody is listening. Subclasses override the hooks they need.
+    """
+
+    def on_roll(self, player: AnyPlayer, roll: int) -> None:
+        """Called at the start of a turn with the dice roll."""
+
+    def on_forfeit(self, player: AnyPlayer) -> None:
+        """Called when the player forfeits the turn after three consecutive sixes."""
+
+    def on_no_moves(self, player: AnyPlayer, roll: int) -> None:
+        """Called when the player has no legal move for the roll."""
+
+    def on_move(self, player: AnyPlayer, record: MoveRecord) -> None:
+        """Called after the player's chosen move has been applied."""
+
+    def on_capture(self, player: AnyPlayer, captured: AnyPiece) -> None:
+        """Called for every opponent piece sent back to its yard by a move."""
+
+    def on_extra_turn(self, player: AnyPlayer) -> None:
+        """Called when a roll of 6 lets the player roll again."""
+
+    def on_win(self, player: AnyPlayer) -> None:
+        """Called when the player has brought all pieces HOME."""
+
+    def on_turn_end(self, player: AnyPlayer, next_player: AnyPlayer) -> None:
+        """
+        Called last in every turn, once it is settled. `next_player` rolls
+        next: the same player after a 6 or a win, otherwise the following one.
+        """
+
+
+# The shared do-nothing sink
+NULL_SINK = EventSink()
+
+
+class MultiSink(EventSink):
+    """An event sink that passes every event on to several sinks, in order."""
+
+    def __init__(self, *sinks: EventSink) -> None:
+        self.sinks = sinks
+
+    def on_roll(self, player: AnyPlayer, roll: int) -> None:
+        for sink in self.sinks:
+            sink.on_roll(player, roll)
+
+    def on_forfeit(self, player: AnyPlayer) -> None:
+        for sink in self.sinks:
+            sink.on_forfeit(player)
+
+    def on_no_moves(self, player: AnyPlayer, roll: int) -> None:
+        for sink in self.sinks:
+            sink.on_no_moves(player, roll)
+
+    def on_move(self, player: AnyPlayer, record: MoveRecord) -> None:
+        for sink in self.sinks:
+            sink.on_move(player, record)
+
+    def on_capture(self, player: AnyPlayer, captured: AnyPiece) -> None:
+        for sink in self.sinks:
+            sink.on_capture(player, captured)
+
+    def on_extra_turn(self, player: AnyPlayer) -> None:
+        for sink in self.sinks:
+            sink.on_extra_turn(player)
+
+    def on_win(self, player: AnyPlayer) -> None:
+        for sink in self.sinks:
+            sink.on_win(player)
+
+    def on_turn_end(self, player: AnyPlayer, next_player: AnyPlayer) -> None:
+        for sink in self.sinks:
+            sink.on_turn_end(player, next_player)
+
+
+class ConsoleSink(EventSink):
+    """An event sink that reports the game on standard output for the CLI."""
+
+    def on_roll(self, player: AnyPlayer, roll: int) -> None:
+        print(f"Rolled a {roll}")
+
+    def on_forfeit(self, player: AnyPlayer) -> None:
+        print("Rolled three consecutive 6s. Forfeiting turn.")
+
+    def on_no_moves(self, player: AnyPlayer, roll: int) -> None:
+        print("No legal moves available.")
+
+    def on_move(self, player: AnyPlayer, record: MoveRecord) -> None:
+        print(f"Moved piece {record.piece.id} to {record.piece.position}")
+
+    def on_capture(self, player: AnyPlayer, captured: AnyPiece) -> None:
+        print(f"Captured {captured.color.name} piece {captured.id}!")
+
+    def on_extra_turn(self, player: AnyPlayer) -> None:
+        print("Got an extra turn for rolling a 6.")
+
+    def on_win(self, player: AnyPlayer) -> None:
+        print(f"--- Player {player.color.name} wins! ---")
+
+
+class RecordingSink(EventSink):
+    """An event sink that keeps every event as a tuple, for tests and metrics."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple] = []
+
+    def on_roll(self, player: AnyPlayer, roll: int) -> None:
+        self.events.append(("roll", player.color, roll))
+
+    def on_forfeit(self, player: AnyPlayer) -> None:
+        self.events.append(("forfeit", player.color))
+
+    def on_no_moves(self, player: AnyPlayer, roll: int) -> None:
+        self.events.append(("no_moves", player.color, roll))
+
+    def on_move(self, player: AnyPlayer, record: MoveRecord) -> None:
+        self.events.append(("move", player.color, record.piece.id, record.piece.position))
+
+    def on_capture(self, player: AnyPlayer, captured: AnyPiece) -> None:
+        self.events.append(("capture", player.color, captured.color, captured.id))
+
+    def on_extra_turn(self, player: AnyPlayer) -> None:
+        self.events.append(("extra_turn", player.color))
+
+    def on_win(self, player: AnyPlayer) -> None:
+        self.events.append(("win", player.color))
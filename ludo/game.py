@@ -2,15 +2,17 @@
 Game orchestration (turns, state machine).
 """
 
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence
 
 from ludo.bots.base import Strategy
 from ludo.dice import Dice
-from ludo.move import move_piece
+from ludo.events import NULL_SINK, EventSink
+from ludo.move import AnyGameState, Move
 from ludo.persistence import save_game
 from ludo.player import Player
-from ludo.rules import Rules
+from ludo.profiling import TurnProfiler
 from ludo.state import GameState
+from ludo.turn import next_player, play_turn
 
 
 class Game:
@@ -26,6 +28,9 @@ class Game:
             forfeits the turn.
         use_blocking_rule (bool): If True, two pieces of the same color on
             the same square form a block.
+        events (EventSink): Receives the events of every turn.
+        profiler (Optional[TurnProfiler]): Times the phases of every turn,
+            if set.
         state (GameState): The current state of the game.
     """
 
@@ -37,6 +42,8 @@ class Game:
         state: Optional[GameState] = None,
         three_six_forfeit: bool = True,
         use_blocking_rule: bool = True,
+        events: Optional[EventSink] = None,
+        profiler: Optional[TurnProfiler] = None,
     ):
         """
         Initializes a new Ludo game.
@@ -51,18 +58,26 @@ class Game:
                 "three consecutive sixes forfeit turn" rule.
             use_blocking_rule: A boolean flag to enable or disable the
                 blocking rule.
+            events: An optional EventSink notified of rolls, moves, captures,
+                forfeits, extra turns and wins. Defaults to a sink that
+                ignores all events.
+            profiler: An optional TurnProfiler that times the roll, legal
+                move generation, decision, move and win check of every turn.
+                Without one, turns run uninstrumented.
         """
         self.dice = dice
         self.strategies = strategies
         self.three_six_forfeit = three_six_forfeit
         self.use_blocking_rule = use_blocking_rule
+        self.events = events if events is not None else NULL_SINK
+        self.profiler = profiler
 
         if state:
             self.state = state
         else:
             self.state = GameState(players=list(players), dice_seed=self.dice.seed)
 
-    def play_turn(self, roll: int):
+    def play_turn(self, roll: int) -> bool:
         """
         Processes a single, automated game turn given a dice roll.
 
@@ -77,44 +92,44 @@ class Game:
 
         Args:
             roll: The integer result of a dice roll (1-6).
+
+        Returns:
+            True if a piece was moved, False if the turn was forfeited or
+            there were no legal moves.
         """
-        self.state.dice_roll = roll
+        if self.profiler is not None:
+            return self.profiler.play_turn(
+                self.state,
+                roll,
+                self._choose_move,
+                self.three_six_forfeit,
+                self.use_blocking_rule,
+                self.events,
+            )
+        return play_turn(
+            self.state,
+            roll,
+            self._choose_move,
+            self.three_six_forfeit,
+            self.use_blocking_rule,
+            self.events,
+        )
 
-        # 1. Handle consecutive sixes
-        if roll == 6:
-            self.state.consecutive_sixes += 1
-        else:
-            self.state.consecutive_sixes = 0
-
-        # 2. Check for three consecutive sixes forfeit
-        if self.three_six_forfeit and self.state.consecutive_sixes == 3:
-            self.next_player()
-            return  # Turn is forfeited
-
-        # 3. Get legal moves
-        legal_moves = Rules.get_legal_moves(self.state, roll, self.use_blocking_rule)
-
-        # 4. Handle case with no legal moves
-        if not legal_moves:
-            print("No legal moves available.")
-            if roll != 6:
-                self.next_player()
-            # If roll is 6, player keeps the turn for another roll.
-            return
-
-        # 5. Choose a move using the current player's strategy
-        current_strategy = self.strategies[self.state.current_player_index]
-        chosen_move = current_strategy.choose_move(legal_moves, self.state)
-        piece_to_move, _ = chosen_move
-        move_piece(self.state, piece_to_move, roll)
-
-        # 6. Check for win condition
-        if self.state.is_game_over:
-            return
-
-        # 7. Advance player if the roll was not a 6
-        if roll != 6:
-            self.next_player()
+    def take_turn(self) -> bool:
+        """
+        Rolls the dice and plays the turn with the result.
+
+        Returns:
+            True if a piece was moved, False otherwise.
+        """
+        if self.profiler is None:
+            return self.play_turn(self.dice.roll())
+        player = self.state.players[self.state.current_player_index]
+        return self.play_turn(self.profiler.roll(player, self.dice))
+
+    def _choose_move(self, legal_moves: List[Move], game_state: AnyGameState) -> Move:
+        """Asks the current player's strategy to pick one of the legal moves."""
+        return self.strategies[self.state.current_player_index].choose_move(legal_moves, self.state)
 
     def _get_player_command(self, player: Player) -> list[str]:
         """Gets a command from the current player (human or bot)."""
@@ -127,22 +142,7 @@ class Game:
 
     def _handle_roll(self, player: Player):
         """Handles the 'roll' command."""
-        roll = self.dice.roll()
-        print(f"Rolled a {roll}")
-
-        old_player_index = self.state.current_player_index
-        self.play_turn(roll)
-
-        if self.state.is_game_over:
-            print(f"--- Player {player.color.name} wins! ---")
-            return
-
-        new_player_index = self.state.current_player_index
-        if roll == 6:
-            if old_player_index != new_player_index:
-                print("Rolled three consecutive 6s. Forfeiting turn.")
-            else:
-                print("Got an extra turn for rolling a 6.")
+        self.take_turn()
 
     def _handle_save(self, command: list[str]):
         """Handles the 'save' command."""
@@ -174,7 +174,4 @@ class Game:
 
     def next_player(self):
         """Advances to the next player."""
-        self.state.current_player_index = (self.state.current_player_index + 1) % len(
-            self.state.players
-        )
-        self.state.consecutive_sixes = 0
+        next_player(self.state)
@@ -0,0 +1,393 @@
+"""
+Append-only game journal for crash recovery.
+
+A `GameJournal` is an event sink that appends one small fixed-size record per
+turn to a file, with a full snapshot of the state at the start and every
+`snapshot_every` turns after that. Appending 5 bytes per turn is far cheaper
+than rewriting a save file, and a game can be rebuilt by `recover_game`: it
+takes the last snapshot and replays the turns recorded after it.
+
+The file starts with a 6-byte header: the magic ``LUDJ``, the format version
+and the rule flags (bit 0 three-sixes forfeit, bit 1 blocking rule). Records
+follow, each starting with a kind byte:
+
+- Turn (5 bytes): the kind, the seat that rolled, the roll, the moved piece's
+  id (255 if no piece moved) and the seat that rolls next
+- Snapshot (3 + n bytes): the kind, the payload length as an unsigned 16-bit
+  little-endian integer and the state in the `ludo.binary_format` encoding
+
+Records reach the operating system as they are written, but the file is only
+fsynced every `sync_every` turns, on snapshots and on `close`, so a power
+loss costs at most the last few turns. A record cut short by a crash is
+ignored when the journal is read, and `GameJournal.resume` removes it.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
+
+from ludo.binary_format import decode_state, encode_state
+from ludo.events import EventSink
+from ludo.move import AnyPlayer, MoveRecord
+from ludo.state import GameState
+from ludo.turn import begin_turn, finish_turn
+from ludo.utils.constants import PlayerColor
+
+MAGIC = b"LUDJ"
+JOURNAL_VERSION = 1
+DEFAULT_SYNC_EVERY = 64
+DEFAULT_SNAPSHOT_EVERY = 100
+
+_HEADER = struct.Struct("<4sBB")
+_TURN = struct.Struct("<5B")
+_SNAPSHOT = struct.Struct("<BH")
+_TURN_KIND = 1
+_SNAPSHOT_KIND = 2
+_FLAG_THREE_SIX_FORFEIT = 1
+_FLAG_BLOCKING_RULE = 2
+_NO_PIECE = 255
+_PACKED_TURN_SIZE = 4
+
+
+@dataclass(frozen=True)
+class TurnRecord:
+    """
+    One journaled turn.
+
+    Attributes:
+        seat: The index of the player who rolled.
+        roll: The dice roll.
+        piece_id: The id of the piece moved, or None if no piece moved.
+        next_seat: The index of the player who rolls next.
+    """
+
+    seat: int
+    roll: int
+    piece_id: Optional[int]
+    next_seat: int
+
+
+@dataclass
+class JournalContents:
+    """
+    Everything read from a journal file.
+
+    Attributes:
+        three_six_forfeit: The game's three-sixes forfeit rule.
+        use_blocking_rule: The game's blocking rule.
+        turns: The turn records, in order.
+        snapshots: The encoded snapshots, each with the number of turns
+            recorded before it.
+        valid_length: The length of the file up to the end of its last
+            complete record.
+    """
+
+    three_six_forfeit: bool
+    use_blocking_rule: bool
+    turns: List[TurnRecord] = field(default_factory=list)
+    snapshots: List[Tuple[int, bytes]] = field(default_factory=list)
+    valid_length: int = _HEADER.size
+
+
+def encode_turns(turns: Sequence[TurnRecord]) -> bytes:
+    """
+    Packs turns into 4 bytes each, like the journal's turn records without
+    the kind byte.
+    """
+    return bytes(
+        value
+        for turn in turns
+        for value in (
+            turn.seat,
+            turn.roll,
+            _NO_PIECE if turn.piece_id is None else turn.piece_id,
+            turn.next_seat,
+        )
+    )
+
+
+def decode_turns(data: bytes) -> List[TurnRecord]:
+    """
+    Unpacks turns packed by `encode_turns`.
+
+    Raises:
+        ValueError: If the data is not a whole number of turns.
+    """
+    if len(data) % _PACKED_TURN_SIZE:
+        raise ValueError("Packed turns are truncated.")
+    return [
+        TurnRecord(seat, roll, None if piece_id == _NO_PIECE else piece_id, next_seat)
+        for seat, roll, piece_id, next_seat in struct.iter_unpack("4B", data)
+    ]
+
+
+def read_journal(filepath: Union[str, Path]) -> JournalContents:
+    """
+    Reads a journal file. A truncated last record is ignored.
+
+    Raises:
+        ValueError: If the file is not a journal, has another format version
+            or holds an unknown record.
+    """
+    with open(filepath, "rb") as f:
+        data = f.read()
+    if len(data) < _HEADER.size or data[:4] != MAGIC:
+        raise ValueError("Not a Ludo game journal.")
+    _, version, flags = _HEADER.unpack_from(data)
+    if version != JOURNAL_VERSION:
+        raise ValueError(
+            f"Schema version mismatch: journal has version {version}, "
+            f"code expects {JOURNAL_VERSION}"
+        )
+    contents = JournalContents(
+        three_six_forfeit=bool(flags & _FLAG_THREE_SIX_FORFEIT),
+        use_blocking_rule=bool(flags & _FLAG_BLOCKING_RULE),
+    )
+
+    offset = _HEADER.size
+    turns = contents.turns
+    while offset < len(data):
+        kind = data[offset]
+        if kind == _TURN_KIND:
+            end = offset + _TURN.size
+            if end > len(data):
+                break
+            _, seat, roll, piece_id, next_seat = _TURN.unpack_from(data, offset)
+            turns.append(
+                TurnRecord(seat, roll, None if piece_id == _NO_PIECE else piece_id, next_seat)
+            )
+        elif kind == _SNAPSHOT_KIND:
+            if offset + _SNAPSHOT.size > len(data):
+                break
+            _, length = _SNAPSHOT.unpack_from(data, offset)
+            end = offset + _SNAPSHOT.size + length
+            if end > len(data):
+                break
+            contents.snapshots.append((len(turns), data[offset + _SNAPSHOT.size : end]))
+        else:
+            raise ValueError(f"Unknown journal record kind {kind} at byte {offset}.")
+        offset = end
+        contents.valid_length = offset
+    return contents
+
+
+def replay_turn(
+    state: GameState,
+    turn: TurnRecord,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+) -> None:
+    """
+    Plays a journaled turn on a state, checking that it fits.
+
+    Raises:
+        ValueError: If the record does not match the state: another player is
+            to move, the piece cannot move, or the turn passes differently.
+    """
+    if turn.seat != state.current_player_index:
+        raise ValueError(
+            f"Journal turn by seat {turn.seat}, but seat {state.current_player_index} is to move."
+        )
+    legal_moves = begin_turn(state, turn.roll, three_six_forfeit, use_blocking_rule)
+    if turn.piece_id is not None:
+        for piece, _ in legal_moves:
+            if piece.id == turn.piece_id:
+                finish_turn(state, piece, turn.roll)
+                break
+        else:
+            raise ValueError(
+                f"Journal moves piece {turn.piece_id}, which cannot move a {turn.roll}."
+            )
+    elif legal_moves:
+        raise ValueError(f"Journal moves no piece, but a {turn.roll} has legal moves.")
+    if turn.next_seat != state.current_player_index:
+        raise ValueError(
+            f"Journal passes the turn to seat {turn.next_seat}, "
+            f"but the rules give it to seat {state.current_player_index}."
+        )
+
+
+def recover_game(filepath: Union[str, Path]) -> GameState:
+    """
+    Rebuilds a game from its journal: the last snapshot plus the turns after it.
+
+    Raises:
+        ValueError: If the file is not a journal, has no snapshot, or its
+            turns do not replay.
+    """
+    return _recover(read_journal(filepath))
+
+
+def _recover(contents: JournalContents) -> GameState:
+    """Rebuilds the game from journal contents."""
+    if not contents.snapshots:
+        raise ValueError("Journal has no snapshot to recover from.")
+    turn_index, data = contents.snapshots[-1]
+    state = decode_state(data)
+    for turn in contents.turns[turn_index:]:
+        replay_turn(state, turn, contents.three_six_forfeit, contents.use_blocking_rule)
+    return state
+
+
+class GameJournal(EventSink):
+    """
+    An event sink that journals every turn of a game.
+
+    Pass it as the game's `events` (with `MultiSink` to keep other sinks) and
+    `close` it when the game ends; it is also a context manager.
+
+    Attributes:
+        state (GameState): The journaled game's state, snapshotted
+            periodically.
+        three_six_forfeit (bool): The game's three-sixes forfeit rule.
+        use_blocking_rule (bool): The game's blocking rule.
+        sync_every (int): Turns between fsyncs.
+        snapshot_every (int): Turns between snapshots; 0 disables periodic
+            snapshots.
+        turns (int): The number of turns written since the last snapshot.
+    """
+
+    def __init__(
+        self,
+        filepath: Union[str, Path],
+        state: GameState,
+        three_six_forfeit: bool = True,
+        use_blocking_rule: bool = True,
+        sync_every: int = DEFAULT_SYNC_EVERY,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+    ):
+        """
+        Starts a journal, replacing any file at `filepath`, with a header
+        and a snapshot of `state`.
+
+        Args:
+            filepath: The journal file.
+            state: The state of the game to journal. Must be the game's own
+                state object, as snapshots are taken from it.
+            three_six_forfeit: The game's three-sixes forfeit rule.
+            use_blocking_rule: The game's blocking rule.
+            sync_every: Turns between fsyncs; 1 syncs every turn.
+            snapshot_every: Turns between snapshots; 0 snapshots only at the
+                start.
+        """
+        flags = (_FLAG_THREE_SIX_FORFEIT if three_six_forfeit else 0) | (
+            _FLAG_BLOCKING_RULE if use_blocking_rule else 0
+        )
+        file = open(filepath, "wb")
+        file.write(_HEADER.pack(MAGIC, JOURNAL_VERSION, flags))
+        self._start(file, state, three_six_forfeit, use_blocking_rule, sync_every, snapshot_every)
+
+    @classmethod
+    def resume(
+        cls,
+        filepath: Union[str, Path],
+        sync_every: int = DEFAULT_SYNC_EVERY,
+        snapshot_every: int = DEFAULT_SNAPSHOT_EVERY,
+    ) -> GameJournal:
+        """
+        Recovers the game of an existing journal and continues journaling it.
+
+        A truncated last record is cut off, then a snapshot of the recovered
+        state is appended. The recovered state is the journal's `state`; play
+        on with it, under the journal's `three_six_forfeit` and
+        `use_blocking_rule`.
+
+        Raises:
+            ValueError: If the game cannot be recovered.
+        """
+        contents = read_journal(filepath)
+        state = _recover(contents)
+        file = open(filepath, "r+b")
+        file.truncate(contents.valid_length)
+        file.seek(contents.valid_length)
+        journal = cls.__new__(cls)
+        journal._start(
+            file,
+            state,
+            contents.three_six_forfeit,
+            contents.use_blocking_rule,
+            sync_every,
+            snapshot_every,
+        )
+        return journal
+
+    def _start(
+        self,
+        file: BinaryIO,
+        state: GameState,
+        three_six_forfeit: bool,
+        use_blocking_rule: bool,
+        sync_every: int,
+        snapshot_every: int,
+    ) -> None:
+        """Sets up the writer on an open file and writes the first snapshot."""
+        if sync_every < 1:
+            file.close()
+            raise ValueError("sync_every must be at least 1.")
+        self._file = file
+        self.state = state
+        self.three_six_forfeit = three_six_forfeit
+        self.use_blocking_rule = use_blocking_rule
+        self.sync_every = sync_every
+        self.snapshot_every = snapshot_every
+        self.turns = 0
+        self._unsynced = 0
+        self._seats: Dict[PlayerColor, int] = {p.color: i for i, p in enumerate(state.players)}
+        self._roll = 0
+        self._piece_id = _NO_PIECE
+        self.snapshot()
+
+    def snapshot(self) -> None:
+        """Appends a snapshot of the current state and syncs the file."""
+        data = encode_state(self.state)
+        self._file.write(_SNAPSHOT.pack(_SNAPSHOT_KIND, len(data)))
+        self._file.write(data)
+        self.turns = 0
+        self.sync()
+
+    def sync(self) -> None:
+        """Flushes the written records and fsyncs them to disk."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self) -> None:
+        """Syncs and closes the journal file."""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self) -> GameJournal:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def on_roll(self, player: AnyPlayer, roll: int) -> None:
+        self._roll = roll
+        self._piece_id = _NO_PIECE
+
+    def on_move(self, player: AnyPlayer, record: MoveRecord) -> None:
+        self._piece_id = record.piece.id
+
+    def on_turn_end(self, player: AnyPlayer, next_player: AnyPlayer) -> None:
+        self._file.write(
+            _TURN.pack(
+                _TURN_KIND,
+                self._seats[player.color],
+                self._roll,
+                self._piece_id,
+                self._seats[next_player.color],
+            )
+        )
+        self._file.flush()
+        self.turns += 1
+        self._unsynced += 1
+        if self.snapshot_every and self.turns >= self.snapshot_every:
+            self.snapshot()
+        elif self._unsynced >= self.sync_every:
+            self.sync()
@@ -2,77 +2,285 @@
 Handles the logic for applying a move to a piece and updating the game state.
 """
 
-from typing import Tuple
+from dataclasses import dataclass
+from typing import Tuple, Union
 
-from ludo.board import HOME_COLUMN_LENGTH, SAFE_SQUARES, START_SQUARES, TRACK_LENGTH
+from ludo.board import MAX_ROLL, MOVE_TABLE, SAFE_SQUARES, START_SQUARES, compute_move
+from ludo.compact import PIECES_PER_PLAYER, CompactPiece, CompactPlayer, CompactState
 from ludo.piece import Piece
+from ludo.player import Player
 from ludo.state import GameState
-from ludo.utils.constants import PieceState
+from ludo.utils.constants import PieceState, PlayerColor
+from ludo.zobrist import piece_key
 
-Move = Tuple[Piece, int]  # A move is a piece and its destination position
+# Compact state codes, see `ludo.compact`
+_YARD_CODE = PieceState.YARD.value
+_TRACK_CODE = PieceState.TRACK.value
+_HOME_COLUMN_CODE = PieceState.HOME_COLUMN.value
+_HOME_CODE = PieceState.HOME.value
+_CODE_STATES = {state.value: state for state in PieceState}
 
+# Both the dataclass object graph and its compact array-backed form are accepted
+AnyGameState = Union[GameState, CompactState]
+AnyPiece = Union[Piece, CompactPiece]
+AnyPlayer = Union[Player, CompactPlayer]
 
-def move_piece(game_state: GameState, piece: Piece, roll: int):
-    """Moves a piece according to the given dice roll and updates the game state."""
-    if piece.state == PieceState.YARD:
+Move = Tuple[AnyPiece, int]  # A move is a piece and its destination position
+
+
+@dataclass
+class MoveRecord:
+    """
+    Everything `undo_move` needs to take back a move made by `move_piece`.
+
+    Attributes:
+        piece: The piece that was moved.
+        state: The piece's state before the move.
+        position: The piece's position before the move.
+        captured: The opponent pieces sent back to the yard by the move. They
+            were all on the main track at the moved piece's destination.
+        was_game_over: The game state's `is_game_over` flag before the move.
+    """
+
+    piece: AnyPiece
+    state: PieceState
+    position: int
+    captured: Tuple[AnyPiece, ...]
+    was_game_over: bool
+
+
+@dataclass(frozen=True)
+class MovePrediction:
+    """
+    The outcome of a move as computed by `predict_move`.
+
+    Attributes:
+        piece: The piece that would be moved.
+        position: The piece's position after the move.
+        state: The piece's state after the move.
+        captured: The opponent pieces the move would send back to the yard.
+        ends_game: True if the game would be over after the move.
+    """
+
+    piece: AnyPiece
+    position: int
+    state: PieceState
+    captured: Tuple[AnyPiece, ...]
+    ends_game: bool
+
+    @property
+    def finishes(self) -> bool:
+        """True if the move brings the piece HOME."""
+        return self.state == PieceState.HOME
+
+
+def _destination(piece: AnyPiece, roll: int) -> Tuple[int, PieceState]:
+    """Returns where `piece` ends up when moved by `roll`; illegal moves leave it in place."""
+    state = piece.state
+    if state == PieceState.YARD:
         # Move from YARD to start square
-        piece.state = PieceState.TRACK
-        piece.position = START_SQUARES[piece.color]
-        # No further logic needed for this move, but we need to check for captures on the start
-        # square.
-
-    elif piece.state == PieceState.TRACK:
-        # This calculation is tricky. Let's simplify and assume position is absolute on track.
-        # This is consistent with how piece.position is defined.
-        new_position_on_track = (piece.position + roll) % TRACK_LENGTH
-
-        # Check if the piece enters or moves within the home column
-        # We need to know the piece's progress relative to its start to see if it passes the
-        # home entry
-        current_progress = (
-            piece.position - START_SQUARES[piece.color] + TRACK_LENGTH
-        ) % TRACK_LENGTH
-        new_progress = current_progress + roll
-
-        if new_progress >= 51:  # 51 is the number of steps to reach home entry
-            home_pos = new_progress - 51
-            if home_pos < HOME_COLUMN_LENGTH:
-                piece.state = PieceState.HOME_COLUMN
-                piece.position = 52 + home_pos
-            else:  # Overshot
-                pass  # This should be an illegal move, handled by Rules
+        return START_SQUARES[piece.color], PieceState.TRACK
+    if state == PieceState.TRACK or state == PieceState.HOME_COLUMN:
+        if 0 < roll <= MAX_ROLL:
+            outcome = MOVE_TABLE[piece.color][piece.position + 1][roll]
         else:
-            # Move along the main track
-            piece.position = new_position_on_track
-
-    elif piece.state == PieceState.HOME_COLUMN:
-        current_home_pos = piece.position - 52
-        new_home_pos = current_home_pos + roll
-        if new_home_pos < HOME_COLUMN_LENGTH:
-            piece.position = 52 + new_home_pos
-        else:  # Overshot
-            pass  # This should be an illegal move, handled by Rules
-
-    # Check if the piece reached the final HOME state
-    final_home_pos_idx = HOME_COLUMN_LENGTH - 1
-    if piece.state == PieceState.HOME_COLUMN and (piece.position - 52) == final_home_pos_idx:
-        piece.state = PieceState.HOME
+            outcome = compute_move(piece.color, piece.position, roll)
+        if outcome is not None:  # An overshoot is illegal and handled by Rules
+            return outcome
+    return piece.position, state
+
+
+def _captured_pieces(
+    game_state: AnyGameState, color: PlayerColor, square: int
+) -> Tuple[AnyPiece, ...]:
+    """Returns the opponent pieces of `color` that landing on the track `square` captures."""
+    if square in SAFE_SQUARES or not game_state.occupancy.has_opponents(square, color):
+        return ()
+    return tuple(
+        opponent_piece
+        for player in game_state.players
+        if player.color != color
+        for opponent_piece in player.pieces
+        if opponent_piece.state == PieceState.TRACK and opponent_piece.position == square
+    )
+
+
+def _moved_pieces_key(piece: AnyPiece, old_position: int, captured: Tuple[AnyPiece, ...]) -> int:
+    """
+    Returns the XOR of the Zobrist keys a move toggles: the moved piece at its
+    old and new position and every captured piece on the landing square and
+    in the yard. Toggling the same keys again reverses the move.
+    """
+    key = piece_key(piece.color, piece.id, old_position) ^ piece_key(
+        piece.color, piece.id, piece.position
+    )
+    for opponent_piece in captured:
+        key ^= piece_key(opponent_piece.color, opponent_piece.id, piece.position)
+        key ^= piece_key(opponent_piece.color, opponent_piece.id, -1)
+    return key
+
+
+def predict_move(game_state: AnyGameState, piece: AnyPiece, roll: int) -> MovePrediction:
+    """
+    Computes the outcome of moving a piece without changing the game state.
+
+    This applies exactly the same rules as `move_piece`, so the prediction
+    always matches what `move_piece` would do.
+
+    Args:
+        game_state: The current state of the game.
+        piece: The piece to move.
+        roll: The integer result of the dice roll.
+
+    Returns:
+        A MovePrediction describing the piece's new position and state, the
+        pieces it would capture and whether the move ends the game.
+    """
+    position, state = _destination(piece, roll)
+    captured = (
+        _captured_pieces(game_state, piece.color, position) if state == PieceState.TRACK else ()
+    )
+
+    ends_game = game_state.is_game_over
+    if not ends_game:
+        current_player = game_state.players[game_state.current_player_index]
+        ends_game = all(
+            (state if p is piece else p.state) == PieceState.HOME for p in current_player.pieces
+        )
+    return MovePrediction(piece, position, state, captured, ends_game)
+
+
+def move_piece(game_state: AnyGameState, piece: AnyPiece, roll: int) -> MoveRecord:
+    """
+    Moves a piece according to the given dice roll and updates the game state.
+
+    Returns:
+        A MoveRecord that can be passed to `undo_move` to restore the state.
+    """
+    if isinstance(game_state, CompactState) and 0 < roll <= MAX_ROLL:
+        assert isinstance(piece, CompactPiece)
+        return _compact_move_piece(game_state, piece, roll)
+
+    occupancy = game_state.occupancy
+    record = MoveRecord(piece, piece.state, piece.position, (), game_state.is_game_over)
+    was_on_track = record.state == PieceState.TRACK
+    old_position = record.position
+
+    piece.position, piece.state = _destination(piece, roll)
+
+    is_on_track = piece.state == PieceState.TRACK
+    if was_on_track:
+        occupancy.remove(old_position, piece.color)
+    if is_on_track:
+        occupancy.add(piece.position, piece.color)
 
     # Check for captures, only if the piece landed on the main track
-    if piece.state == PieceState.TRACK and piece.position not in SAFE_SQUARES:
-        for player in game_state.players:
-            if player.color == piece.color:
-                continue
-            # Make a copy of the opponent pieces to avoid issues with modifying while iterating
-            for opponent_piece in list(player.pieces):
-                if (
-                    opponent_piece.state == PieceState.TRACK
-                    and opponent_piece.position == piece.position
-                ):
-                    opponent_piece.state = PieceState.YARD
-                    opponent_piece.position = -1  # Back to yard
+    if is_on_track:
+        record.captured = _captured_pieces(game_state, piece.color, piece.position)
+        for opponent_piece in record.captured:
+            occupancy.remove(opponent_piece.position, opponent_piece.color)
+            opponent_piece.state = PieceState.YARD
+            opponent_piece.position = -1  # Back to yard
+
+    # Keep the Zobrist hash in step, if it has been computed
+    if game_state.has_zobrist:
+        game_state.toggle_zobrist(_moved_pieces_key(piece, old_position, record.captured))
 
     # Check for win condition
     current_player = game_state.players[game_state.current_player_index]
     if all(p.state == PieceState.HOME for p in current_player.pieces):
         game_state.is_game_over = True
+
+    return record
+
+
+def _compact_move_piece(game_state: CompactState, piece: CompactPiece, roll: int) -> MoveRecord:
+    """
+    `move_piece` for a CompactState and a roll of 1-6, reading and writing the
+    piece arrays directly instead of going through the piece views.
+    """
+    positions = game_state.positions
+    states = game_state.states
+    occupancy = game_state.occupancy
+    slot = piece.slot
+    color = piece.color
+    old_code = states[slot]
+    old_position = positions[slot]
+    record = MoveRecord(piece, _CODE_STATES[old_code], old_position, (), game_state.is_game_over)
+
+    if old_code == _YARD_CODE:
+        position, code = START_SQUARES[color], _TRACK_CODE
+    elif old_code == _TRACK_CODE or old_code == _HOME_COLUMN_CODE:
+        outcome = MOVE_TABLE[color][old_position + 1][roll]
+        if outcome is None:  # An overshoot is illegal and handled by Rules
+            position, code = old_position, old_code
+        else:
+            position, code = outcome[0], outcome[1].value
+    else:
+        position, code = old_position, old_code
+    positions[slot] = position
+    states[slot] = code
+
+    if old_code == _TRACK_CODE:
+        occupancy.remove(old_position, color)
+    if code == _TRACK_CODE:
+        occupancy.add(position, color)
+        if position not in SAFE_SQUARES and occupancy.has_opponents(position, color):
+            players = game_state.players
+            captured = []
+            for other in range(len(states)):
+                if (
+                    states[other] == _TRACK_CODE
+                    and positions[other] == position
+                    and other // PIECES_PER_PLAYER != slot // PIECES_PER_PLAYER
+                ):
+                    opponent_piece = players[other // PIECES_PER_PLAYER].pieces[
+                        other % PIECES_PER_PLAYER
+                    ]
+                    occupancy.remove(position, opponent_piece.color)
+                    states[other] = _YARD_CODE
+                    positions[other] = -1
+                    captured.append(opponent_piece)
+            record.captured = tuple(captured)
+
+    if game_state.has_zobrist:
+        game_state.toggle_zobrist(_moved_pieces_key(piece, old_position, record.captured))
+
+    # The mover wins when all four of their state codes are HOME
+    base = game_state.current_player_index * PIECES_PER_PLAYER
+    if states.count(_HOME_CODE, base, base + PIECES_PER_PLAYER) == PIECES_PER_PLAYER:
+        game_state.is_game_over = True
+
+    return record
+
+
+def undo_move(game_state: AnyGameState, record: MoveRecord) -> None:
+    """
+    Takes back a move made by `move_piece`, restoring the moved piece, any
+    captured pieces, the occupancy index and the `is_game_over` flag.
+
+    Moves must be undone in the reverse order in which they were made.
+
+    Args:
+        game_state: The game state the move was applied to.
+        record: The MoveRecord returned by `move_piece`.
+    """
+    occupancy = game_state.occupancy
+    piece = record.piece
+
+    if piece.state == PieceState.TRACK:
+        occupancy.remove(piece.position, piece.color)
+    for opponent_piece in record.captured:
+        opponent_piece.state = PieceState.TRACK
+        opponent_piece.position = piece.position
+        occupancy.add(piece.position, opponent_piece.color)
+
+    if game_state.has_zobrist:
+        game_state.toggle_zobrist(_moved_pieces_key(piece, record.position, record.captured))
+
+    piece.state = record.state
+    piece.position = record.position
+    if piece.state == PieceState.TRACK:
+        occupancy.add(piece.position, piece.color)
+
+    game_state.is_game_over = record.was_game_over
@@ -0,0 +1,105 @@
+"""
+Square occupancy index for block and capture checks.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List
+
+from ludo.board import TRACK_LENGTH
+from ludo.utils.constants import PieceState, PlayerColor
+
+_NUM_COLORS = len(PlayerColor)
+_COLOR_INDEX = {color: i for i, color in enumerate(PlayerColor)}
+_COLOR_BIT = {color: 1 << i for i, color in enumerate(PlayerColor)}
+
+
+class Occupancy:
+    """
+    Per-color piece counts for every square of the main track.
+
+    Alongside the raw counts, the index keeps the total number of pieces on each
+    square and a bitmask of the colors that have a block (two or more pieces)
+    there, so that block and capture checks are constant-time lookups. Each
+    color's blocks are also kept as a bitmask of squares.
+    """
+
+    __slots__ = ("_counts", "_totals", "_blockers", "_block_squares")
+
+    def __init__(self) -> None:
+        self._counts: List[int] = [0] * (TRACK_LENGTH * _NUM_COLORS)
+        self._totals: List[int] = [0] * TRACK_LENGTH
+        self._blockers: List[int] = [0] * TRACK_LENGTH
+        self._block_squares: List[int] = [0] * _NUM_COLORS
+
+    @classmethod
+    def from_players(cls, players: Iterable) -> Occupancy:
+        """Builds the index from the TRACK pieces of the given players."""
+        occupancy = cls()
+        for player in players:
+            for piece in player.pieces:
+                if piece.state == PieceState.TRACK:
+                    occupancy.add(piece.position, piece.color)
+        return occupancy
+
+    def copy(self) -> Occupancy:
+        """Returns an independent copy of the index."""
+        clone = Occupancy.__new__(Occupancy)
+        clone._counts = self._counts[:]
+        clone._totals = self._totals[:]
+        clone._blockers = self._blockers[:]
+        clone._block_squares = self._block_squares[:]
+        return clone
+
+    def __deepcopy__(self, memo: dict) -> Occupancy:
+        return self.copy()
+
+    def add(self, square: int, color: PlayerColor) -> None:
+        """Records a piece of `color` arriving on `square`."""
+        color_index = _COLOR_INDEX[color]
+        slot = square * _NUM_COLORS + color_index
+        count = self._counts[slot] + 1
+        self._counts[slot] = count
+        self._totals[square] += 1
+        if count == 2:
+            self._blockers[square] |= _COLOR_BIT[color]
+            self._block_squares[color_index] |= 1 << square
+
+    def remove(self, square: int, color: PlayerColor) -> None:
+        """Records a piece of `color` leaving `square`."""
+        color_index = _COLOR_INDEX[color]
+        slot = square * _NUM_COLORS + color_index
+        count = self._counts[slot] - 1
+        self._counts[slot] = count
+        self._totals[square] -= 1
+        if count == 1:
+            self._blockers[square] &= ~_COLOR_BIT[color]
+            self._block_squares[color_index] &= ~(1 << square)
+
+    def count(self, square: int, color: PlayerColor) -> int:
+        """Returns the number of `color` pieces on `square`."""
+        return self._counts[square * _NUM_COLORS + _COLOR_INDEX[color]]
+
+    def is_blocked(self, square: int, color: PlayerColor) -> bool:
+        """Returns True if an opponent of `color` has a block on `square`."""
+        return self._blockers[square] & ~_COLOR_BIT[color] != 0
+
+    def opponent_blocks(self, color: PlayerColor) -> int:
+        """Returns a bitmask of the squares on which an opponent of `color` has a block."""
+        own = _COLOR_INDEX[color]
+        mask = 0
+        for index, squares in enumerate(self._block_squares):
+            if index != own:
+                mask |= squares
+        return mask
+
+    def has_opponents(self, square: int, color: PlayerColor) -> bool:
+        """Returns True if any opponent of `color` has a piece on `square`."""
+        return self._totals[square] > self._counts[square * _NUM_COLORS + _COLOR_INDEX[color]]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Occupancy):
+            return NotImplemented
+        return self._counts == other._counts
+
+    __hash__ = None  # type: ignore[assignment]
@@ -1,69 +1,161 @@
 """
-Save/load (JSON).
+Save/load (JSON or compact binary).
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-from ludo.serialization import GameData, PieceData, PlayerData
+from ludo.binary_format import decode_state, encode_state
+from ludo.piece import Piece
+from ludo.player import Player
+from ludo.serialization import SCHEMA_VERSION
 from ludo.state import GameState
+from ludo.utils.constants import PieceState, PlayerColor
 
+JSON_FORMAT = "json"
+BINARY_FORMAT = "binary"
+FORMATS = (JSON_FORMAT, BINARY_FORMAT)
+# Files with these extensions are saved and loaded in the binary format
+BINARY_EXTENSIONS = (".ludo", ".bin")
+# Files per thread pool task in `load_games`, so that scheduling a task costs
+# little next to the work it does
+LOAD_CHUNK_SIZE = 32
 
-def save_game(state: GameState, filepath: Union[str, Path]) -> None:
+
+def resolve_format(filepath: Union[str, Path], file_format: Optional[str] = None) -> str:
+    """
+    Returns the format to use for a file: `file_format` if given, otherwise
+    binary for the `BINARY_EXTENSIONS` and JSON for anything else.
+
+    Raises:
+        ValueError: If `file_format` is not one of `FORMATS`.
+    """
+    if file_format is None:
+        suffix = Path(filepath).suffix.lower()
+        return BINARY_FORMAT if suffix in BINARY_EXTENSIONS else JSON_FORMAT
+    if file_format not in FORMATS:
+        raise ValueError(f"Unknown save format: {file_format}. Choose from {', '.join(FORMATS)}.")
+    return file_format
+
+
+def save_game(
+    state: GameState, filepath: Union[str, Path], file_format: Optional[str] = None
+) -> None:
     """
-    Saves the game state to a JSON file.
+    Saves the game state to a JSON or binary file.
 
     Args:
         state: The GameState object to save.
         filepath: The path to the file where the game will be saved.
+        file_format: "json" or "binary". If None, the format is chosen by the
+            file extension (see `resolve_format`).
     """
+    if resolve_format(filepath, file_format) == BINARY_FORMAT:
+        with open(filepath, "wb") as f:
+            f.write(encode_state(state))
+        return
+
     game_data = state.to_serializable()
     data_dict = asdict(game_data)
     with open(filepath, "w") as f:
         json.dump(data_dict, f, indent=4)
 
 
-def load_game(filepath: Union[str, Path]) -> GameState:
+def load_game(filepath: Union[str, Path], file_format: Optional[str] = None) -> GameState:
     """
-    Loads a game state from a JSON file.
+    Loads a game state from a JSON or binary file.
 
     Args:
         filepath: The path to the file from which to load the game.
+        file_format: "json" or "binary". If None, the format is chosen by the
+            file extension (see `resolve_format`).
 
     Returns:
         The loaded GameState object.
     """
+    if resolve_format(filepath, file_format) == BINARY_FORMAT:
+        with open(filepath, "rb") as f:
+            return decode_state(f.read())
+
     with open(filepath, "r") as f:
-        data_dict = json.load(f)
+        return state_from_dict(json.load(f))
+
+
+def state_from_dict(data: Dict[str, Any]) -> GameState:
+    """
+    Builds a GameState straight from a parsed JSON save, in a single pass.
+
+    Checks the same things as going through `GameData` and
+    `GameState.from_serializable`, without building that intermediate
+    object graph.
 
-    # Reconstruct the nested dataclasses from the dictionary
-    players_data = [
-        PlayerData(
-            color=p["color"],
+    Raises:
+        ValueError: If the schema version differs from `SCHEMA_VERSION`.
+        KeyError: If a field is missing or a color or piece state is unknown.
+    """
+    if data["schema_version"] != SCHEMA_VERSION:
+        raise ValueError(
+            f"Schema version mismatch: file has {data['schema_version']}, "
+            f"code expects {SCHEMA_VERSION}"
+        )
+    colors = PlayerColor.__members__
+    piece_states = PieceState.__members__
+    players = [
+        Player(
+            color=colors[p["color"]],
             role=p["role"],
             pieces=[
-                PieceData(
+                Piece(
                     id=piece["id"],
-                    color=piece["color"],
-                    state=piece["state"],
+                    color=colors[piece["color"]],
+                    state=piece_states[piece["state"]],
                     position=piece["position"],
                 )
                 for piece in p["pieces"]
             ],
         )
-        for p in data_dict["players"]
+        for p in data["players"]
     ]
-
-    game_data = GameData(
-        schema_version=data_dict["schema_version"],
-        players=players_data,
-        current_player_index=data_dict["current_player_index"],
-        dice_roll=data_dict["dice_roll"],
-        is_game_over=data_dict["is_game_over"],
-        consecutive_sixes=data_dict["consecutive_sixes"],
-        dice_seed=data_dict["dice_seed"],
+    return GameState(
+        players=players,
+        current_player_index=data["current_player_index"],
+        dice_roll=data["dice_roll"],
+        is_game_over=data["is_game_over"],
+        consecutive_sixes=data["consecutive_sixes"],
+        dice_seed=data["dice_seed"],
     )
 
-    return GameState.from_serializable(game_data)
+
+def load_games(
+    filepaths: Iterable[Union[str, Path]],
+    file_format: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> List[GameState]:
+    """
+    Loads many saved games concurrently on a thread pool.
+
+    The threads overlap the file reads; decoding still takes turns on the
+    interpreter lock, so the gain is largest for files on slow storage.
+
+    Args:
+        filepaths: The files to load.
+        file_format: "json", "binary" or None to choose by extension, as for
+            `load_game`.
+        max_workers: The number of threads. Defaults to the
+            `ThreadPoolExecutor` default.
+
+    Returns:
+        The loaded states, in the order of `filepaths`.
+
+    Raises:
+        ValueError, KeyError, OSError: As `load_game` does, for the first
+            file that fails.
+    """
+    paths = list(filepaths)
+    chunks = [paths[i : i + LOAD_CHUNK_SIZE] for i in range(0, len(paths), LOAD_CHUNK_SIZE)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        loaded = executor.map(lambda chunk: [load_game(p, file_format) for p in chunk], chunks)
+        return [state for chunk in loaded for state in chunk]
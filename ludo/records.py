@@ -0,0 +1,293 @@
+"""
+Per-game records of simulation runs, streamed to JSON Lines files.
+
+A `GameRecord` sums up one finished (or abandoned) game. `RecordWriter`
+appends records to a ``.jsonl`` file, gzip-compressed for ``.gz`` paths, from
+a background thread: `write` only queues the record, so a simulation does not
+wait on the disk unless the writer falls `max_pending` records behind.
+`read_records` reads a file back lazily, one record at a time.
+
+`export_games` plays a series of seeded games and streams their records.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Sequence, Union, cast
+
+from ludo.bots.evaluation import progress
+from ludo.events import NULL_SINK, EventSink, MultiSink
+from ludo.game import Game
+from ludo.move import AnyPiece, AnyPlayer
+from ludo.simulation import DEFAULT_MAX_TURNS, GameResult, SimulationResult, create_game
+from ludo.utils.constants import PieceState
+
+DEFAULT_MAX_PENDING = 4096
+_GZIP_MAGIC = b"\x1f\x8b"
+# Queued after the last record to stop the writer thread
+_STOP = None
+
+
+@dataclass
+class GameRecord:
+    """
+    The summary of one game.
+
+    Attributes:
+        seed: The game's seed.
+        strategies: The strategy name of each seat.
+        winner: The seat of the winner, None if the game did not finish.
+        turns: The number of dice rolls played.
+        captures: The number of opponent pieces each seat captured.
+        finish_order: Every seat from first to last: the winner, then the
+            others by pieces brought HOME and then by progress. The game ends
+            with the first player home, so only the winner has finished.
+    """
+
+    seed: Optional[int]
+    strategies: List[str]
+    winner: Optional[int]
+    turns: int
+    captures: List[int]
+    finish_order: List[int]
+
+    @classmethod
+    def from_game(
+        cls, game: Game, seed: Optional[int], turns: int, captures: Sequence[int]
+    ) -> GameRecord:
+        """Creates the record of a game that has been played."""
+        state = game.state
+        winner = state.current_player_index if state.is_game_over else None
+        scores = progress(state)
+        home = [
+            sum(piece.state is PieceState.HOME for piece in player.pieces)
+            for player in state.players
+        ]
+        finish_order = sorted(
+            range(len(state.players)),
+            key=lambda seat: (seat != winner, -home[seat], -scores[seat], seat),
+        )
+        return cls(
+            seed=seed,
+            strategies=[player.role for player in state.players],
+            winner=winner,
+            turns=turns,
+            captures=list(captures),
+            finish_order=finish_order,
+        )
+
+    def to_result(self) -> GameResult:
+        """Returns the game's outcome as a `GameResult`."""
+        return GameResult(
+            seed=self.seed, strategies=list(self.strategies), winner=self.winner, turns=self.turns
+        )
+
+
+class CaptureCounter(EventSink):
+    """
+    An event sink that counts the captures made by each seat.
+
+    Attributes:
+        captures (List[int]): Captures per seat.
+    """
+
+    def __init__(self, players: Sequence[AnyPlayer]):
+        """
+        Args:
+            players: The game's players, in seat order.
+        """
+        self.captures = [0] * len(players)
+        self._seats = {player.color: seat for seat, player in enumerate(players)}
+
+    def on_capture(self, player: AnyPlayer, captured: AnyPiece) -> None:
+        self.captures[self._seats[player.color]] += 1
+
+
+def record_game(game: Game, seed: Optional[int], max_turns: int = DEFAULT_MAX_TURNS) -> GameRecord:
+    """
+    Plays a game until it ends or `max_turns` rolls have been played, and
+    returns its record. The game's own event sink still receives every event.
+    """
+    counter = CaptureCounter(game.state.players)
+    events = game.events
+    game.events = counter if events is NULL_SINK else MultiSink(events, counter)
+    state = game.state
+    turns = 0
+    try:
+        while not state.is_game_over and turns < max_turns:
+            game.take_turn()
+            turns += 1
+    finally:
+        game.events = events
+    return GameRecord.from_game(game, seed, turns, counter.captures)
+
+
+def play_recorded_game(
+    strategy_names: Sequence[str],
+    seed: Optional[int] = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+) -> GameRecord:
+    """Plays one game like `ludo.simulation.play_game` and returns its record."""
+    game = create_game(strategy_names, seed, three_six_forfeit, use_blocking_rule)
+    return record_game(game, seed, max_turns)
+
+
+def _open_text(filepath: Union[str, Path], mode: str, compress: bool) -> IO[str]:
+    """Opens a text file, through gzip if `compress` is set."""
+    if compress:
+        return cast(IO[str], gzip.open(filepath, mode + "t", encoding="utf-8"))
+    return open(filepath, mode, encoding="utf-8")
+
+
+class RecordWriter:
+    """
+    Streams game records to a JSON Lines file from a background thread.
+
+    Use it as a context manager, or call `close` to write out the queued
+    records. If writing fails, the error is raised by the next `write` or by
+    `close`.
+
+    Attributes:
+        filepath (Path): The output file.
+        written (int): The number of records written so far.
+    """
+
+    def __init__(
+        self,
+        filepath: Union[str, Path],
+        compress: Optional[bool] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        append: bool = False,
+    ):
+        """
+        Opens the file and starts the writer thread.
+
+        Args:
+            filepath: The output file.
+            compress: Whether to gzip the output. If None, paths ending in
+                ``.gz`` are compressed.
+            max_pending: The most records queued before `write` waits for the
+                writer thread.
+            append: Whether to add to an existing file instead of replacing it.
+
+        Raises:
+            ValueError: If `max_pending` is less than 1.
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1.")
+        self.filepath = Path(filepath)
+        if compress is None:
+            compress = self.filepath.suffix == ".gz"
+        self.written = 0
+        self._file = _open_text(self.filepath, "a" if append else "w", compress)
+        self._queue: queue.Queue[Optional[GameRecord]] = queue.Queue(max_pending)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="record-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, record: GameRecord) -> None:
+        """
+        Queues a record to be written.
+
+        Raises:
+            RuntimeError: If the writer is closed or writing failed.
+        """
+        if self._error is not None:
+            raise RuntimeError(f"Writing {self.filepath} failed.") from self._error
+        if not self._thread.is_alive():
+            raise RuntimeError(f"Record writer for {self.filepath} is closed.")
+        self._queue.put(record)
+
+    def close(self) -> None:
+        """
+        Writes the queued records, then closes the file.
+
+        Raises:
+            RuntimeError: If writing failed.
+        """
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self._error is not None:
+            raise RuntimeError(f"Writing {self.filepath} failed.") from self._error
+
+    def __enter__(self) -> RecordWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Writes queued records until stopped; on an error, discards the rest."""
+        f = self._file
+        try:
+            while True:
+                record = self._queue.get()
+                if record is _STOP:
+                    break
+                f.write(json.dumps(asdict(record), separators=(",", ":")))
+                f.write("\n")
+                self.written += 1
+        except BaseException as e:
+            self._error = e
+            # Keep draining so that producers blocked on a full queue go on
+            while self._queue.get() is not _STOP:
+                pass
+        finally:
+            try:
+                f.close()
+            except BaseException as e:
+                if self._error is None:
+                    self._error = e
+
+
+def read_records(filepath: Union[str, Path]) -> Iterator[GameRecord]:
+    """
+    Yields the records of a JSON Lines file one at a time, decompressing
+    gzip files (recognized by their content) on the fly.
+    """
+    with open(filepath, "rb") as f:
+        compress = f.read(2) == _GZIP_MAGIC
+    with _open_text(filepath, "r", compress) as f:
+        for line in f:
+            if line.strip():
+                yield GameRecord(**json.loads(line))
+
+
+def export_games(
+    strategy_names: Sequence[str],
+    num_games: int,
+    filepath: Union[str, Path],
+    seed: Optional[int] = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+    compress: Optional[bool] = None,
+) -> SimulationResult:
+    """
+    Plays `num_games` games like `ludo.simulation.run_simulations`, streaming
+    each game's record to `filepath` as it finishes.
+
+    Returns:
+        The aggregated SimulationResult.
+    """
+    result = SimulationResult(strategies=list(strategy_names))
+    start = time.perf_counter()
+    with RecordWriter(filepath, compress) as writer:
+        for i in range(num_games):
+            game_seed = None if seed is None else seed + i
+            record = play_recorded_game(
+                strategy_names, game_seed, max_turns, three_six_forfeit, use_blocking_rule
+            )
+            writer.write(record)
+            result.add(record.to_result())
+    result.elapsed = time.perf_counter() - start
+    return result
@@ -0,0 +1,211 @@
+"""
+Deterministic replay of recorded games with fast seeking.
+
+A `Replay` re-executes a recorded sequence of turns (rolls and chosen piece
+ids, as `TurnRecord`s) from a starting state through the same turn code as a
+live game, checking every turn against the rules. As it plays forward it
+keeps a checkpoint, in the compact `ludo.binary_format` encoding, every
+`checkpoint_every` turns, so `state_at` reaches any turn by replaying at most
+`checkpoint_every - 1` turns from the nearest checkpoint at or before it.
+
+Turns come from a journal file (`Replay.from_journal`) or from a `TurnLog`
+attached to a live game.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+from ludo.binary_format import decode_state, encode_state
+from ludo.events import EventSink
+from ludo.journal import TurnRecord, read_journal, replay_turn
+from ludo.move import AnyPlayer, MoveRecord
+from ludo.player import Player
+from ludo.state import GameState
+from ludo.utils.constants import PlayerColor
+
+DEFAULT_CHECKPOINT_EVERY = 32
+
+
+class TurnLog(EventSink):
+    """
+    An event sink that records a game's turns in memory for `Replay`.
+
+    Attributes:
+        turns (List[TurnRecord]): The turns played so far.
+    """
+
+    def __init__(self, players: Sequence[AnyPlayer]):
+        """
+        Args:
+            players: The game's players, in seat order.
+        """
+        self.turns: List[TurnRecord] = []
+        self._seats: Dict[PlayerColor, int] = {p.color: i for i, p in enumerate(players)}
+        self._roll = 0
+        self._piece_id: Optional[int] = None
+
+    def on_roll(self, player: AnyPlayer, roll: int) -> None:
+        self._roll = roll
+        self._piece_id = None
+
+    def on_move(self, player: AnyPlayer, record: MoveRecord) -> None:
+        self._piece_id = record.piece.id
+
+    def on_turn_end(self, player: AnyPlayer, next_player: AnyPlayer) -> None:
+        self.turns.append(
+            TurnRecord(
+                self._seats[player.color],
+                self._roll,
+                self._piece_id,
+                self._seats[next_player.color],
+            )
+        )
+
+
+class Replay:
+    """
+    A recorded game that can be replayed to any turn.
+
+    Turn numbers count turns played: turn 0 is the starting state and turn
+    `len(replay)` the state after the last recorded turn.
+
+    Attributes:
+        turns (Sequence[TurnRecord]): The recorded turns.
+        three_six_forfeit (bool): The game's three-sixes forfeit rule.
+        use_blocking_rule (bool): The game's blocking rule.
+        checkpoint_every (int): Turns between checkpoints.
+    """
+
+    def __init__(
+        self,
+        initial_state: GameState,
+        turns: Sequence[TurnRecord],
+        three_six_forfeit: bool = True,
+        use_blocking_rule: bool = True,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    ):
+        """
+        Args:
+            initial_state: The state before the first turn. It is not modified.
+            turns: The turns to replay.
+            three_six_forfeit: The game's three-sixes forfeit rule.
+            use_blocking_rule: The game's blocking rule.
+            checkpoint_every: Turns between checkpoints. Smaller intervals seek
+                faster but keep more checkpoints (about 70 bytes each).
+
+        Raises:
+            ValueError: If `checkpoint_every` is less than 1.
+        """
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1.")
+        self.turns = turns
+        self.three_six_forfeit = three_six_forfeit
+        self.use_blocking_rule = use_blocking_rule
+        self.checkpoint_every = checkpoint_every
+        # Checkpoint k is the state after k * checkpoint_every turns; later
+        # ones are added as replaying reaches them
+        self._checkpoints: List[bytes] = [encode_state(initial_state)]
+
+    @classmethod
+    def from_seed(
+        cls,
+        seed: Optional[int],
+        roles: Sequence[str],
+        turns: Sequence[TurnRecord],
+        three_six_forfeit: bool = True,
+        use_blocking_rule: bool = True,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    ) -> Replay:
+        """
+        Creates the replay of a game that started from scratch, with one
+        player per role seated in `PlayerColor` order, as `create_game` seats
+        them.
+
+        Raises:
+            ValueError: If there are no roles or more roles than colors.
+        """
+        if not 1 <= len(roles) <= len(PlayerColor):
+            raise ValueError(f"A game needs between 1 and {len(PlayerColor)} players.")
+        players = [
+            Player(color=color, role=role) for color, role in zip(PlayerColor, roles, strict=False)
+        ]
+        return cls(
+            GameState(players=players, dice_seed=seed),
+            turns,
+            three_six_forfeit,
+            use_blocking_rule,
+            checkpoint_every,
+        )
+
+    @classmethod
+    def from_journal(
+        cls, filepath: Union[str, Path], checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY
+    ) -> Replay:
+        """
+        Creates the replay of a journaled game, from its first snapshot.
+
+        Raises:
+            ValueError: If the file is not a journal or has no snapshot.
+        """
+        contents = read_journal(filepath)
+        if not contents.snapshots:
+            raise ValueError("Journal has no snapshot to replay from.")
+        turn_index, data = contents.snapshots[0]
+        return cls(
+            decode_state(data),
+            contents.turns[turn_index:],
+            contents.three_six_forfeit,
+            contents.use_blocking_rule,
+            checkpoint_every,
+        )
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def state_at(self, turn: int) -> GameState:
+        """
+        Returns a new state as it was after `turn` turns.
+
+        Raises:
+            IndexError: If `turn` is not between 0 and `len(self)`.
+            ValueError: If a recorded turn does not fit the rules.
+        """
+        if not 0 <= turn <= len(self.turns):
+            raise IndexError(f"Turn {turn} is outside the replay (0-{len(self.turns)}).")
+        index = min(turn // self.checkpoint_every, len(self._checkpoints) - 1)
+        state = decode_state(self._checkpoints[index])
+        self._play(state, index * self.checkpoint_every, turn)
+        return state
+
+    def final_state(self) -> GameState:
+        """Returns a new state as it was after the last recorded turn."""
+        return self.state_at(len(self.turns))
+
+    def states(self, start: int = 0, stop: Optional[int] = None) -> Iterator[GameState]:
+        """
+        Yields the state after each turn from `start` to `stop` (default: the
+        last turn), inclusive.
+
+        A single state is updated in place and yielded every time; copy it
+        (for example with `encode_state`) to keep a turn's state.
+        """
+        stop = len(self.turns) if stop is None else stop
+        state = self.state_at(start)
+        yield state
+        for turn in range(start, stop):
+            self._play(state, turn, turn + 1)
+            yield state
+
+    def _play(self, state: GameState, start: int, stop: int) -> None:
+        """Replays turns `start` to `stop` (exclusive) on a state at turn `start`."""
+        interval = self.checkpoint_every
+        for turn in range(start, stop):
+            try:
+                replay_turn(state, self.turns[turn], self.three_six_forfeit, self.use_blocking_rule)
+            except ValueError as e:
+                raise ValueError(f"Turn {turn + 1} does not replay: {e}") from None
+            played = turn + 1
+            if played % interval == 0 and played // interval == len(self._checkpoints):
+                self._checkpoints.append(encode_state(state))
@@ -5,21 +5,38 @@ Move validation, capture rules, safe squares.
 from typing import List
 
 from ludo.board import (
-    HOME_COLUMN_LENGTH,
+    MAX_ROLL,
+    MOVE_TABLE,
     START_SQUARES,
     TRACK_LENGTH,
+    compute_move,
 )
-from ludo.move import Move
-from ludo.state import GameState
+from ludo.compact import PIECES_PER_PLAYER, CompactState
+from ludo.move import AnyGameState, Move
 from ludo.utils.constants import PieceState, PlayerColor
 
+# Compact state codes of the piece states that can move
+_YARD_CODE = PieceState.YARD.value
+_TRACK_CODE = PieceState.TRACK.value
+_HOME_COLUMN_CODE = PieceState.HOME_COLUMN.value
+
+# The track squares passed over (not landed on) by each roll from each square,
+# as bitmasks comparable with `Occupancy.opponent_blocks`
+_PATH_MASKS = tuple(
+    tuple(
+        sum(1 << (position + i) % TRACK_LENGTH for i in range(1, roll))
+        for roll in range(MAX_ROLL + 1)
+    )
+    for position in range(TRACK_LENGTH)
+)
+
 
 class Rules:
     """A collection of static methods to enforce the rules of Ludo."""
 
     @staticmethod
     def get_legal_moves(
-        game_state: GameState, roll: int, use_blocking_rule: bool = True
+        game_state: AnyGameState, roll: int, use_blocking_rule: bool = True
     ) -> List[Move]:
         """
         Determines all legal moves for the current player given a dice roll.
@@ -40,57 +57,58 @@ class Rules:
             A list of legal moves, where each move is a tuple containing
             the Piece to move and its integer destination square.
         """
+        if isinstance(game_state, CompactState) and 0 < roll <= MAX_ROLL:
+            return _compact_legal_moves(game_state, roll, use_blocking_rule)
+
         player = game_state.players[game_state.current_player_index]
         legal_moves: List[Move] = []
-        start_square = START_SQUARES[player.color]
+        # Rolls outside the die's range are not in the table; compute those directly
+        table = MOVE_TABLE[player.color] if 0 < roll <= MAX_ROLL else None
 
         # Rule: If a 6 is rolled, moving a piece from the yard is a legal move
         if roll == 6:
             yard_pieces = [p for p in player.pieces if p.state == PieceState.YARD]
             if yard_pieces:
                 # The destination is the player's start square
-                legal_moves.append((yard_pieces[0], start_square))
+                legal_moves.append((yard_pieces[0], START_SQUARES[player.color]))
+
+        occupancy = game_state.occupancy if use_blocking_rule else None
 
         # Check for legal moves for pieces on the track or in the home column
         for piece in player.pieces:
-            if piece.state == PieceState.TRACK:
-                current_progress = (piece.position - start_square + TRACK_LENGTH) % TRACK_LENGTH
-                new_progress = current_progress + roll
-
-                # Check for blocks if the rule is enabled
+            state = piece.state
+            if state is PieceState.TRACK:
+                on_track = True
+            elif state is PieceState.HOME_COLUMN:
+                on_track = False
+            else:
+                continue
+
+            position = piece.position
+            if table is not None:
+                outcome = table[position + 1][roll]
+            else:
+                outcome = compute_move(player.color, position, roll)
+            if outcome is None:  # Overshoots HOME
+                continue
+
+            # Check for blocks on the intermediate squares if the rule is enabled
+            if occupancy is not None and on_track:
                 path_is_clear = True
-                if use_blocking_rule:
-                    for i in range(1, roll):  # Check intermediate squares
-                        intermediate_square = (piece.position + i) % TRACK_LENGTH
-                        if Rules.is_square_blocked_by_opponent(
-                            intermediate_square, player.color, game_state
-                        ):
-                            path_is_clear = False
-                            break
+                for i in range(1, roll):
+                    if occupancy.is_blocked((position + i) % TRACK_LENGTH, player.color):
+                        path_is_clear = False
+                        break
                 if not path_is_clear:
                     continue
 
-                # A piece's total journey is 51 steps on track + 6 in home column
-                if new_progress < 51:  # Stays on main track
-                    destination = (piece.position + roll) % TRACK_LENGTH
-                    legal_moves.append((piece, destination))
-                elif new_progress < 51 + HOME_COLUMN_LENGTH:  # Enters home column
-                    home_col_pos = new_progress - 51
-                    destination = 52 + home_col_pos  # 52 is the base for home column positions
-                    legal_moves.append((piece, destination))
-
-            elif piece.state == PieceState.HOME_COLUMN:
-                current_home_pos = piece.position - 52
-                new_home_pos = current_home_pos + roll
-                if new_home_pos < HOME_COLUMN_LENGTH:
-                    destination = 52 + new_home_pos
-                    legal_moves.append((piece, destination))
+            legal_moves.append((piece, outcome[0]))
 
         return legal_moves
 
     @staticmethod
     def is_square_blocked_by_opponent(
-        square_position: int, current_player_color: PlayerColor, game_state: GameState
+        square_position: int, current_player_color: PlayerColor, game_state: AnyGameState
     ) -> bool:
         """
         Checks if a square on the main track is blocked by an opponent.
@@ -107,16 +125,40 @@ class Rules:
         Returns:
             True if the square is blocked by an opponent, False otherwise.
         """
-        for player in game_state.players:
-            if player.color == current_player_color:
-                continue  # Friendly pieces don't block the current player
-
-            opponent_pieces_on_square = 0
-            for piece in player.pieces:
-                if piece.position == square_position and piece.state == PieceState.TRACK:
-                    opponent_pieces_on_square += 1
-
-            if opponent_pieces_on_square >= 2:
-                return True  # Found a block from this opponent
-
-        return False
+        return game_state.occupancy.is_blocked(square_position, current_player_color)
+
+
+def _compact_legal_moves(
+    game_state: CompactState, roll: int, use_blocking_rule: bool
+) -> List[Move]:
+    """
+    `Rules.get_legal_moves` for a CompactState and a roll of 1-6, reading the
+    piece arrays directly instead of going through the piece views.
+    """
+    seat = game_state.current_player_index
+    player = game_state.players[seat]
+    color = player.color
+    pieces = player.pieces
+    base = seat * PIECES_PER_PLAYER
+    codes = game_state.states[base : base + PIECES_PER_PLAYER]
+    positions = game_state.positions
+    table = MOVE_TABLE[color]
+    legal_moves: List[Move] = []
+
+    if roll == 6:
+        first_in_yard = codes.find(_YARD_CODE)
+        if first_in_yard >= 0:
+            legal_moves.append((pieces[first_in_yard], START_SQUARES[color]))
+
+    blocks = game_state.occupancy.opponent_blocks(color) if use_blocking_rule else 0
+    for j, code in enumerate(codes):
+        if code != _TRACK_CODE and code != _HOME_COLUMN_CODE:
+            continue
+        position = positions[base + j]
+        outcome = table[position + 1][roll]
+        if outcome is None:  # Overshoots HOME
+            continue
+        if blocks and code == _TRACK_CODE and blocks & _PATH_MASKS[position][roll]:
+            continue
+        legal_moves.append((pieces[j], outcome[0]))
+    return legal_moves
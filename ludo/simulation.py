@@ -0,0 +1,191 @@
+"""
+Headless bot-vs-bot simulation.
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+from ludo.bots.registry import create_strategy
+from ludo.dice import BufferedDice
+from ludo.game import Game
+from ludo.player import Player
+from ludo.profiling import TurnProfiler
+from ludo.utils.constants import PlayerColor
+
+# Games that have not finished after this many rolls are abandoned
+DEFAULT_MAX_TURNS = 10_000
+
+
+@dataclass
+class GameResult:
+    """The outcome of a single simulated game."""
+
+    seed: Optional[int]
+    strategies: List[str]
+    winner: Optional[int]  # Seat index of the winner, None if the game did not finish
+    turns: int  # Number of dice rolls played
+
+
+@dataclass
+class SimulationResult:
+    """Aggregated outcome of a batch of simulated games."""
+
+    strategies: List[str]
+    games: int = 0
+    wins: List[int] = field(default_factory=list)  # Wins per seat
+    unfinished: int = 0
+    total_turns: int = 0
+    elapsed: float = 0.0  # Wall-clock seconds
+
+    def __post_init__(self):
+        if not self.wins:
+            self.wins = [0] * len(self.strategies)
+
+    def add(self, result: GameResult) -> None:
+        """Adds a single game's outcome to the totals."""
+        self.games += 1
+        self.total_turns += result.turns
+        if result.winner is None:
+            self.unfinished += 1
+        else:
+            self.wins[result.winner] += 1
+
+    @property
+    def win_rates(self) -> List[float]:
+        """The fraction of games won by each seat."""
+        return [w / self.games if self.games else 0.0 for w in self.wins]
+
+    @property
+    def average_turns(self) -> float:
+        """The mean number of dice rolls per game."""
+        return self.total_turns / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Simulation throughput."""
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def strategy_rng(seed: Optional[int], seat: int) -> random.Random:
+    """
+    Returns the random number generator for the strategy in `seat` of a game.
+
+    A seeded game derives a distinct, reproducible generator per seat, so bots
+    never share a stream with each other or with the dice.
+    """
+    if seed is None:
+        return random.Random()
+    return random.Random(f"{seed}/{seat}")
+
+
+def create_game(
+    strategy_names: Sequence[str],
+    seed: Optional[int] = None,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+    profiler: Optional[TurnProfiler] = None,
+) -> Game:
+    """
+    Sets up a new game between automated strategies, one per seat.
+
+    Raises:
+        ValueError: If there are no strategies, more strategies than colors,
+            or an unknown strategy name.
+    """
+    colors = list(PlayerColor)
+    if not 1 <= len(strategy_names) <= len(colors):
+        raise ValueError(f"A game needs between 1 and {len(colors)} players.")
+    players = [
+        Player(color=color, role=name) for color, name in zip(colors, strategy_names, strict=False)
+    ]
+    strategies = [
+        create_strategy(name, strategy_rng(seed, seat), three_six_forfeit, use_blocking_rule)
+        for seat, name in enumerate(strategy_names)
+    ]
+    return Game(
+        players=players,
+        strategies=strategies,
+        dice=BufferedDice(seed=seed),
+        three_six_forfeit=three_six_forfeit,
+        use_blocking_rule=use_blocking_rule,
+        profiler=profiler,
+    )
+
+
+def play_game(
+    strategy_names: Sequence[str],
+    seed: Optional[int] = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+    profiler: Optional[TurnProfiler] = None,
+) -> GameResult:
+    """
+    Plays one complete game between automated strategies without any I/O.
+
+    Args:
+        strategy_names: The registered strategy name for each seat.
+        seed: The dice seed, for a reproducible game.
+        max_turns: The number of rolls after which the game is abandoned.
+        three_six_forfeit: Enables the "three consecutive sixes" rule.
+        use_blocking_rule: Enables the blocking rule.
+        profiler: An optional TurnProfiler to time the phases of every turn.
+
+    Returns:
+        The GameResult of the game.
+    """
+    game = create_game(strategy_names, seed, three_six_forfeit, use_blocking_rule, profiler)
+    state = game.state
+    turns = 0
+    while not state.is_game_over and turns < max_turns:
+        game.take_turn()
+        turns += 1
+    winner = state.current_player_index if state.is_game_over else None
+    return GameResult(seed=seed, strategies=list(strategy_names), winner=winner, turns=turns)
+
+
+def run_simulations(
+    strategy_names: Sequence[str],
+    num_games: int,
+    seed: Optional[int] = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+    profiler: Optional[TurnProfiler] = None,
+) -> SimulationResult:
+    """
+    Plays `num_games` games between the same strategies and aggregates the results.
+
+    Game `i` is seeded with `seed + i`, so a seeded run is reproducible.
+
+    Args:
+        strategy_names: The registered strategy name for each seat.
+        num_games: The number of games to play.
+        seed: The base seed. If None, every game is unseeded.
+        max_turns: The number of rolls after which a game is abandoned.
+        three_six_forfeit: Enables the "three consecutive sixes" rule.
+        use_blocking_rule: Enables the blocking rule.
+        profiler: An optional TurnProfiler that aggregates the turn phase
+            timings of all games.
+
+    Returns:
+        The aggregated SimulationResult.
+    """
+    result = SimulationResult(strategies=list(strategy_names))
+    start = time.perf_counter()
+    for i in range(num_games):
+        game_seed = None if seed is None else seed + i
+        result.add(
+            play_game(
+                strategy_names,
+                game_seed,
+                max_turns,
+                three_six_forfeit,
+                use_blocking_rule,
+                profiler,
+            )
+        )
+    result.elapsed = time.perf_counter() - start
+    return result
@@ -4,11 +4,13 @@ Dataclasses for GameState, TurnState, etc.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 
+from ludo.occupancy import Occupancy
 from ludo.player import Player
 from ludo.serialization import SCHEMA_VERSION, GameData
+from ludo.zobrist import hash_pieces
 
 
 @dataclass
@@ -21,6 +23,50 @@ class GameState:
     is_game_over: bool = False
     consecutive_sixes: int = 0
     dice_seed: Optional[int] = None
+    _occupancy: Optional[Occupancy] = field(default=None, init=False, repr=False, compare=False)
+    _zobrist: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def occupancy(self) -> Occupancy:
+        """
+        The square occupancy index, built from the pieces on first access.
+
+        `move_piece` keeps the index up to date. Code that edits piece states or
+        positions directly must call `invalidate_occupancy` afterwards.
+        """
+        if self._occupancy is None:
+            self._occupancy = Occupancy.from_players(self.players)
+        return self._occupancy
+
+    def invalidate_occupancy(self) -> None:
+        """Discards the occupancy index so it is rebuilt on next access."""
+        self._occupancy = None
+
+    @property
+    def zobrist(self) -> int:
+        """
+        The Zobrist hash of all pieces, computed on first access.
+
+        `move_piece` and `undo_move` keep the hash up to date. Code that edits
+        piece positions directly must call `invalidate_zobrist` afterwards.
+        """
+        if self._zobrist is None:
+            self._zobrist = hash_pieces(self.players)
+        return self._zobrist
+
+    def invalidate_zobrist(self) -> None:
+        """Discards the piece hash so it is recomputed on next access."""
+        self._zobrist = None
+
+    @property
+    def has_zobrist(self) -> bool:
+        """Whether the piece hash has been computed and is being kept up to date."""
+        return self._zobrist is not None
+
+    def toggle_zobrist(self, key: int) -> None:
+        """XORs `key` into the piece hash; does nothing until the hash is computed."""
+        if self._zobrist is not None:
+            self._zobrist ^= key
 
     def to_serializable(self) -> GameData:
         """Converts the GameState to a serializable GameData object."""
@@ -0,0 +1,115 @@
+"""
+Canonical keys of game positions.
+
+A state key packs everything that decides how a position plays on into one
+integer: the seat colors, every piece position, the player to move and the
+consecutive sixes. The four pieces of a color are interchangeable, so their
+positions are sorted before packing and positions that differ only in which
+piece stands where share a key. The dice roll, roles and seed are not part of
+the key.
+
+Layout, from the least significant bits up:
+
+- 2 bits: consecutive sixes, capped at 3 (more never change the rules)
+- 2 bits: the current player index
+- 3 bits: the number of players
+- then for each seat, last seat first: 6 bits per piece (position + 1, in
+  ascending order), topped by 2 bits of color
+"""
+
+from typing import List, Sequence, Tuple
+
+from ludo.compact import PIECES_PER_PLAYER, CompactState
+from ludo.move import AnyGameState
+from ludo.utils.constants import PlayerColor
+
+# An immutable, hashable identifier of a position
+StateKey = int
+
+POSITION_BITS = 6
+COLOR_BITS = 2
+PLAYER_COUNT_BITS = 3
+PLAYER_INDEX_BITS = 2
+SIXES_BITS = 2
+MAX_KEYED_SIXES = (1 << SIXES_BITS) - 1
+# The bits of one seat: its color and the positions of its pieces
+SEAT_BITS = COLOR_BITS + PIECES_PER_PLAYER * POSITION_BITS
+
+_COLOR_CODES = {color: code for code, color in enumerate(PlayerColor)}
+_COLORS_BY_CODE = list(PlayerColor)
+_POSITION_MASK = (1 << POSITION_BITS) - 1
+
+
+def pack_seat(color: PlayerColor, sorted_positions: Sequence[int]) -> int:
+    """
+    Packs one seat's color and its four piece positions, given in ascending
+    order, into the `SEAT_BITS` bits that `state_key` uses per seat.
+    """
+    first, second, third, fourth = sorted_positions
+    key = _COLOR_CODES[color]
+    key = (key << POSITION_BITS) | (first + 1)
+    key = (key << POSITION_BITS) | (second + 1)
+    key = (key << POSITION_BITS) | (third + 1)
+    return (key << POSITION_BITS) | (fourth + 1)
+
+
+def state_key(game_state: AnyGameState) -> StateKey:
+    """
+    Returns the canonical key of a position, in time linear in the number of
+    pieces.
+
+    Two states get the same key exactly when they have the same seat colors,
+    the same multiset of piece positions per seat, the same player to move
+    and the same consecutive sixes (up to 3).
+    """
+    key = 0
+    if isinstance(game_state, CompactState):
+        positions = game_state.positions.tolist()
+        for base, color in zip(
+            range(0, len(positions), PIECES_PER_PLAYER), game_state.colors, strict=True
+        ):
+            seat = pack_seat(color, sorted(positions[base : base + PIECES_PER_PLAYER]))
+            key = (key << SEAT_BITS) | seat
+        num_players = len(game_state.colors)
+    else:
+        for player in game_state.players:
+            first, second, third, fourth = player.pieces
+            seat = pack_seat(
+                player.color,
+                sorted([first.position, second.position, third.position, fourth.position]),
+            )
+            key = (key << SEAT_BITS) | seat
+        num_players = len(game_state.players)
+    key = (key << PLAYER_COUNT_BITS) | num_players
+    key = (key << PLAYER_INDEX_BITS) | game_state.current_player_index
+    return (key << SIXES_BITS) | min(game_state.consecutive_sixes, MAX_KEYED_SIXES)
+
+
+def unpack_state_key(
+    key: StateKey,
+) -> Tuple[List[Tuple[PlayerColor, Tuple[int, ...]]], int, int]:
+    """
+    Splits a state key back into its parts.
+
+    Returns:
+        The (color, sorted piece positions) of each seat in seat order, the
+        current player index and the consecutive sixes (capped at 3).
+    """
+    sixes = key & MAX_KEYED_SIXES
+    key >>= SIXES_BITS
+    current_player_index = key & ((1 << PLAYER_INDEX_BITS) - 1)
+    key >>= PLAYER_INDEX_BITS
+    num_players = key & ((1 << PLAYER_COUNT_BITS) - 1)
+    key >>= PLAYER_COUNT_BITS
+
+    seats = []
+    for _ in range(num_players):
+        positions = []
+        for _ in range(PIECES_PER_PLAYER):
+            positions.append((key & _POSITION_MASK) - 1)
+            key >>= POSITION_BITS
+        color = _COLORS_BY_CODE[key & ((1 << COLOR_BITS) - 1)]
+        key >>= COLOR_BITS
+        seats.append((color, tuple(reversed(positions))))
+    seats.reverse()
+    return seats, current_player_index, sixes
@@ -0,0 +1,219 @@
+"""
+Multi-process tournaments between bot strategies.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ludo.simulation import DEFAULT_MAX_TURNS, play_game
+
+
+@dataclass(frozen=True)
+class _Chunk:
+    """A contiguous range of games handed to one worker."""
+
+    lineup: Tuple[str, ...]
+    start: int
+    stop: int
+    seed: int
+    rotate_seats: bool
+    max_turns: int
+    three_six_forfeit: bool
+    use_blocking_rule: bool
+
+
+@dataclass
+class TournamentResult:
+    """
+    Merged outcome of a tournament.
+
+    Attributes:
+        lineup: The strategy names in their base seat order.
+        games: The number of games played.
+        seat_wins: Wins per seat index.
+        strategy_wins: Wins per strategy name.
+        strategy_games: Games played per strategy name, counting a strategy
+            once per seat it occupies.
+        unfinished: Games abandoned after the turn limit.
+        total_turns: Dice rolls played over all games.
+        elapsed: Wall-clock seconds.
+        workers: The number of worker processes used.
+    """
+
+    lineup: List[str]
+    games: int = 0
+    seat_wins: List[int] = field(default_factory=list)
+    strategy_wins: Dict[str, int] = field(default_factory=dict)
+    strategy_games: Dict[str, int] = field(default_factory=dict)
+    unfinished: int = 0
+    total_turns: int = 0
+    elapsed: float = 0.0
+    workers: int = 1
+
+    def __post_init__(self):
+        if not self.seat_wins:
+            self.seat_wins = [0] * len(self.lineup)
+        for name in self.lineup:
+            self.strategy_wins.setdefault(name, 0)
+            self.strategy_games.setdefault(name, 0)
+
+    def merge(self, other: "TournamentResult") -> None:
+        """Adds the counts of another (partial) result to this one."""
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.total_turns += other.total_turns
+        for seat, wins in enumerate(other.seat_wins):
+            self.seat_wins[seat] += wins
+        for name, wins in other.strategy_wins.items():
+            self.strategy_wins[name] = self.strategy_wins.get(name, 0) + wins
+        for name, games in other.strategy_games.items():
+            self.strategy_games[name] = self.strategy_games.get(name, 0) + games
+
+    @property
+    def average_turns(self) -> float:
+        """The mean number of dice rolls per game."""
+        return self.total_turns / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Tournament throughput."""
+        return self.games / self.elapsed if self.elapsed > 0 else 0.0
+
+    def seat_win_rate(self, seat: int) -> float:
+        """The fraction of games won from `seat`."""
+        return self.seat_wins[seat] / self.games if self.games else 0.0
+
+    def strategy_win_rate(self, name: str) -> float:
+        """The fraction of its games (per seat occupied) that `name` won."""
+        games = self.strategy_games.get(name, 0)
+        return self.strategy_wins.get(name, 0) / games if games else 0.0
+
+    def seat_confidence_interval(self, seat: int, z: float = 1.96) -> Tuple[float, float]:
+        """The Wilson score interval of the win rate from `seat`."""
+        return wilson_interval(self.seat_wins[seat], self.games, z)
+
+    def strategy_confidence_interval(self, name: str, z: float = 1.96) -> Tuple[float, float]:
+        """The Wilson score interval of the win rate of strategy `name`."""
+        return wilson_interval(self.strategy_wins.get(name, 0), self.strategy_games.get(name, 0), z)
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> Tuple[float, float]:
+    """
+    Computes the Wilson score confidence interval of a binomial proportion.
+
+    Args:
+        successes: The number of successes.
+        trials: The number of trials.
+        z: The standard normal quantile; 1.96 gives a 95% interval.
+
+    Returns:
+        The `(low, high)` bounds, or `(0.0, 1.0)` if there were no trials.
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def seat_order(lineup: Sequence[str], game_index: int, rotate_seats: bool) -> List[str]:
+    """Returns the strategies by seat for a game, rotating the lineup if requested."""
+    if not rotate_seats:
+        return list(lineup)
+    shift = game_index % len(lineup)
+    return list(lineup[shift:]) + list(lineup[:shift])
+
+
+def _play_chunk(chunk: _Chunk) -> TournamentResult:
+    """Plays the games of one chunk; runs inside a worker process."""
+    result = TournamentResult(lineup=list(chunk.lineup))
+    for index in range(chunk.start, chunk.stop):
+        seats = seat_order(chunk.lineup, index, chunk.rotate_seats)
+        game = play_game(
+            seats,
+            seed=chunk.seed + index,
+            max_turns=chunk.max_turns,
+            three_six_forfeit=chunk.three_six_forfeit,
+            use_blocking_rule=chunk.use_blocking_rule,
+        )
+        result.games += 1
+        result.total_turns += game.turns
+        for name in seats:
+            result.strategy_games[name] += 1
+        if game.winner is None:
+            result.unfinished += 1
+        else:
+            result.seat_wins[game.winner] += 1
+            result.strategy_wins[seats[game.winner]] += 1
+    return result
+
+
+def run_tournament(
+    lineup: Sequence[str],
+    num_games: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    rotate_seats: bool = False,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+) -> TournamentResult:
+    """
+    Plays `num_games` games between strategies across a pool of worker processes.
+
+    Game `i` is always seeded with `seed + i` (and, with `rotate_seats`, always
+    uses the same seating), so the merged result does not depend on the number
+    of workers or the chunk size.
+
+    Args:
+        lineup: The registered strategy name for each seat.
+        num_games: The number of games to play.
+        seed: The base seed.
+        workers: The number of worker processes. Defaults to the CPU count;
+            1 plays every game in the calling process.
+        chunk_size: The number of games per work unit. Defaults to a size that
+            gives each worker about four chunks.
+        rotate_seats: If True, game `i` shifts the lineup by `i` seats so every
+            strategy plays from every seat.
+        max_turns: The number of rolls after which a game is abandoned.
+        three_six_forfeit: Enables the "three consecutive sixes" rule.
+        use_blocking_rule: Enables the blocking rule.
+
+    Returns:
+        The merged TournamentResult.
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, math.ceil(num_games / (workers * 4)))
+    chunks = [
+        _Chunk(
+            lineup=tuple(lineup),
+            start=start,
+            stop=min(start + chunk_size, num_games),
+            seed=seed,
+            rotate_seats=rotate_seats,
+            max_turns=max_turns,
+            three_six_forfeit=three_six_forfeit,
+            use_blocking_rule=use_blocking_rule,
+        )
+        for start in range(0, num_games, chunk_size)
+    ]
+
+    result = TournamentResult(lineup=list(lineup), workers=workers)
+    start_time = time.perf_counter()
+    if workers == 1:
+        for chunk in chunks:
+            result.merge(_play_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(_play_chunk, chunks):
+                result.merge(partial)
+    result.elapsed = time.perf_counter() - start_time
+    return result
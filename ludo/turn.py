@@ -0,0 +1,153 @@
+"""
+Turn sequencing (sixes, forfeits, extra turns) shared by games and searches.
+
+`Game.play_turn` is built from these functions, and bots that look ahead use
+them on copies of the state so that simulated turns follow exactly the same
+rules as real ones.
+"""
+
+from typing import Callable, List
+
+from ludo.events import NULL_SINK, EventSink
+from ludo.move import AnyGameState, AnyPiece, Move, MoveRecord, move_piece
+from ludo.rules import Rules
+
+# Picks one of the legal moves for the current player of the given state
+ChooseMove = Callable[[List[Move], AnyGameState], Move]
+
+
+def next_player(game_state: AnyGameState) -> None:
+    """Passes the turn to the next player and resets the consecutive sixes."""
+    game_state.current_player_index = (game_state.current_player_index + 1) % len(
+        game_state.players
+    )
+    game_state.consecutive_sixes = 0
+
+
+def begin_turn(
+    game_state: AnyGameState,
+    roll: int,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+    events: EventSink = NULL_SINK,
+) -> List[Move]:
+    """
+    Records a roll for the current player and returns the legal moves.
+
+    If the roll forfeits the turn or there is nothing to move, the turn is
+    already settled when this returns an empty list: it has passed to the next
+    player, or the current player keeps it after rolling a 6.
+
+    Args:
+        game_state: The state to play the turn on.
+        roll: The integer result of the dice roll.
+        three_six_forfeit: Enables the "three consecutive sixes" rule.
+        use_blocking_rule: Enables the blocking rule.
+        events: Notified of the roll, a forfeit, no legal moves, extra turns
+            and, if the turn is over, its end.
+
+    Returns:
+        The current player's legal moves, which is empty if the turn is over.
+    """
+    player = game_state.players[game_state.current_player_index]
+    game_state.dice_roll = roll
+    events.on_roll(player, roll)
+
+    if roll == 6:
+        game_state.consecutive_sixes += 1
+    else:
+        game_state.consecutive_sixes = 0
+
+    if three_six_forfeit and game_state.consecutive_sixes == 3:
+        events.on_forfeit(player)
+        next_player(game_state)
+        events.on_turn_end(player, game_state.players[game_state.current_player_index])
+        return []
+
+    legal_moves = Rules.get_legal_moves(game_state, roll, use_blocking_rule)
+    if not legal_moves:
+        events.on_no_moves(player, roll)
+        if roll != 6:
+            next_player(game_state)
+        else:
+            # If roll is 6, player keeps the turn for another roll.
+            events.on_extra_turn(player)
+        events.on_turn_end(player, game_state.players[game_state.current_player_index])
+    return legal_moves
+
+
+def apply_move(
+    game_state: AnyGameState, piece: AnyPiece, roll: int, events: EventSink = NULL_SINK
+) -> MoveRecord:
+    """
+    Moves the current player's chosen piece and reports the move and any
+    captures, without ending the turn. `end_turn` completes it.
+    """
+    player = game_state.players[game_state.current_player_index]
+    record = move_piece(game_state, piece, roll)
+    events.on_move(player, record)
+    for captured in record.captured:
+        events.on_capture(player, captured)
+    return record
+
+
+def end_turn(game_state: AnyGameState, roll: int, events: EventSink = NULL_SINK) -> None:
+    """
+    Settles the turn after a move: reports a win, or passes the turn to the
+    next player unless the roll was a 6.
+    """
+    player = game_state.players[game_state.current_player_index]
+    if game_state.is_game_over:
+        events.on_win(player)
+    elif roll != 6:
+        next_player(game_state)
+    else:
+        events.on_extra_turn(player)
+    events.on_turn_end(player, game_state.players[game_state.current_player_index])
+
+
+def finish_turn(
+    game_state: AnyGameState, piece: AnyPiece, roll: int, events: EventSink = NULL_SINK
+) -> MoveRecord:
+    """
+    Applies the current player's chosen move and ends the turn.
+
+    The turn passes to the next player unless the move won the game or the
+    roll was a 6.
+
+    Args:
+        game_state: The state the turn is played on.
+        piece: The piece chosen from the legal moves returned by `begin_turn`.
+        roll: The integer result of the dice roll.
+        events: Notified of the move, captures, a win, extra turns and the
+            turn's end.
+
+    Returns:
+        The MoveRecord of the move.
+    """
+    record = apply_move(game_state, piece, roll, events)
+    end_turn(game_state, roll, events)
+    return record
+
+
+def play_turn(
+    game_state: AnyGameState,
+    roll: int,
+    choose: ChooseMove,
+    three_six_forfeit: bool = True,
+    use_blocking_rule: bool = True,
+    events: EventSink = NULL_SINK,
+) -> bool:
+    """
+    Plays a whole turn: `begin_turn`, then `choose`, then `finish_turn`.
+
+    Returns:
+        True if a piece was moved, False if the turn was forfeited or there
+        were no legal moves.
+    """
+    legal_moves = begin_turn(game_state, roll, three_six_forfeit, use_blocking_rule, events)
+    if not legal_moves:
+        return False
+    piece, _ = choose(legal_moves, game_state)
+    finish_turn(game_state, piece, roll, events)
+    return True
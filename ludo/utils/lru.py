@@ -0,0 +1,71 @@
+"""
+Bounded least-recently-used cache.
+"""
+
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A mapping that holds at most `maxsize` entries and evicts the least
+    recently used one when full.
+
+    Lookups through `get` count as uses and are tallied in `hits` and `misses`.
+
+    Attributes:
+        maxsize (int): The maximum number of entries.
+        hits (int): Lookups that found an entry.
+        misses (int): Lookups that found nothing.
+        evictions (int): Entries dropped to make room.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[K, V] = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        """Returns the entry for `key` and marks it as recently used, or None."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Stores `value` under `key`, evicting the least recently used entry if full."""
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = value
+
+    def clear(self) -> None:
+        """Removes every entry and resets the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that found an entry."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
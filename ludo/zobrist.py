@@ -0,0 +1,65 @@
+"""
+Zobrist hashing of game positions.
+
+Every (color, piece id, position) combination has a fixed random 64-bit key,
+and the hash of a set of pieces is the XOR of their keys. Moving a piece
+therefore changes the hash by two XORs, which `move_piece` and `undo_move`
+apply incrementally. The player to move and the consecutive sixes are mixed
+in separately by `position_key`.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Iterable, List
+
+from ludo.board import HOME_POSITION
+from ludo.utils.constants import PlayerColor
+
+if TYPE_CHECKING:
+    from ludo.move import AnyGameState
+
+PIECES_PER_COLOR = 4
+# Consecutive sixes beyond this count share a key; they never change the rules
+MAX_HASHED_SIXES = 3
+MAX_PLAYERS = len(PlayerColor)
+
+# A fixed seed keeps hashes stable across runs and processes
+_rng = random.Random(0x10D0)
+# PIECE_KEYS[color][piece_id][position + 1] for positions -1 (yard) to HOME
+PIECE_KEYS = {
+    color: [
+        [_rng.getrandbits(64) for _ in range(HOME_POSITION + 2)] for _ in range(PIECES_PER_COLOR)
+    ]
+    for color in PlayerColor
+}
+TURN_KEYS: List[int] = [_rng.getrandbits(64) for _ in range(MAX_PLAYERS)]
+SIXES_KEYS: List[int] = [_rng.getrandbits(64) for _ in range(MAX_HASHED_SIXES + 1)]
+del _rng
+
+
+def piece_key(color: PlayerColor, piece_id: int, position: int) -> int:
+    """Returns the key of one piece at one position."""
+    return PIECE_KEYS[color][piece_id][position + 1]
+
+
+def hash_pieces(players: Iterable) -> int:
+    """Computes the piece hash of the given players from scratch."""
+    key = 0
+    for player in players:
+        keys = PIECE_KEYS[player.color]
+        for piece in player.pieces:
+            key ^= keys[piece.id][piece.position + 1]
+    return key
+
+
+def position_key(game_state: AnyGameState) -> int:
+    """
+    Returns the hash of a whole position: the pieces, the player to move and
+    the consecutive sixes. Uses the state's incrementally maintained piece hash.
+    """
+    return (
+        game_state.zobrist
+        ^ TURN_KEYS[game_state.current_player_index]
+        ^ SIXES_KEYS[min(game_state.consecutive_sixes, MAX_HASHED_SIXES)]
+    )
@@ -0,0 +1,85 @@
+"""
+Tests for the SQLite game archive.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from ludo.archive import ArchiveEntry, GameArchive, archive_games
+from ludo.player import Player
+from ludo.records import GameRecord, play_recorded_game
+from ludo.replay import Replay
+from ludo.simulation import create_game
+from ludo.state import GameState
+from ludo.utils.constants import PlayerColor
+
+
+def test_archive_games_round_trip(tmp_path: Path):
+    """Tests that archived games load back with their log and outcome."""
+    with GameArchive(tmp_path / "games.db") as archive:
+        ids = archive_games(archive, ["greedy", "random"], 6, seed=20, batch_size=4)
+        assert len(archive) == 6
+
+        game_id = ids[2]
+        outcome = archive.outcome(game_id)
+        assert outcome == play_recorded_game(["greedy", "random"], seed=22)
+        turns = archive.load_turns(game_id)
+        assert len(turns) == outcome.turns
+        replay = Replay.from_seed(22, ["greedy", "random"], turns)
+        assert replay.final_state() == archive.load_game(game_id)
+
+
+def test_saved_game_without_outcome(tmp_path: Path):
+    """Tests storing a plain snapshot, and the errors for unknown ids."""
+    state = GameState(
+        players=[Player(PlayerColor.RED, "human"), Player(PlayerColor.GREEN, "greedy")],
+        dice_roll=4,
+        dice_seed=5,
+    )
+    with GameArchive(tmp_path / "games.db") as archive:
+        game_id = archive.add_game(state)
+        assert archive.load_game(game_id) == state
+        assert archive.load_turns(game_id) == []
+        assert archive.outcome(game_id) is None
+        assert archive.find_games(strategy="human", won=False) == []
+        with pytest.raises(KeyError):
+            archive.load_game(game_id + 1)
+
+
+def test_find_games(tmp_path: Path):
+    """Tests each search criterion, alone and combined."""
+    state = create_game(["greedy", "random", "greedy"], seed=1).state
+
+    def entry(winner, seed, day):
+        order = [winner] + [seat for seat in range(3) if seat != winner]
+        record = GameRecord(seed, ["greedy", "random", "greedy"], winner, 100, [0, 0, 0], order)
+        return ArchiveEntry(state, record, created_at=day * 86400.0)
+
+    with GameArchive(tmp_path / "games.db") as archive:
+        ids = archive.add_games(
+            [entry(0, 1, 1), entry(1, 2, 2), entry(2, 3, 3), entry(1, 4, 4)], batch_size=3
+        )
+        assert archive.find_games(strategy="greedy", seat=0, won=False) == ids[1:]
+        assert archive.find_games(strategy="greedy", won=True) == [ids[0], ids[2]]
+        assert archive.find_games(strategy="random", won=True, since=3 * 86400.0) == [ids[3]]
+        assert archive.find_games(winner=1, limit=1) == [ids[1]]
+        assert archive.find_games(seed=3) == [ids[2]]
+        assert archive.find_games(until=2 * 86400.0) == [ids[0]]
+        assert archive.find_games() == ids
+        outcome = archive.outcome(ids[2])
+        assert outcome is not None
+        assert outcome.finish_order == [2, 0, 1]
+
+
+def test_archive_uses_wal_and_checks_its_version(tmp_path: Path):
+    """Tests the journal mode and that archives of another version are refused."""
+    path = tmp_path / "games.db"
+    with GameArchive(path) as archive:
+        assert archive.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA user_version = 99")
+    connection.close()
+    with pytest.raises(ValueError, match="Schema version mismatch"):
+        GameArchive(path)
@@ -0,0 +1,131 @@
+"""
+Tests for the vectorized batch engine.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ludo.batch import (  # noqa: E402
+    POLICIES,
+    BatchGames,
+    first_policy,
+    greedy_policy,
+    random_policy,
+    run_batch,
+)
+from ludo.bots.greedy_bot import GreedyBot  # noqa: E402
+from ludo.dice import Dice  # noqa: E402
+from ludo.game import Game  # noqa: E402
+from ludo.player import Player  # noqa: E402
+from ludo.rules import Rules  # noqa: E402
+from ludo.utils.constants import PlayerColor  # noqa: E402
+
+
+class ScriptedStrategy:
+    """Moves whichever piece the batch engine chose for this turn."""
+
+    def __init__(self):
+        self.piece_id = -1
+
+    def choose_move(self, legal_moves, game_state):
+        return next(move for move in legal_moves if move[0].id == self.piece_id)
+
+
+@pytest.mark.parametrize(
+    "policy, num_players, use_blocking_rule, three_six_forfeit",
+    [
+        (random_policy, 4, True, True),
+        (random_policy, 2, False, True),
+        (random_policy, 3, True, False),
+        (greedy_policy, 4, True, True),
+        (first_policy, 4, True, True),
+    ],
+)
+def test_batch_matches_scalar_game(policy, num_players, use_blocking_rule, three_six_forfeit):
+    """
+    Tests that every turn of a batch of games, given the same rolls and the
+    same choices, leaves each game exactly as the scalar Game leaves it, and
+    that the batch agrees with Rules on the legal moves and with GreedyBot and
+    the first legal move on the choices.
+    """
+    num_games = 40
+    rng = np.random.default_rng(11)
+    batch = BatchGames(num_games, num_players, three_six_forfeit, use_blocking_rule)
+    scripts = [ScriptedStrategy() for _ in range(num_games)]
+    games = [
+        Game(
+            players=[
+                Player(color=color, role="random") for color in list(PlayerColor)[:num_players]
+            ],
+            strategies=[scripts[g]] * num_players,
+            dice=Dice(),
+            three_six_forfeit=three_six_forfeit,
+            use_blocking_rule=use_blocking_rule,
+        )
+        for g in range(num_games)
+    ]
+    greedy = GreedyBot()
+    rolls_by_game = {}
+
+    def choose(indices, moves):
+        chosen = policy(moves, rng)
+        for g, legal, piece_id in zip(indices.tolist(), moves.legal, chosen.tolist(), strict=True):
+            state = games[g].state
+            state.dice_roll = rolls_by_game[g]
+            expected = Rules.get_legal_moves(state, rolls_by_game[g], use_blocking_rule)
+            assert sorted(p.id for p, _ in expected) == np.flatnonzero(legal).tolist()
+            if policy is greedy_policy:
+                assert greedy.choose_move(expected, state)[0].id == piece_id
+            elif policy is first_policy:
+                assert expected[0][0].id == piece_id
+        return chosen
+
+    for _ in range(5000):
+        active = np.flatnonzero(~batch.over)
+        if not len(active):
+            break
+        rolls = rng.integers(1, 7, size=len(active))
+        rolls_by_game = dict(zip(active.tolist(), rolls.tolist(), strict=True))
+        moved = batch.play_turn(active, rolls, choose)
+        for g, roll, piece_id in zip(active.tolist(), rolls.tolist(), moved.tolist(), strict=True):
+            scripts[g].piece_id = piece_id
+            assert games[g].play_turn(roll) == (piece_id >= 0)
+            assert batch.to_game_state(g) == games[g].state
+    assert batch.over.all()
+
+
+def test_winners_and_turns_are_reported():
+    """Tests that finished games report the seat that won."""
+    batch = BatchGames(50, num_players=2)
+    batch.play([POLICIES["greedy"], POLICIES["random"]], np.random.default_rng(3))
+    assert batch.over.all()
+    assert set(batch.winners.tolist()) <= {0, 1}
+    assert (batch.turns > 0).all()
+    for g in range(50):
+        state = batch.to_game_state(g)
+        assert state.is_game_over
+        assert state.current_player_index == batch.winners[g]
+
+
+def test_run_batch_is_reproducible():
+    """Tests that a seeded batch always produces the same results."""
+    first = run_batch(["greedy", "random", "random"], 200, seed=5)
+    second = run_batch(["greedy", "random", "random"], 200, seed=5)
+    assert first.wins == second.wins
+    assert first.total_turns == second.total_turns
+    assert first.games == 200
+    assert sum(first.wins) + first.unfinished == 200
+
+
+def test_run_batch_respects_max_turns():
+    """Tests that games are abandoned after the turn limit."""
+    result = run_batch(["random", "random"], 20, seed=1, max_turns=10)
+    assert result.unfinished == 20
+    assert result.total_turns == 200
+
+
+def test_run_batch_rejects_unknown_policies():
+    """Tests that an unknown policy name is reported."""
+    with pytest.raises(ValueError, match="Unknown policy: minimax"):
+        run_batch(["random", "minimax"], 1)
@@ -0,0 +1,55 @@
+"""
+Tests for the benchmark runner.
+"""
+
+import json
+
+from benchmarks.cases import CASES, Case, sample_positions
+from benchmarks.runner import CaseResult, compare, load_baseline, main, measure
+
+
+def _result(name: str, median: float) -> CaseResult:
+    return CaseResult(name, 1, 1, median, median, median, 0.0)
+
+
+def test_measure_reports_time_per_operation():
+    """Tests that samples cover the minimum time and are divided by the operations."""
+    calls = []
+    case = Case("noop", lambda: (lambda: calls.append(1), 10))
+    result = measure(case, repeats=3, warmup=1, min_sample_time=0.0)
+    assert result.repeats == 3
+    assert result.operations == 10
+    assert len(calls) == 4
+    assert 0 <= result.min <= result.median
+    assert result.ops_per_second > 0
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold():
+    """Tests regression detection against a baseline."""
+    baseline = {"fast": {"median": 1.0}, "slow": {"median": 1.0}}
+    results = [_result("fast", 1.1), _result("slow", 1.3), _result("new", 9.0)]
+    regressions = compare(results, baseline, threshold=0.15)
+    assert [r.name for r in regressions] == ["slow"]
+    assert round(regressions[0].slowdown, 6) == 0.3
+
+
+def test_positions_are_reproducible():
+    """Tests that the sampled positions come from fixed seeds."""
+    first = [(s.to_serializable(), r) for s, r in sample_positions(count=50)]
+    second = [(s.to_serializable(), r) for s, r in sample_positions(count=50)]
+    assert first == second
+
+
+def test_main_saves_and_compares_a_baseline(tmp_path, capsys):
+    """Tests a baseline round trip from the command line on one fast case."""
+    baseline = tmp_path / "baseline.json"
+    args = ["-k", "rules.get_legal_moves", "--repeats", "2", "--baseline", str(baseline)]
+    assert main(args + ["--save-baseline"]) == 0
+    assert list(load_baseline(baseline)) == ["rules.get_legal_moves"]
+
+    data = json.loads(baseline.read_text())
+    data["cases"][0]["median"] /= 100  # Pretend the code used to be much faster
+    baseline.write_text(json.dumps(data))
+    assert main(args) == 1
+    assert "REGRESSION rules.get_legal_moves" in capsys.readouterr().err
+    assert "rules.get_legal_moves" in CASES
@@ -0,0 +1,99 @@
+"""
+Tests for the compact binary save format.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ludo.binary_format import BINARY_VERSION, MAGIC, decode_state, encode_state
+from ludo.persistence import load_game, resolve_format, save_game
+from ludo.player import Player
+from ludo.simulation import create_game
+from ludo.state import GameState
+from ludo.utils.constants import PieceState, PlayerColor
+
+
+def _midgame_states():
+    """Yields states from seeded games at various points, including the end."""
+    for seed in range(3):
+        game = create_game(["random", "greedy", "random"], seed=seed)
+        turns = 0
+        while not game.state.is_game_over:
+            game.take_turn()
+            turns += 1
+            if turns % 40 == 0 or game.state.is_game_over:
+                yield game.state
+
+
+def test_encode_decode_round_trip():
+    """Tests that decoding an encoded state gives an equal state."""
+    for state in _midgame_states():
+        assert decode_state(encode_state(state)) == state
+
+
+def test_binary_save_is_compact():
+    """Tests that a two-player save takes a few dozen bytes."""
+    state = GameState(
+        players=[Player(PlayerColor.RED, "human"), Player(PlayerColor.BLUE, "greedy")],
+        dice_seed=123,
+    )
+    data = encode_state(state)
+    assert data.startswith(MAGIC)
+    assert len(data) == 18 + 2 * 5 + len(b"\x05human\x06greedy")
+
+
+def test_formats_round_trip_through_each_other(tmp_path: Path):
+    """Tests that JSON -> binary -> JSON conversion reproduces the JSON save."""
+    for state in _midgame_states():
+        save_game(state, tmp_path / "a.json")
+        save_game(load_game(tmp_path / "a.json"), tmp_path / "b.ludo")
+        save_game(load_game(tmp_path / "b.ludo"), tmp_path / "c.json")
+        assert (tmp_path / "c.json").read_text() == (tmp_path / "a.json").read_text()
+
+
+def test_format_chosen_by_extension_or_flag(tmp_path: Path):
+    """Tests that .ludo and .bin files are binary unless a format is given."""
+    state = GameState(players=[Player(PlayerColor.GREEN, "random")], dice_roll=6)
+    assert resolve_format("game.bin") == resolve_format("GAME.LUDO") == "binary"
+    assert resolve_format("game.json") == resolve_format("game.save") == "json"
+
+    save_game(state, tmp_path / "game.save", file_format="binary")
+    assert (tmp_path / "game.save").read_bytes().startswith(MAGIC)
+    assert load_game(tmp_path / "game.save", file_format="binary") == state
+
+    save_game(state, tmp_path / "game.ludo", file_format="json")
+    assert json.loads((tmp_path / "game.ludo").read_text())["dice_roll"] == 6
+    with pytest.raises(ValueError, match="Unknown save format"):
+        save_game(state, tmp_path / "game.xml", file_format="xml")
+
+
+def test_decode_rejects_bad_data():
+    """Tests that foreign, mismatched, truncated and padded data is rejected."""
+    data = encode_state(GameState(players=[Player(PlayerColor.RED, "greedy")]))
+    with pytest.raises(ValueError, match="Not a binary Ludo save"):
+        decode_state(b"{}")
+    with pytest.raises(ValueError, match="Schema version mismatch"):
+        decode_state(data[:4] + bytes([BINARY_VERSION + 1]) + data[5:])
+    with pytest.raises(ValueError, match="truncated|malformed"):
+        decode_state(data[:-1])
+    with pytest.raises(ValueError, match="trailing data"):
+        decode_state(data + b"\x00")
+
+
+def test_encode_rejects_unrepresentable_states():
+    """Tests that states the format cannot hold exactly are refused."""
+    player = Player(PlayerColor.RED, "greedy")
+    player.pieces[1].color = PlayerColor.BLUE
+    with pytest.raises(ValueError, match="pieces 0-3"):
+        encode_state(GameState(players=[player]))
+
+    player = Player(PlayerColor.RED, "greedy")
+    player.pieces[0].state = PieceState.TRACK
+    player.pieces[0].position = 70
+    with pytest.raises(ValueError, match="position 70"):
+        encode_state(GameState(players=[player]))
+
+    with pytest.raises(ValueError, match="64 bits"):
+        encode_state(GameState(players=[], dice_seed=2**64))
@@ -1,6 +1,6 @@
 import pytest
 
-from ludo.board import START_SQUARES
+from ludo.board import HOME_POSITION, MOVE_TABLE, START_SQUARES, compute_move
 from ludo.bots.human_bot import HumanBot
 from ludo.dice import Dice
 from ludo.game import Game
@@ -57,3 +57,26 @@ def test_move_piece_on_track(game):
     # Post-condition
     assert piece_to_move.state == PieceState.TRACK
     assert piece_to_move.position == 14
+
+
+def test_move_table_matches_compute_move():
+    """
+    Tests that the precomputed move table agrees with compute_move for every
+    color, position and die roll.
+    """
+    for color in PlayerColor:
+        for position in range(-1, HOME_POSITION + 1):
+            for roll in range(1, 7):
+                assert MOVE_TABLE[color][position + 1][roll] == compute_move(color, position, roll)
+
+
+def test_move_table_entries():
+    """Tests representative table entries for yard, track, home column and overshoot."""
+    green = MOVE_TABLE[PlayerColor.GREEN]
+    assert green[-1 + 1][6] == (START_SQUARES[PlayerColor.GREEN], PieceState.TRACK)
+    assert green[-1 + 1][5] is None  # Leaving the yard needs a 6
+    assert green[50 + 1][3] == (1, PieceState.TRACK)  # Wraps around the track
+    assert green[11 + 1][1] == (52, PieceState.HOME_COLUMN)  # Enters the home column
+    assert green[11 + 1][6] == (57, PieceState.HOME)  # Exact roll reaches HOME
+    assert green[55 + 1][3] is None  # Overshoots HOME
+    assert green[HOME_POSITION + 1][1] is None  # Pieces at HOME never move
@@ -2,14 +2,20 @@
 Tests for bot strategies.
 """
 
+import copy
+import random
+import time
 from typing import List
 
 import pytest
 
 from ludo.board import START_SQUARES
 from ludo.bots.base import Strategy
+from ludo.bots.expectiminimax_bot import ExpectiminimaxBot
 from ludo.bots.greedy_bot import GreedyBot
+from ludo.bots.mcts_bot import MCTSBot
 from ludo.bots.random_bot import RandomBot
+from ludo.compact import CompactState
 from ludo.move import Move
 from ludo.piece import Piece
 from ludo.player import Player
@@ -83,6 +89,20 @@ def test_random_bot():
     assert chosen_move in legal_moves
 
 
+def test_random_bot_uses_its_own_generator():
+    """Tests that bots with equally seeded generators make the same choices."""
+    legal_moves: list[Move] = [(Piece(id=i, color=PlayerColor.GREEN), i) for i in range(4)]
+    state = GameState(players=[])
+    bot1 = RandomBot(rng=random.Random(3))
+    bot2 = RandomBot(rng=random.Random(3))
+    choices1 = []
+    for _ in range(20):
+        choices1.append(bot1.choose_move(legal_moves, state))
+        random.random()  # The global generator must not influence the bots
+    choices2 = [bot2.choose_move(legal_moves, state) for _ in range(20)]
+    assert choices1 == choices2
+
+
 def test_greedy_bot_chooses_win():
     """Test that the bot chooses a move that wins the game."""
     p1 = Player(PlayerColor.RED, role="greedy")
@@ -205,3 +225,165 @@ def test_greedy_bot_capture_tie_break():
     bot = GreedyBot()
     chosen_move = bot.choose_move(legal_moves, game_state)
     assert chosen_move[0] is p1.pieces[1]
+
+
+def test_greedy_bot_leaves_state_untouched():
+    """Test that scoring moves by applying and undoing them leaves no trace."""
+    p1 = Player(PlayerColor.RED, role="greedy")
+    p1.pieces[0].state = PieceState.TRACK
+    p1.pieces[0].position = 10  # Captures on 14
+    p2 = Player(PlayerColor.GREEN, role="greedy")
+    p2.pieces[0].state = PieceState.TRACK
+    p2.pieces[0].position = 14
+    game_state = GameState(players=[p1, p2], dice_roll=4)
+    original = copy.deepcopy(game_state)
+    legal_moves: list[Move] = [(p1.pieces[0], 14)]
+    GreedyBot().choose_move(legal_moves, game_state)
+    assert game_state == original
+    assert p2.pieces[0].state == PieceState.TRACK
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_mcts_bot_stops_an_opponent_about_to_win(workers):
+    """
+    Tests that the search, in one process or root-parallel, captures the last
+    piece of an opponent close to winning.
+    """
+    p1 = Player(PlayerColor.RED, role="mcts")
+    p1.pieces[0].state = PieceState.TRACK
+    p1.pieces[0].position = 6  # Captures on 9 with a 3
+    p1.pieces[1].state = PieceState.TRACK
+    p1.pieces[1].position = 30
+    p2 = Player(PlayerColor.GREEN, role="greedy")
+    for piece in p2.pieces[:3]:
+        piece.state = PieceState.HOME
+        piece.position = 57
+    p2.pieces[3].state = PieceState.TRACK
+    p2.pieces[3].position = 9  # Four squares from GREEN's home column
+    game_state = GameState(players=[p1, p2], dice_roll=3)
+    legal_moves: list[Move] = [(p1.pieces[0], 9), (p1.pieces[1], 33)]
+    bot = MCTSBot(iterations=100, rng=random.Random(0), workers=workers)
+    try:
+        assert bot.choose_move(legal_moves, game_state)[0] is p1.pieces[0]
+    finally:
+        bot.close()
+
+
+def test_mcts_bot_leaves_state_untouched_and_is_reproducible():
+    """Tests that searching works on a copy and a seeded search repeats its choice."""
+    p1 = Player(PlayerColor.RED, role="mcts")
+    p1.pieces[0].state = PieceState.TRACK
+    p1.pieces[0].position = 10
+    p2 = Player(PlayerColor.GREEN, role="greedy")
+    p2.pieces[0].state = PieceState.TRACK
+    p2.pieces[0].position = 14
+    game_state = GameState(players=[p1, p2], dice_roll=6)
+    original = copy.deepcopy(game_state)
+    legal_moves: list[Move] = [(p1.pieces[1], START_SQUARES[PlayerColor.RED]), (p1.pieces[0], 16)]
+    choices = [
+        MCTSBot(iterations=30, rng=random.Random(4)).choose_move(legal_moves, game_state)
+        for _ in range(2)
+    ]
+    assert choices[0] is choices[1]
+    assert choices[0] in legal_moves
+    assert game_state == original
+
+
+def test_mcts_root_parallel_merges_every_tree():
+    """Tests that the root visit counts of all worker trees are summed."""
+    players = [Player(PlayerColor.RED, role="mcts"), Player(PlayerColor.GREEN, role="greedy")]
+    state = CompactState.from_game_state(GameState(players=players))
+    for piece in state.players[0].pieces[:2]:
+        piece.state = PieceState.TRACK
+    state.players[0].pieces[1].position = 5
+    state.dice_roll = 2
+    bot = MCTSBot(iterations=20, workers=3, rng=random.Random(1))
+    try:
+        visits = bot._search_in_parallel(state, [0, 1], 2)
+    finally:
+        bot.close()
+    assert sum(visits) == 60
+
+
+def test_mcts_bot_respects_time_budget():
+    """Tests that a time-limited search returns promptly."""
+    p1 = Player(PlayerColor.RED, role="mcts")
+    p2 = Player(PlayerColor.GREEN, role="greedy")
+    for piece in p1.pieces[:2]:
+        piece.state = PieceState.TRACK
+    p1.pieces[1].position = 5
+    game_state = GameState(players=[p1, p2], dice_roll=2)
+    legal_moves: list[Move] = [(p1.pieces[0], 2), (p1.pieces[1], 7)]
+    bot = MCTSBot(iterations=None, time_limit=0.05)
+    start = time.perf_counter()
+    assert bot.choose_move(legal_moves, game_state) in legal_moves
+    assert time.perf_counter() - start < 1.0
+
+
+def test_mcts_bot_needs_a_budget_and_moves():
+    """Tests the bot's argument and input validation."""
+    with pytest.raises(ValueError, match="budget"):
+        MCTSBot(iterations=None, time_limit=None)
+    with pytest.raises(ValueError, match="workers"):
+        MCTSBot(workers=-1)
+    with pytest.raises(ValueError, match="No legal moves"):
+        MCTSBot().choose_move([], GameState(players=[]))
+    piece = Piece(id=0, color=PlayerColor.RED)
+    state = GameState(players=[Player(PlayerColor.RED, role="mcts")])
+    with pytest.raises(ValueError, match="dice roll"):
+        MCTSBot().choose_move([(piece, 1), (piece, 2)], state)
+
+
+def test_expectiminimax_bot_stops_an_opponent_about_to_win():
+    """Tests that the search captures the last piece of an opponent close to winning."""
+    p1 = Player(PlayerColor.RED, role="expectiminimax")
+    p1.pieces[0].state = PieceState.TRACK
+    p1.pieces[0].position = 6  # Captures on 9 with a 3
+    p1.pieces[1].state = PieceState.TRACK
+    p1.pieces[1].position = 30
+    p2 = Player(PlayerColor.GREEN, role="greedy")
+    for piece in p2.pieces[:3]:
+        piece.state = PieceState.HOME
+        piece.position = 57
+    p2.pieces[3].state = PieceState.TRACK
+    p2.pieces[3].position = 9  # Four squares from GREEN's home column
+    game_state = GameState(players=[p1, p2], dice_roll=3)
+    original = copy.deepcopy(game_state)
+    legal_moves: list[Move] = [(p1.pieces[0], 9), (p1.pieces[1], 33)]
+    bot = ExpectiminimaxBot(max_depth=2, time_limit=None)
+    assert bot.choose_move(legal_moves, game_state)[0] is p1.pieces[0]
+    assert bot.depth_reached == 2
+    assert game_state == original
+
+
+def test_expectiminimax_bot_bounds_time_and_table():
+    """
+    Tests that deepening stops at the time limit and the transposition table
+    never grows past its size.
+    """
+    p1 = Player(PlayerColor.RED, role="expectiminimax")
+    p2 = Player(PlayerColor.GREEN, role="greedy")
+    for player in (p1, p2):
+        for index, piece in enumerate(player.pieces[:3]):
+            piece.state = PieceState.TRACK
+            piece.position = START_SQUARES[player.color] + 5 * index
+    game_state = GameState(players=[p1, p2], dice_roll=2)
+    legal_moves: list[Move] = [(piece, piece.position + 2) for piece in p1.pieces[:3]]
+    bot = ExpectiminimaxBot(max_depth=10, time_limit=0.05, table_size=500)
+    start = time.perf_counter()
+    assert bot.choose_move(legal_moves, game_state) in legal_moves
+    assert time.perf_counter() - start < 1.0
+    assert 1 <= bot.depth_reached < 10
+    assert 0 < len(bot.table) <= 500
+
+
+def test_expectiminimax_bot_validation():
+    """Tests the bot's argument and input validation."""
+    with pytest.raises(ValueError, match="max_depth"):
+        ExpectiminimaxBot(max_depth=0)
+    with pytest.raises(ValueError, match="No legal moves"):
+        ExpectiminimaxBot().choose_move([], GameState(players=[]))
+    piece = Piece(id=0, color=PlayerColor.RED)
+    state = GameState(players=[Player(PlayerColor.RED, role="expectiminimax")])
+    with pytest.raises(ValueError, match="dice roll"):
+        ExpectiminimaxBot().choose_move([(piece, 1), (piece, 2)], state)
@@ -0,0 +1,150 @@
+"""
+Tests for the compact array-backed game state.
+"""
+
+import random
+
+import pytest
+
+from ludo.compact import CompactState
+from ludo.move import move_piece
+from ludo.player import Player
+from ludo.rules import Rules
+from ludo.state import GameState
+from ludo.turn import next_player
+from ludo.utils.constants import PieceState, PlayerColor
+
+
+def _random_state(seed: int) -> GameState:
+    """Builds a four-player state with pieces scattered over the board."""
+    rng = random.Random(seed)
+    players = [Player(color=color, role="random") for color in PlayerColor]
+    for player in players:
+        for piece in player.pieces:
+            kind = rng.choice(list(PieceState))
+            piece.state = kind
+            if kind == PieceState.TRACK:
+                piece.position = rng.randrange(52)
+            elif kind == PieceState.HOME_COLUMN:
+                piece.position = rng.randrange(52, 57)
+            elif kind == PieceState.HOME:
+                piece.position = 57
+    return GameState(
+        players=players,
+        current_player_index=rng.randrange(4),
+        dice_roll=rng.randint(1, 6),
+        consecutive_sixes=rng.randrange(3),
+        dice_seed=seed,
+    )
+
+
+def test_round_trip_is_lossless():
+    """Tests that packing and unpacking a GameState yields an equal GameState."""
+    for seed in range(20):
+        state = _random_state(seed)
+        assert CompactState.from_game_state(state).to_game_state() == state
+
+
+def test_views_mirror_game_state():
+    """Tests that the piece views expose the same values as the dataclasses."""
+    state = _random_state(1)
+    compact = CompactState.from_game_state(state)
+    for player, view in zip(state.players, compact.players, strict=True):
+        assert view.color == player.color
+        assert view.role == player.role
+        for piece, piece_view in zip(player.pieces, view.pieces, strict=True):
+            assert piece_view.id == piece.id
+            assert piece_view.state == piece.state
+            assert piece_view.position == piece.position
+
+
+def test_view_writes_update_arrays():
+    """Tests that assigning through a view writes into the backing arrays."""
+    compact = CompactState.from_game_state(_random_state(2))
+    piece = compact.players[1].pieces[2]
+    piece.state = PieceState.TRACK
+    piece.position = 30
+    assert compact.positions[6] == 30
+    assert compact.to_game_state().players[1].pieces[2].state == PieceState.TRACK
+
+
+def test_copy_is_independent():
+    """Tests that mutating a copy leaves the original untouched."""
+    compact = CompactState.from_game_state(_random_state(3))
+    clone = compact.copy()
+    assert clone == compact
+    clone.players[0].pieces[0].position = 12
+    clone.current_player_index = (compact.current_player_index + 1) % 4
+    assert clone != compact
+
+
+def test_nonstandard_piece_layout_is_rejected():
+    """Tests that states without four ordered pieces per player are rejected."""
+    player = Player(color=PlayerColor.RED, role="human")
+    player.pieces = player.pieces[:3]
+    with pytest.raises(ValueError, match="compact states require 4"):
+        CompactState.from_game_state(GameState(players=[player]))
+
+    player = Player(color=PlayerColor.RED, role="human")
+    player.pieces.reverse()
+    with pytest.raises(ValueError, match="standard slot"):
+        CompactState.from_game_state(GameState(players=[player]))
+
+
+@pytest.mark.parametrize("roll", range(1, 7))
+def test_rules_and_moves_match_game_state(roll):
+    """
+    Tests that legal moves and move application on a CompactState agree
+    with the same operations on the equivalent GameState.
+    """
+    for seed in range(30):
+        state = _random_state(seed)
+        compact = CompactState.from_game_state(state)
+
+        moves = Rules.get_legal_moves(state, roll)
+        compact_moves = Rules.get_legal_moves(compact, roll)
+        assert [(p.id, d) for p, d in moves] == [(p.id, d) for p, d in compact_moves]
+        own_pieces = compact.players[compact.current_player_index].pieces
+        assert all(p is own_pieces[p.id] for p, _ in compact_moves)
+        unblocked = Rules.get_legal_moves(state, roll, use_blocking_rule=False)
+        assert [(p.id, d) for p, d in unblocked] == [
+            (p.id, d) for p, d in Rules.get_legal_moves(compact, roll, use_blocking_rule=False)
+        ]
+
+        for (piece, _), (compact_piece, _) in zip(moves, compact_moves, strict=True):
+            expected = CompactState.from_game_state(state).to_game_state()
+            target = expected.players[expected.current_player_index].pieces[piece.id]
+            move_piece(expected, target, roll)
+
+            actual = compact.copy()
+            target_view = actual.players[actual.current_player_index].pieces[compact_piece.id]
+            move_piece(actual, target_view, roll)
+            assert actual.to_game_state() == expected
+
+
+def test_whole_games_match_game_state():
+    """
+    Tests that random games played on a CompactState, captures and wins
+    included, follow the same course as on a GameState.
+    """
+    captures = 0
+    for seed in range(10):
+        rng = random.Random(seed)
+        state = GameState(players=[Player(color=color, role="random") for color in PlayerColor])
+        compact = CompactState.from_game_state(state)
+        while not state.is_game_over:
+            roll = rng.randint(1, 6)
+            moves = Rules.get_legal_moves(state, roll)
+            compact_moves = Rules.get_legal_moves(compact, roll)
+            if moves:
+                choice = rng.randrange(len(moves))
+                record = move_piece(state, moves[choice][0], roll)
+                compact_record = move_piece(compact, compact_moves[choice][0], roll)
+                assert [p.id for p in compact_record.captured] == [p.id for p in record.captured]
+                captures += len(record.captured)
+            if roll != 6 and not state.is_game_over:
+                next_player(state)
+                next_player(compact)
+            assert compact.to_game_state() == state
+        assert compact.is_game_over
+    assert captures > 0
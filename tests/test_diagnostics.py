@@ -0,0 +1,79 @@
+"""
+Tests for the --profile and --trace-memory options of the entry points.
+"""
+
+import io
+import pstats
+import sys
+import tracemalloc
+
+import pytest
+
+from apps.diagnostics import profiling_session
+from apps.sim.main import main
+
+
+def test_profiling_session_without_paths_does_nothing():
+    """Tests that a session with no output files neither profiles nor reports."""
+    out = io.StringIO()
+    with profiling_session(stream=out):
+        sum(range(1000))
+    assert out.getvalue() == ""
+    assert not tracemalloc.is_tracing()
+
+
+def test_profiling_session_writes_stats_on_error(tmp_path):
+    """Tests that the profile and snapshot are written even if the run fails."""
+    profile_path = tmp_path / "run.prof"
+    memory_path = tmp_path / "run.snapshot"
+    out = io.StringIO()
+    with pytest.raises(RuntimeError):
+        with profiling_session(profile_path, memory_path, top=5, stream=out):
+            blocks = [bytearray(1024) for _ in range(100)]
+            raise RuntimeError(len(blocks))
+
+    assert not tracemalloc.is_tracing()
+    assert pstats.Stats(str(profile_path)).total_calls > 0
+    assert tracemalloc.Snapshot.load(str(memory_path)).traces
+    report = out.getvalue()
+    assert f"CPU profile written to {profile_path}" in report
+    assert "Top 5 allocation sites" in report
+    assert "test_diagnostics.py" in report
+
+
+def test_sim_cli_profile_and_trace_memory(monkeypatch, capsys, tmp_path):
+    """Tests that ludo-sim writes both files and reports the hot spots on stderr."""
+    profile_path = tmp_path / "sim.prof"
+    memory_path = tmp_path / "sim.snapshot"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "ludo-sim",
+            "--games",
+            "2",
+            "--seed",
+            "1",
+            "--profile",
+            str(profile_path),
+            "--trace-memory",
+            str(memory_path),
+            "--profile-top",
+            "3",
+        ],
+    )
+    main()
+    captured = capsys.readouterr()
+    assert "Games played:    2" in captured.out
+    assert "play_game" in captured.err
+    assert "Top 3 allocation sites" in captured.err
+    assert profile_path.exists() and memory_path.exists()
+
+
+def test_sim_cli_refuses_to_profile_worker_processes(monkeypatch, tmp_path):
+    """Tests that profiling with several workers is rejected, as it would miss them."""
+    monkeypatch.setattr(
+        sys, "argv", ["ludo-sim", "--workers", "2", "--profile", str(tmp_path / "sim.prof")]
+    )
+    with pytest.raises(SystemExit):
+        main()
@@ -2,7 +2,11 @@
 Tests for the Dice class.
 """
 
-from ludo.dice import Dice
+import random
+
+import pytest
+
+from ludo.dice import BufferedDice, Dice
 
 
 def test_dice_roll_is_within_range():
@@ -30,3 +34,61 @@ def test_dice_seeding_is_reproducible():
     sequence3 = [dice3.roll() for _ in range(20)]
 
     assert sequence1 != sequence3
+
+
+def test_dice_do_not_share_random_state():
+    """
+    Tests that interleaving rolls from two seeded dice, or drawing from the
+    global random module in between, does not change either die's sequence.
+    """
+    reference = Dice(seed=7)
+    expected = [reference.roll() for _ in range(20)]
+
+    dice1 = Dice(seed=7)
+    dice2 = Dice(seed=7)
+    sequence1, sequence2 = [], []
+    for _ in range(20):
+        sequence1.append(dice1.roll())
+        random.random()
+        sequence2.append(dice2.roll())
+
+    assert sequence1 == expected
+    assert sequence2 == expected
+
+
+def test_buffered_dice_rolls_are_in_range_and_uniform():
+    """Tests that buffered rolls stay in range and hit every face evenly."""
+    dice = BufferedDice(seed=1)
+    counts = [0] * 7
+    for _ in range(60_000):
+        counts[dice.roll()] += 1
+    assert counts[0] == 0
+    assert all(9_000 < count < 11_000 for count in counts[1:])
+
+
+def test_buffered_dice_seeding_is_reproducible_across_refills():
+    """Tests that seeded buffered dice agree, whatever the block boundaries."""
+    dice1 = BufferedDice(seed=5, block_size=7)
+    dice2 = BufferedDice(seed=5, block_size=7)
+    sequence1 = [dice1.roll() for _ in range(50)]
+    assert sequence1 == [dice2.roll() for _ in range(50)]
+    assert sequence1 != [BufferedDice(seed=6, block_size=7).roll() for _ in range(50)]
+
+
+def test_buffered_dice_history_records_served_rolls():
+    """Tests that the history holds exactly the rolls served, in order."""
+    dice = BufferedDice(seed=3, block_size=4)
+    assert dice.history == []
+    rolls = [dice.roll() for _ in range(30)]
+    assert dice.history == rolls
+    assert dice.rolls_served == 30
+
+    unseeded = BufferedDice(block_size=5)
+    rolls = [unseeded.roll() for _ in range(23)]
+    assert unseeded.history == rolls
+
+
+def test_buffered_dice_rejects_empty_blocks():
+    """Tests that a non-positive block size is rejected."""
+    with pytest.raises(ValueError, match="block_size"):
+        BufferedDice(block_size=0)
@@ -3,6 +3,7 @@ import pytest
 from ludo.bots.human_bot import HumanBot
 from ludo.bots.random_bot import RandomBot
 from ludo.dice import Dice
+from ludo.events import NULL_SINK, RecordingSink
 from ludo.game import Game
 from ludo.player import Player
 from ludo.utils.constants import PieceState, PlayerColor
@@ -149,3 +150,54 @@ def test_no_legal_moves_on_6_keeps_turn(game_two_players):
     assert game.state.current_player_index == 0
     game.play_turn(6)
     assert game.state.current_player_index == 0
+
+
+def test_play_turn_is_silent_by_default(game_two_players, capsys):
+    """
+    Tests that a game without an event sink produces no output.
+    """
+    game = game_two_players
+    assert game.events is NULL_SINK
+    game.play_turn(5)  # No legal moves
+    game.play_turn(6)  # Enters a piece and earns an extra turn
+    assert capsys.readouterr().out == ""
+
+
+def test_play_turn_emits_events(game_two_players):
+    """
+    Tests that moves, captures, extra turns and turn changes are reported
+    to the event sink in order.
+    """
+    game = game_two_players
+    sink = RecordingSink()
+    game.events = sink
+    red_piece = game.state.players[0].pieces[0]
+    red_piece.state = PieceState.TRACK
+    red_piece.position = 10
+    green_piece = game.state.players[1].pieces[0]
+    green_piece.state = PieceState.TRACK
+    green_piece.position = 15
+    game.state.invalidate_occupancy()
+
+    game.play_turn(5)  # RED captures GREEN on square 15
+    game.play_turn(3)  # GREEN has no legal moves
+
+    assert sink.events == [
+        ("roll", PlayerColor.RED, 5),
+        ("move", PlayerColor.RED, 0, 15),
+        ("capture", PlayerColor.RED, PlayerColor.GREEN, 0),
+        ("roll", PlayerColor.GREEN, 3),
+        ("no_moves", PlayerColor.GREEN, 3),
+    ]
+
+
+def test_play_turn_emits_forfeit(game_two_players):
+    """
+    Tests that a third consecutive six is reported as a forfeit.
+    """
+    game = game_two_players
+    sink = RecordingSink()
+    game.events = sink
+    game.state.consecutive_sixes = 2
+    game.play_turn(6)
+    assert sink.events == [("roll", PlayerColor.RED, 6), ("forfeit", PlayerColor.RED)]
@@ -5,8 +5,9 @@ from ludo.game import Game
 from ludo.player import Player
 from ludo.bots.base import Strategy
 from ludo.dice import Dice
+from ludo.events import ConsoleSink
 from ludo.state import GameState
-from ludo.utils.constants import PlayerColor
+from ludo.utils.constants import PieceState, PlayerColor
 
 
 @pytest.fixture
@@ -49,44 +50,60 @@ def test_handle_save_invalid(mock_game):
         mock_save.assert_not_called()
         mock_print.assert_called_with("Error: Missing filepath. Usage: save <filepath>")
 
-def test_handle_roll_normal(mock_game):
+@pytest.fixture
+def console_game():
+    """Fixture for a game that reports its events on the console."""
+    players = [
+        Player(color=PlayerColor.RED, role="human"),
+        Player(color=PlayerColor.GREEN, role="random"),
+    ]
+    strategy = MagicMock(spec=Strategy)
+    strategy.choose_move.side_effect = lambda legal_moves, state: legal_moves[0]
+    dice = MagicMock(spec=Dice)
+    dice.seed = 42
+    return Game(players, [strategy, strategy], dice, events=ConsoleSink())
+
+def test_handle_roll_normal(console_game):
     """Test the roll command for a normal roll."""
-    mock_game.dice.roll.return_value = 4
-    with patch("ludo.game.Game.play_turn") as mock_play_turn, \
+    console_game.dice.roll.return_value = 4
+    with patch("ludo.game.Game.play_turn", wraps=console_game.play_turn) as mock_play_turn, \
          patch("builtins.print") as mock_print:
-        mock_game._handle_roll(mock_game.state.players[0])
+        console_game._handle_roll(console_game.state.players[0])
         mock_print.assert_any_call("Rolled a 4")
+        mock_print.assert_any_call("No legal moves available.")
         mock_play_turn.assert_called_once_with(4)
 
-def test_handle_roll_extra_turn(mock_game):
+def test_handle_roll_extra_turn(console_game):
     """Test the roll command when a 6 is rolled, granting an extra turn."""
-    mock_game.dice.roll.return_value = 6
-    # Ensure the player index doesn't change
-    mock_game.state.current_player_index = 0
-    with patch("ludo.game.Game.play_turn", side_effect=lambda _: setattr(mock_game.state, 'current_player_index', 0)), \
-         patch("builtins.print") as mock_print:
-        mock_game._handle_roll(mock_game.state.players[0])
+    console_game.dice.roll.return_value = 6
+    with patch("builtins.print") as mock_print:
+        console_game._handle_roll(console_game.state.players[0])
+        mock_print.assert_any_call("Moved piece 0 to 0")
         mock_print.assert_any_call("Got an extra turn for rolling a 6.")
+    assert console_game.state.current_player_index == 0
 
-def test_handle_roll_three_sixes_forfeit(mock_game):
+def test_handle_roll_three_sixes_forfeit(console_game):
     """Test that rolling three consecutive sixes forfeits the turn."""
-    mock_game.dice.roll.return_value = 6
-    # Simulate player index changing
-    with patch("ludo.game.Game.play_turn", side_effect=lambda _: setattr(mock_game.state, 'current_player_index', 1)), \
-         patch("builtins.print") as mock_print:
-        mock_game._handle_roll(mock_game.state.players[0])
+    console_game.dice.roll.return_value = 6
+    console_game.state.consecutive_sixes = 2
+    with patch("builtins.print") as mock_print:
+        console_game._handle_roll(console_game.state.players[0])
         mock_print.assert_any_call("Rolled three consecutive 6s. Forfeiting turn.")
+    assert console_game.state.current_player_index == 1
 
-def test_handle_roll_win(mock_game):
+def test_handle_roll_win(console_game):
     """Test the roll command when the game is won."""
-    mock_game.dice.roll.return_value = 1
-    def set_game_over(_):
-        mock_game.state.is_game_over = True
-
-    with patch("ludo.game.Game.play_turn", side_effect=set_game_over), \
-         patch("builtins.print") as mock_print:
-        mock_game._handle_roll(mock_game.state.players[0])
+    console_game.dice.roll.return_value = 1
+    pieces = console_game.state.players[0].pieces
+    for piece in pieces[:3]:
+        piece.state = PieceState.HOME
+        piece.position = 57
+    pieces[3].state = PieceState.HOME_COLUMN
+    pieces[3].position = 56
+    with patch("builtins.print") as mock_print:
+        console_game._handle_roll(console_game.state.players[0])
         mock_print.assert_any_call("--- Player RED wins! ---")
+    assert console_game.state.is_game_over
 
 def test_cli_loop_quit(mock_game):
     """Test that the CLI loop can be exited with 'quit'."""
@@ -0,0 +1,92 @@
+"""
+Tests for the append-only game journal.
+"""
+
+import copy
+from pathlib import Path
+
+import pytest
+
+from ludo.events import MultiSink, RecordingSink
+from ludo.journal import GameJournal, TurnRecord, read_journal, recover_game, replay_turn
+from ludo.simulation import create_game
+
+
+def _journaled_game(path: Path, seed: int = 4, **journal_options):
+    """Creates a seeded game whose events go to a new journal."""
+    game = create_game(["greedy", "random", "greedy"], seed=seed)
+    journal = GameJournal(path, game.state, **journal_options)
+    game.events = journal
+    return game, journal
+
+
+def test_recover_finished_game(tmp_path: Path):
+    """Tests that a whole journaled game is recovered exactly."""
+    path = tmp_path / "game.journal"
+    game, journal = _journaled_game(path, snapshot_every=0)
+    with journal:
+        while not game.state.is_game_over:
+            game.take_turn()
+
+    contents = read_journal(path)
+    assert len(contents.snapshots) == 1
+    assert path.stat().st_size == 6 + 3 + len(contents.snapshots[0][1]) + 5 * len(contents.turns)
+    assert contents.turns[-1].piece_id is not None
+    assert recover_game(path) == game.state
+
+
+def test_recover_after_torn_write(tmp_path: Path):
+    """Tests that a partial last record is ignored and cut off on resume."""
+    path = tmp_path / "game.journal"
+    game, journal = _journaled_game(path, sync_every=8, snapshot_every=25)
+    for _ in range(60):
+        game.take_turn()
+    journal.close()
+    expected = copy.deepcopy(game.state)
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02")  # A turn record cut short by a crash
+
+    assert len(read_journal(path).snapshots) == 3
+    assert recover_game(path) == expected
+
+    with GameJournal.resume(path) as resumed:
+        assert resumed.state == expected
+        game.state = resumed.state
+        game.events = resumed
+        for _ in range(30):
+            game.take_turn()
+    assert recover_game(path) == game.state
+    assert all(turn.roll in range(1, 7) for turn in read_journal(path).turns)
+
+
+def test_replay_rejects_records_that_do_not_fit(tmp_path: Path):
+    """Tests that a journaled turn that breaks the rules is refused."""
+    game = create_game(["greedy", "greedy"], seed=1)
+    state = game.state
+    with pytest.raises(ValueError, match="seat 1"):
+        replay_turn(state, TurnRecord(seat=1, roll=3, piece_id=None, next_seat=0))
+    # Every piece is in the yard, so a 3 cannot move piece 0
+    with pytest.raises(ValueError, match="piece 0"):
+        replay_turn(copy.deepcopy(state), TurnRecord(seat=0, roll=3, piece_id=0, next_seat=1))
+    with pytest.raises(ValueError, match="passes the turn"):
+        replay_turn(copy.deepcopy(state), TurnRecord(seat=0, roll=3, piece_id=None, next_seat=0))
+
+
+def test_read_rejects_other_files(tmp_path: Path):
+    """Tests that files that are not journals are refused."""
+    path = tmp_path / "game.journal"
+    path.write_bytes(b"LUDO\x01")
+    with pytest.raises(ValueError, match="Not a Ludo game journal"):
+        read_journal(path)
+
+
+def test_multi_sink_forwards_turn_ends(tmp_path: Path):
+    """Tests that every sink of a MultiSink sees each turn, ending with its turn end."""
+    recording = RecordingSink()
+    game, journal = _journaled_game(tmp_path / "game.journal")
+    game.events = MultiSink(recording, journal)
+    with journal:
+        for _ in range(10):
+            game.take_turn()
+    assert len(read_journal(tmp_path / "game.journal").turns) == 10
+    assert sum(event[0] == "roll" for event in recording.events) == 10
@@ -0,0 +1,42 @@
+"""
+Tests for the bounded LRU cache.
+"""
+
+import pytest
+
+from ludo.utils.lru import LRUCache
+
+
+def test_evicts_least_recently_used():
+    """Tests that a full cache drops the entry that was used longest ago."""
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    cache.put("a", 10)  # Updating an entry never evicts
+    assert cache.get("a") == 10
+    assert cache.evictions == 1
+
+
+def test_counts_hits_and_misses():
+    """Tests the lookup counters, the hit rate and clearing."""
+    cache: LRUCache[int, int] = LRUCache(4)
+    assert cache.hit_rate == 0.0
+    cache.put(1, 1)
+    cache.get(1)
+    cache.get(2)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
+
+
+def test_rejects_non_positive_size():
+    """Tests that the cache must be able to hold at least one entry."""
+    with pytest.raises(ValueError):
+        LRUCache(0)
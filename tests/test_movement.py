@@ -1,8 +1,14 @@
+import copy
+import random
+
 from ludo.bots.human_bot import HumanBot
 from ludo.dice import Dice
 from ludo.game import Game
-from ludo.move import move_piece
+from ludo.move import move_piece, predict_move, undo_move
+from ludo.occupancy import Occupancy
 from ludo.player import Player
+from ludo.rules import Rules
+from ludo.state import GameState
 from ludo.utils.constants import PieceState, PlayerColor
 
 
@@ -172,3 +178,97 @@ def test_no_capture_on_safe_square():
     assert red_piece.position == 13
     assert green_piece.state == PieceState.TRACK
     assert green_piece.position == 13
+
+
+def test_undo_restores_captured_pieces():
+    # Arrange
+    players = [
+        Player(color=PlayerColor.RED, role="human"),
+        Player(color=PlayerColor.GREEN, role="human"),
+    ]
+    state = GameState(players=players)
+    red_piece = players[0].pieces[0]
+    red_piece.state = PieceState.TRACK
+    red_piece.position = 10
+    for green_piece in players[1].pieces[:2]:
+        green_piece.state = PieceState.TRACK
+        green_piece.position = 15
+    original = copy.deepcopy(state)
+
+    # Act
+    record = move_piece(state, red_piece, 5)
+    assert record.captured == (players[1].pieces[0], players[1].pieces[1])
+    undo_move(state, record)
+
+    # Assert
+    assert state == original
+    assert state.occupancy == Occupancy.from_players(state.players)
+
+
+def test_undo_restores_game_over_flag():
+    # Arrange
+    player = Player(color=PlayerColor.RED, role="human")
+    for piece in player.pieces[:3]:
+        piece.state = PieceState.HOME
+        piece.position = 57
+    last_piece = player.pieces[3]
+    last_piece.state = PieceState.HOME_COLUMN
+    last_piece.position = 56
+    state = GameState(players=[player])
+
+    # Act
+    record = move_piece(state, last_piece, 1)
+    assert state.is_game_over
+    undo_move(state, record)
+
+    # Assert
+    assert not state.is_game_over
+    assert last_piece.state == PieceState.HOME_COLUMN
+    assert last_piece.position == 56
+
+
+def test_undo_sequence_in_reverse_order():
+    """Tests that a long sequence of moves unwinds back to the initial state."""
+    rng = random.Random(3)
+    state = GameState(players=[Player(color=c, role="random") for c in PlayerColor])
+    original = copy.deepcopy(state)
+    records = []
+    for _ in range(400):
+        if state.is_game_over:
+            break
+        roll = rng.randint(1, 6)
+        moves = Rules.get_legal_moves(state, roll)
+        if moves:
+            records.append(move_piece(state, rng.choice(moves)[0], roll))
+        state.current_player_index = (state.current_player_index + 1) % 4
+
+    for record in reversed(records):
+        undo_move(state, record)
+
+    state.current_player_index = original.current_player_index
+    assert state == original
+    assert state.occupancy == Occupancy.from_players(state.players)
+
+
+def test_predict_move_matches_move_piece():
+    """
+    Tests that predict_move reports exactly what move_piece then does, and
+    leaves the game state untouched while doing so.
+    """
+    rng = random.Random(11)
+    state = GameState(players=[Player(color=c, role="random") for c in PlayerColor])
+    while not state.is_game_over:
+        roll = rng.randint(1, 6)
+        moves = Rules.get_legal_moves(state, roll)
+        if moves:
+            piece = rng.choice(moves)[0]
+            before = copy.deepcopy(state)
+            prediction = predict_move(state, piece, roll)
+            assert state == before
+
+            record = move_piece(state, piece, roll)
+            assert (prediction.position, prediction.state) == (piece.position, piece.state)
+            assert prediction.captured == record.captured
+            assert prediction.ends_game == state.is_game_over
+        if roll != 6:
+            state.current_player_index = (state.current_player_index + 1) % 4
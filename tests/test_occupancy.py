@@ -0,0 +1,83 @@
+"""
+Tests for the square occupancy index.
+"""
+
+import random
+
+from ludo.compact import CompactState
+from ludo.move import move_piece
+from ludo.occupancy import Occupancy
+from ludo.player import Player
+from ludo.rules import Rules
+from ludo.state import GameState
+from ludo.utils.constants import PieceState, PlayerColor
+
+
+def test_counts_blocks_and_opponents():
+    """Tests the basic counting, block and opponent queries."""
+    occupancy = Occupancy()
+    occupancy.add(5, PlayerColor.GREEN)
+    assert occupancy.count(5, PlayerColor.GREEN) == 1
+    assert occupancy.has_opponents(5, PlayerColor.RED)
+    assert not occupancy.has_opponents(5, PlayerColor.GREEN)
+    assert not occupancy.is_blocked(5, PlayerColor.RED)
+
+    occupancy.add(5, PlayerColor.GREEN)
+    assert occupancy.is_blocked(5, PlayerColor.RED)
+    assert not occupancy.is_blocked(5, PlayerColor.GREEN)  # Own blocks never block
+
+    occupancy.remove(5, PlayerColor.GREEN)
+    assert not occupancy.is_blocked(5, PlayerColor.RED)
+
+
+def test_index_is_built_lazily_from_pieces():
+    """Tests that the index reflects pieces placed before its first use."""
+    red = Player(color=PlayerColor.RED, role="human")
+    green = Player(color=PlayerColor.GREEN, role="human")
+    for piece in green.pieces[:2]:
+        piece.state = PieceState.TRACK
+        piece.position = 3
+    state = GameState(players=[red, green])
+    assert state.occupancy.is_blocked(3, PlayerColor.RED)
+
+    green.pieces[1].position = 4
+    state.invalidate_occupancy()
+    assert not state.occupancy.is_blocked(3, PlayerColor.RED)
+
+
+def test_move_piece_keeps_index_in_sync():
+    """
+    Tests that the incrementally maintained index always matches one rebuilt
+    from scratch while random moves, captures and home entries are applied.
+    """
+    rng = random.Random(7)
+    for state in (
+        GameState(players=[Player(color=c, role="random") for c in PlayerColor]),
+        CompactState.from_game_state(
+            GameState(players=[Player(color=c, role="random") for c in PlayerColor])
+        ),
+    ):
+        for _ in range(2000):
+            if state.is_game_over:
+                break
+            roll = rng.randint(1, 6)
+            moves = Rules.get_legal_moves(state, roll)
+            if moves:
+                piece, _ = rng.choice(moves)
+                move_piece(state, piece, roll)
+                assert state.occupancy == Occupancy.from_players(state.players)
+            if roll != 6:
+                state.current_player_index = (state.current_player_index + 1) % 4
+
+
+def test_opponent_blocks_mask():
+    """Tests the bitmask of squares blocked for a color."""
+    occupancy = Occupancy()
+    for _ in range(2):
+        occupancy.add(3, PlayerColor.GREEN)
+        occupancy.add(9, PlayerColor.RED)
+    assert occupancy.opponent_blocks(PlayerColor.RED) == 1 << 3
+    assert occupancy.opponent_blocks(PlayerColor.BLUE) == (1 << 3) | (1 << 9)
+    occupancy.remove(3, PlayerColor.GREEN)
+    assert occupancy.opponent_blocks(PlayerColor.RED) == 0
+    assert occupancy.copy().opponent_blocks(PlayerColor.BLUE) == 1 << 9
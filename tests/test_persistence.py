@@ -3,14 +3,17 @@ Tests for game state persistence.
 """
 
 import json
+from dataclasses import asdict
 from pathlib import Path
 import pytest
 
 from ludo.bots.human_bot import HumanBot
 from ludo.dice import Dice
 from ludo.game import Game
-from ludo.persistence import load_game, save_game
+from ludo.persistence import LOAD_CHUNK_SIZE, load_game, load_games, save_game, state_from_dict
 from ludo.player import Player
+from ludo.simulation import create_game
+from ludo.state import GameState
 from ludo.utils.constants import PieceState, PlayerColor
 
 
@@ -118,3 +121,42 @@ def test_load_game_with_schema_version_mismatch(tmp_path: Path):
     # 2. Assert that loading this file raises a ValueError
     with pytest.raises(ValueError, match="Schema version mismatch"):
         load_game(save_file)
+
+
+def test_state_from_dict_matches_dataclass_path():
+    """
+    Tests that the direct decoder builds the same state as going through
+    GameData and GameState.from_serializable.
+    """
+    game = create_game(["greedy", "random", "greedy"], seed=9)
+    for _ in range(80):
+        game.take_turn()
+    data = json.loads(json.dumps(asdict(game.state.to_serializable())))
+    assert state_from_dict(data) == GameState.from_serializable(game.state.to_serializable())
+    assert state_from_dict(data) == game.state
+
+    data["schema_version"] = "0.1-alpha"
+    with pytest.raises(ValueError, match="Schema version mismatch"):
+        state_from_dict(data)
+
+
+def test_load_games_in_order(tmp_path: Path):
+    """
+    Tests that bulk loading returns the states in the order of the paths,
+    for JSON and binary saves alike.
+    """
+    paths = []
+    states = []
+    for i in range(LOAD_CHUNK_SIZE + 5):
+        players = [Player(color=PlayerColor.RED, role="human")]
+        game = Game(players=players, strategies=[HumanBot()], dice=Dice(seed=i))
+        game.state.consecutive_sixes = i % 3
+        path = tmp_path / (f"game{i}.ludo" if i % 2 else f"game{i}.json")
+        save_game(game.state, path)
+        paths.append(path)
+        states.append(game.state)
+
+    assert load_games(paths, max_workers=4) == states
+    assert load_games([]) == []
+    with pytest.raises(FileNotFoundError):
+        load_games(paths + [tmp_path / "missing.json"])
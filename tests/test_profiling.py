@@ -0,0 +1,85 @@
+"""
+Tests for turn phase profiling.
+"""
+
+import json
+import random
+
+import pytest
+
+from ludo.profiling import ALL_PLAYERS, PHASES, Histogram, TurnProfiler
+from ludo.simulation import create_game, play_game
+
+
+def test_histogram_percentiles_are_close():
+    """Tests that percentiles stay within the bucket resolution of the exact values."""
+    rng = random.Random(0)
+    values = sorted(rng.randint(0, 5_000_000) for _ in range(10_000))
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+    assert histogram.count == len(values)
+    assert (histogram.min, histogram.max) == (values[0], values[-1])
+    assert histogram.mean == pytest.approx(sum(values) / len(values))
+    for percent in (1, 50, 90, 99):
+        exact = values[int(percent / 100 * len(values)) - 1]
+        assert exact <= histogram.percentile(percent) <= exact * 1.04
+    assert histogram.percentile(100) == values[-1]
+
+
+def test_histogram_small_values_are_exact_and_merge():
+    """Tests exact small buckets, merging and the empty histogram."""
+    first, second = Histogram(), Histogram()
+    for value in (1, 2, 3):
+        first.record(value)
+    second.record(40)
+    first.merge(second)
+    first.merge(Histogram())
+    assert first.percentile(50) == 2
+    assert first.percentile(100) == 40
+    assert (first.count, first.total, first.min) == (4, 46, 1)
+    assert Histogram().summary()["p99"] == 0
+    with pytest.raises(ValueError):
+        first.percentile(101)
+
+
+def test_profiled_games_time_every_phase_per_player():
+    """Tests that a profiled game plays identically and times all phases per player."""
+    profiler = TurnProfiler()
+    plain = play_game(["random", "greedy"], seed=3)
+    profiled = play_game(["random", "greedy"], seed=3, profiler=profiler)
+    assert profiled == plain
+
+    summary = profiler.summary()
+    assert set(summary) == {"RED/random", "GREEN/greedy", ALL_PLAYERS}
+    total = summary[ALL_PLAYERS]
+    assert total["roll"]["count"] == plain.turns
+    assert total["legal_moves"]["count"] == plain.turns
+    assert total["decision"]["count"] == total["apply"]["count"] == total["win_check"]["count"]
+    assert 0 < total["decision"]["count"] < plain.turns
+    for label in ("RED/random", "GREEN/greedy"):
+        assert set(summary[label]) == set(PHASES)
+        assert summary[label]["decision"]["p50"] <= summary[label]["decision"]["max"]
+
+
+def test_profiler_dumps_json(tmp_path):
+    """Tests the JSON dump and the text table."""
+    profiler = TurnProfiler()
+    game = create_game(["greedy", "greedy"], seed=1, profiler=profiler)
+    for _ in range(20):
+        game.take_turn()
+    path = tmp_path / "phases.json"
+    profiler.dump(path)
+    data = json.loads(path.read_text())
+    assert data == json.loads(profiler.to_json())
+    assert data[ALL_PLAYERS]["roll"]["count"] == 20
+    assert "legal_moves" in profiler.format_table()
+    profiler.reset()
+    assert profiler.histograms == {}
+
+
+def test_games_run_uninstrumented_by_default():
+    """Tests that a game without a profiler takes the plain path."""
+    game = create_game(["random", "random"], seed=2)
+    assert game.profiler is None
+    game.take_turn()
@@ -0,0 +1,69 @@
+"""
+Tests for streamed game records.
+"""
+
+import gzip
+import types
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ludo.records import (
+    GameRecord,
+    RecordWriter,
+    export_games,
+    play_recorded_game,
+    read_records,
+)
+from ludo.simulation import play_game
+
+
+def test_recorded_game_matches_play_game():
+    """Tests that a recorded game is the same game `play_game` plays."""
+    record = play_recorded_game(["random", "greedy", "greedy"], seed=11)
+    assert record.to_result() == play_game(["random", "greedy", "greedy"], seed=11)
+    assert record.finish_order[0] == record.winner
+    assert sorted(record.finish_order) == [0, 1, 2]
+    assert len(record.captures) == 3 and sum(record.captures) > 0
+
+
+@pytest.mark.parametrize("filename", ["games.jsonl", "games.jsonl.gz"])
+def test_export_and_read_back(tmp_path: Path, filename: str):
+    """Tests that exported records read back lazily and in order."""
+    path = tmp_path / filename
+    result = export_games(["greedy", "random"], 12, path, seed=100)
+    assert result.games == 12
+
+    lazy = read_records(path)
+    assert isinstance(lazy, types.GeneratorType)
+    records: List[GameRecord] = list(lazy)
+    assert [record.seed for record in records] == list(range(100, 112))
+    assert records[3] == play_recorded_game(["greedy", "random"], seed=103)
+    assert sum(record.winner == 0 for record in records) == result.wins[0]
+    with open(path, "rb") as f:
+        assert (f.read(2) == b"\x1f\x8b") == filename.endswith(".gz")
+
+
+def test_writer_appends_and_compresses_on_request(tmp_path: Path):
+    """Tests the append and compress options of the writer."""
+    path = tmp_path / "games.log"
+    record = GameRecord(1, ["random"], 0, 40, [0], [0])
+    with RecordWriter(path, compress=True, max_pending=1) as writer:
+        writer.write(record)
+    with RecordWriter(path, compress=True, append=True) as writer:
+        writer.write(record)
+        writer.write(record)
+    assert writer.written == 2
+    assert gzip.open(path, "rt").read().count("\n") == 3
+    assert list(read_records(path)) == [record] * 3
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.write(record)
+
+
+def test_writer_reports_write_errors(tmp_path: Path):
+    """Tests that a failure in the writer thread surfaces on close."""
+    writer = RecordWriter(tmp_path / "games.jsonl")
+    writer.write(GameRecord(1, ["random"], 0, 40, [0], [object()]))  # type: ignore[list-item]
+    with pytest.raises(RuntimeError, match="failed"):
+        writer.close()
@@ -0,0 +1,80 @@
+"""
+Tests for deterministic game replay.
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from ludo.binary_format import encode_state
+from ludo.events import MultiSink
+from ludo.journal import GameJournal, TurnRecord
+from ludo.replay import Replay, TurnLog
+from ludo.simulation import create_game
+
+ROLES = ["greedy", "random", "random", "greedy"]
+
+
+def _recorded_game(seed: int = 8):
+    """Plays a seeded game, returning it, its turn log and its state after every turn."""
+    game = create_game(ROLES, seed=seed)
+    log = TurnLog(game.state.players)
+    game.events = log
+    states = [encode_state(game.state)]
+    while not game.state.is_game_over:
+        game.take_turn()
+        states.append(encode_state(game.state))
+    return game, log, states
+
+
+def test_seek_reaches_every_turn_in_any_order():
+    """Tests that random access gives the recorded state of each turn."""
+    game, log, states = _recorded_game()
+    replay = Replay.from_seed(8, ROLES, log.turns, checkpoint_every=16)
+    assert len(replay) == len(states) - 1
+
+    turns = list(range(len(states)))
+    random.Random(0).shuffle(turns)
+    for turn in turns:
+        assert encode_state(replay.state_at(turn)) == states[turn]
+    assert replay.final_state() == game.state
+
+
+def test_states_iterates_from_any_turn():
+    """Tests that iterating the states matches the recorded states."""
+    _, log, states = _recorded_game(seed=2)
+    replay = Replay.from_seed(2, ROLES, log.turns, checkpoint_every=5)
+    replayed = [encode_state(state) for state in replay.states(start=7, stop=40)]
+    assert replayed == states[7:41]
+
+
+def test_replay_from_journal(tmp_path: Path):
+    """Tests that a journaled game replays to the same states."""
+    path = tmp_path / "game.journal"
+    game = create_game(ROLES, seed=3)
+    log = TurnLog(game.state.players)
+    states = [encode_state(game.state)]
+    with GameJournal(path, game.state, snapshot_every=50) as journal:
+        game.events = MultiSink(log, journal)
+        while not game.state.is_game_over:
+            game.take_turn()
+            states.append(encode_state(game.state))
+
+    replay = Replay.from_journal(path)
+    assert replay.turns == log.turns
+    assert encode_state(replay.state_at(len(replay) // 2)) == states[len(replay) // 2]
+    assert encode_state(replay.final_state()) == states[-1]
+
+
+def test_replay_rejects_bad_turns_and_turn_numbers():
+    """Tests that a corrupt log and out-of-range turns are reported."""
+    _, log, _ = _recorded_game(seed=5)
+    turns = list(log.turns)
+    turns[10] = TurnRecord(turns[10].seat, turns[10].roll, 3, turns[10].next_seat)
+    replay = Replay.from_seed(5, ROLES, turns)
+    replay.state_at(10)
+    with pytest.raises(ValueError, match="Turn 11 does not replay"):
+        replay.state_at(11)
+    with pytest.raises(IndexError):
+        replay.state_at(len(turns) + 1)
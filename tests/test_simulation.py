@@ -0,0 +1,97 @@
+"""
+Tests for the headless simulation runner.
+"""
+
+import sys
+
+import pytest
+
+from apps.sim.main import main
+from ludo.bots.expectiminimax_bot import ExpectiminimaxBot
+from ludo.bots.greedy_bot import GreedyBot
+from ludo.bots.mcts_bot import MCTSBot
+from ludo.bots.registry import create_strategy
+from ludo.simulation import create_game, play_game, run_simulations
+
+
+def test_create_strategy():
+    """Tests that registered strategies are created by name."""
+    assert isinstance(create_strategy("greedy"), GreedyBot)
+    with pytest.raises(ValueError, match="Unknown strategy: minimax"):
+        create_strategy("minimax")
+
+
+def test_searching_bots_use_the_game_rules():
+    """Tests that a game's rule flags reach the bots that search ahead."""
+    game = create_game(["mcts", "expectiminimax"], seed=1, use_blocking_rule=False)
+    mcts, expectiminimax = game.strategies
+    assert isinstance(mcts, MCTSBot) and isinstance(expectiminimax, ExpectiminimaxBot)
+    for bot in (mcts, expectiminimax):
+        assert bot.use_blocking_rule is False and bot.three_six_forfeit is True
+
+
+def test_play_game_runs_to_completion():
+    """Tests that a seeded game is played to the end without any input."""
+    result = play_game(["random", "greedy"], seed=3)
+    assert result.winner in (0, 1)
+    assert result.turns > 0
+    assert result.strategies == ["random", "greedy"]
+
+
+def test_play_game_is_reproducible():
+    """Tests that the same seed always produces the same game."""
+    assert play_game(["random", "random", "greedy"], seed=5) == play_game(
+        ["random", "random", "greedy"], seed=5
+    )
+
+
+def test_interleaved_games_are_reproducible():
+    """
+    Tests that stepping two seeded games alternately gives the same results as
+    playing each one on its own.
+    """
+    lineup = ["random", "random", "greedy"]
+    games = [create_game(lineup, seed=seed) for seed in (11, 12)]
+    while not all(game.state.is_game_over for game in games):
+        for game in games:
+            if not game.state.is_game_over:
+                game.play_turn(game.dice.roll())
+
+    for seed, game in zip((11, 12), games, strict=True):
+        expected = play_game(lineup, seed=seed)
+        assert game.state.current_player_index == expected.winner
+
+
+def test_play_game_respects_max_turns():
+    """Tests that a game is abandoned after the turn limit."""
+    result = play_game(["random", "random"], seed=1, max_turns=10)
+    assert result.winner is None
+    assert result.turns == 10
+
+
+def test_play_game_rejects_too_many_players():
+    """Tests that more players than colors are rejected."""
+    with pytest.raises(ValueError, match="between 1 and 4 players"):
+        play_game(["random"] * 5)
+
+
+def test_run_simulations_aggregates_results():
+    """Tests that wins, turns and rates are aggregated over all games."""
+    result = run_simulations(["random", "greedy"], num_games=5, seed=10)
+    assert result.games == 5
+    assert sum(result.wins) + result.unfinished == 5
+    assert sum(result.win_rates) == pytest.approx(1.0)
+    assert result.average_turns > 0
+    assert result.games_per_second > 0
+
+
+def test_sim_cli_prints_report(monkeypatch, capsys):
+    """Tests the ludo-sim entry point end to end."""
+    monkeypatch.setattr(
+        sys, "argv", ["ludo-sim", "--players", "random", "greedy", "--games", "3", "--seed", "1"]
+    )
+    main()
+    out = capsys.readouterr().out
+    assert "Games played:    3" in out
+    assert "Base seed:       1" in out
+    assert "Seat 1 (greedy)" in out
@@ -0,0 +1,81 @@
+"""
+Tests for canonical position keys.
+"""
+
+import random
+
+from ludo.compact import CompactState
+from ludo.move import move_piece
+from ludo.player import Player
+from ludo.rules import Rules
+from ludo.state import GameState
+from ludo.state_key import state_key, unpack_state_key
+from ludo.utils.constants import PieceState, PlayerColor
+
+
+def _state() -> GameState:
+    return GameState(
+        players=[
+            Player(color=PlayerColor.RED, role="random"),
+            Player(color=PlayerColor.YELLOW, role="random"),
+        ]
+    )
+
+
+def _place(state: GameState, seat: int, piece_id: int, position: int) -> None:
+    piece = state.players[seat].pieces[piece_id]
+    piece.state = PieceState.TRACK
+    piece.position = position
+
+
+def test_interchangeable_pieces_share_a_key():
+    """Tests that swapping which piece of a color stands where keeps the key."""
+    first, second = _state(), _state()
+    _place(first, 0, 0, 5)
+    _place(first, 0, 2, 17)
+    _place(second, 0, 3, 17)
+    _place(second, 0, 1, 5)
+    assert state_key(first) == state_key(second)
+
+    _place(second, 1, 0, 5)  # The same squares for another color is a different position
+    assert state_key(first) != state_key(second)
+
+
+def test_key_covers_turn_sixes_and_colors():
+    """Tests that the player to move, the sixes and the seat colors all change the key."""
+    state = _state()
+    key = state_key(state)
+    state.current_player_index = 1
+    assert state_key(state) != key
+    state.current_player_index = 0
+    state.consecutive_sixes = 1
+    assert state_key(state) != key
+    state.consecutive_sixes = 0
+    state.dice_roll = 4  # The roll is not part of the position
+    assert state_key(state) == key
+
+    swapped = GameState(players=list(reversed(state.players)))
+    assert state_key(swapped) != key
+    assert state_key(GameState(players=state.players[:1])) != key
+
+
+def test_compact_state_key_matches_and_round_trips():
+    """Tests that both state types agree along a random game and keys unpack correctly."""
+    rng = random.Random(3)
+    state = GameState(players=[Player(color=c, role="random") for c in PlayerColor])
+    for _ in range(300):
+        roll = rng.randint(1, 6)
+        moves = Rules.get_legal_moves(state, roll)
+        if moves:
+            move_piece(state, rng.choice(moves)[0], roll)
+        state.current_player_index = (state.current_player_index + 1) % 4
+        state.consecutive_sixes = rng.randint(0, 5)
+
+        key = state_key(state)
+        assert state_key(CompactState.from_game_state(state)) == key
+        seats, current, sixes = unpack_state_key(key)
+        assert seats == [
+            (p.color, tuple(sorted(piece.position for piece in p.pieces))) for p in state.players
+        ]
+        assert current == state.current_player_index
+        assert sixes == min(state.consecutive_sixes, 3)
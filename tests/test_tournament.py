@@ -0,0 +1,41 @@
+"""
+Tests for the multi-process tournament runner.
+"""
+
+import pytest
+
+from ludo.tournament import run_tournament, seat_order, wilson_interval
+
+
+def test_results_do_not_depend_on_worker_count():
+    """Tests that the merged result is identical for any number of workers and chunks."""
+    serial = run_tournament(["random", "greedy"], 12, seed=7, workers=1)
+    parallel = run_tournament(["random", "greedy"], 12, seed=7, workers=2, chunk_size=5)
+    assert serial.seat_wins == parallel.seat_wins
+    assert serial.strategy_wins == parallel.strategy_wins
+    assert serial.total_turns == parallel.total_turns
+    assert parallel.games == 12
+    assert parallel.workers == 2
+
+
+def test_rotate_seats():
+    """Tests that rotation moves every strategy through every seat."""
+    assert seat_order(["a", "b", "c"], 0, rotate_seats=True) == ["a", "b", "c"]
+    assert seat_order(["a", "b", "c"], 1, rotate_seats=True) == ["b", "c", "a"]
+    assert seat_order(["a", "b", "c"], 1, rotate_seats=False) == ["a", "b", "c"]
+
+    result = run_tournament(["random", "greedy"], 6, seed=1, workers=1, rotate_seats=True)
+    assert result.strategy_games == {"random": 6, "greedy": 6}
+    assert sum(result.strategy_wins.values()) + result.unfinished == 6
+    assert sum(result.seat_wins) == sum(result.strategy_wins.values())
+
+
+def test_wilson_interval():
+    """Tests the Wilson score interval against known values."""
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    low, high = wilson_interval(50, 100)
+    assert low == pytest.approx(0.4038, abs=1e-4)
+    assert high == pytest.approx(0.5962, abs=1e-4)
+    low, high = wilson_interval(10, 10)
+    assert high == 1.0
+    assert 0.7 < low < 0.75
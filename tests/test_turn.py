@@ -0,0 +1,69 @@
+"""
+Tests for the shared turn sequencing functions.
+"""
+
+from ludo.compact import CompactState
+from ludo.player import Player
+from ludo.state import GameState
+from ludo.turn import begin_turn, finish_turn, next_player, play_turn
+from ludo.utils.constants import PieceState, PlayerColor
+
+
+def _state() -> GameState:
+    return GameState(
+        players=[
+            Player(color=PlayerColor.RED, role="random"),
+            Player(color=PlayerColor.GREEN, role="random"),
+        ]
+    )
+
+
+def _first_move(legal_moves, game_state):
+    return legal_moves[0]
+
+
+def test_next_player_wraps_and_resets_sixes():
+    """Tests that passing the turn wraps around and clears the sixes count."""
+    state = _state()
+    state.current_player_index = 1
+    state.consecutive_sixes = 2
+    next_player(state)
+    assert state.current_player_index == 0
+    assert state.consecutive_sixes == 0
+
+
+def test_begin_turn_settles_turns_without_moves():
+    """Tests the forfeit and no-move outcomes of begin_turn."""
+    state = _state()
+    assert begin_turn(state, 5) == []  # Nothing can leave the yard
+    assert state.current_player_index == 1
+
+    state.consecutive_sixes = 2
+    assert begin_turn(state, 6) == []  # Third six forfeits the turn
+    assert state.current_player_index == 0
+
+    state.consecutive_sixes = 2
+    assert begin_turn(state, 6, three_six_forfeit=False) != []
+    assert state.consecutive_sixes == 3
+
+
+def test_finish_turn_keeps_the_turn_on_a_six():
+    """Tests that a move with a 6 keeps the turn and any other roll passes it."""
+    state = _state()
+    (piece, _), *_ = begin_turn(state, 6)
+    finish_turn(state, piece, 6)
+    assert state.current_player_index == 0
+    assert piece.state == PieceState.TRACK
+
+    moves = begin_turn(state, 4)
+    finish_turn(state, moves[0][0], 4)
+    assert state.current_player_index == 1
+
+
+def test_play_turn_matches_on_compact_state():
+    """Tests that a turn played on a CompactState matches the same turn on a GameState."""
+    state = _state()
+    compact = CompactState.from_game_state(state)
+    for roll in (6, 3, 6, 6, 2, 5):
+        assert play_turn(state, roll, _first_move) == play_turn(compact, roll, _first_move)
+        assert compact.to_game_state() == state
@@ -0,0 +1,87 @@
+"""
+Tests for Zobrist hashing of positions.
+"""
+
+import random
+
+from ludo.compact import CompactState
+from ludo.move import move_piece, undo_move
+from ludo.player import Player
+from ludo.rules import Rules
+from ludo.state import GameState
+from ludo.utils.constants import PieceState, PlayerColor
+from ludo.zobrist import hash_pieces, position_key
+
+
+def _four_players() -> GameState:
+    return GameState(players=[Player(color=c, role="random") for c in PlayerColor])
+
+
+def test_move_and_undo_keep_hash_in_sync():
+    """
+    Tests that the incrementally maintained hash matches one computed from
+    scratch after random moves and captures, and that undoing every move
+    restores the starting hash.
+    """
+    rng = random.Random(11)
+    for state in (_four_players(), CompactState.from_game_state(_four_players())):
+        start = state.zobrist
+        records = []
+        captures = 0
+        for _ in range(1500):
+            if state.is_game_over:
+                break
+            roll = rng.randint(1, 6)
+            moves = Rules.get_legal_moves(state, roll)
+            if moves:
+                piece, _ = rng.choice(moves)
+                records.append(move_piece(state, piece, roll))
+                captures += len(records[-1].captured)
+                assert state.zobrist == hash_pieces(state.players)
+            if roll != 6:
+                state.current_player_index = (state.current_player_index + 1) % 4
+        assert captures > 0
+
+        for record in reversed(records):
+            undo_move(state, record)
+        assert state.zobrist == start
+
+
+def test_position_key_includes_turn_and_sixes():
+    """Tests that the same pieces with a different player or sixes count hash differently."""
+    state = _four_players()
+    key = position_key(state)
+    state.current_player_index = 1
+    assert position_key(state) != key
+    state.current_player_index = 0
+    state.consecutive_sixes = 2
+    assert position_key(state) != key
+    state.consecutive_sixes = 0
+    assert position_key(state) == key
+
+
+def test_hash_is_invalidated_and_copied():
+    """Tests invalidation after direct edits and that CompactState copies keep the hash."""
+    state = _four_players()
+    before = state.zobrist
+    piece = state.players[0].pieces[0]
+    piece.state = PieceState.TRACK
+    piece.position = 0
+    state.invalidate_zobrist()
+    assert state.zobrist != before
+    assert state.zobrist == hash_pieces(state.players)
+
+    compact = CompactState.from_game_state(state)
+    assert compact.zobrist == state.zobrist
+    assert compact.copy().zobrist == compact.zobrist
+
+
+def test_toggle_waits_for_the_hash():
+    """Tests that toggling a key does nothing until the hash has been computed."""
+    for state in (_four_players(), CompactState.from_game_state(_four_players())):
+        state.toggle_zobrist(12345)
+        assert not state.has_zobrist
+        start = state.zobrist
+        assert state.has_zobrist
+        state.toggle_zobrist(12345)
+        assert state.zobrist == start ^ 12345